@@ -1,8 +1,12 @@
 # app/api/chat.py
+import json
+from typing import Any, AsyncIterator, Dict
+
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 from app.models.chat import ChatRequest, ChatResponse
 
-from app.services.chat_service import generate_chat_reply, ChatResult
+from app.services.chat_service import generate_chat_reply, stream_chat_reply, response_cache, ChatResult
 
 router = APIRouter()
 
@@ -12,8 +16,42 @@ async def chat(payload: ChatRequest):
     result: ChatResult = await generate_chat_reply(
         username=payload.username,
         message=payload.message,
+        bypass_cache=payload.bypass_cache,
     )
     return ChatResponse(
         reply=result.reply,
         related_event_ids=result.related_event_ids,
+        response_cache=result.response_cache,
     )
+
+
+def _sse(event: Dict[str, Any]) -> str:
+    data = json.dumps(event["data"], ensure_ascii=False)
+    return f"event: {event['event']}\ndata: {data}\n\n"
+
+
+@router.post("/chat/stream")
+async def chat_stream(payload: ChatRequest):
+    """
+    Server-Sent Events로 응답을 스트리밍한다.
+    progress(노드 진행) -> token(답변 토큰) -> done(reply, related_event_ids) 순서로 전송된다.
+    """
+    async def events() -> AsyncIterator[str]:
+        async for event in stream_chat_reply(
+            username=payload.username, message=payload.message, bypass_cache=payload.bypass_cache,
+        ):
+            yield _sse(event)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/chat/cache/stats")
+async def chat_cache_stats():
+    """
+    답변 semantic 캐시 적중률 / 우회(bypass) 사유별 횟수
+    """
+    return response_cache.stats()
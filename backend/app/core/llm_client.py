@@ -1,6 +1,6 @@
 import os
 from langchain_upstage import ChatUpstage
-from app.services.embedding_service import EmbeddingService 
+from app.services.embedding_service import get_embedding_service
 
 class ChatbotClient:
     def __init__(self, model: str):
@@ -12,7 +12,7 @@ class ChatbotClient:
         
         # EmbeddingService 초기화 시 에러가 발생하면 여기서 처리
         try:
-            self.embedding_service = EmbeddingService()
+            self.embedding_service = get_embedding_service()
         except ValueError as e:
             # EmbeddingService 초기화 실패는 치명적이므로 다시 발생
             raise RuntimeError(f"EmbeddingService 초기화 실패: {e}") from e
@@ -0,0 +1,53 @@
+# backend/app/core/rate_limiter.py
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """
+    외부 API 호출용 비동기 rate limiter.
+    - 토큰 버킷: 초당 rate_per_second개씩 채워지고 최대 burst개까지 쌓인다. (requests/sec 제한)
+    - 세마포어: 동시에 진행 중인 요청 수를 max_concurrency로 제한한다.
+
+    사용법:
+        async with limiter:
+            await client.post(...)
+
+    asyncio 기본 객체를 사용하므로 하나의 이벤트 루프 안에서만 공유해야 한다.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int, max_concurrency: int):
+        self.rate_per_second = rate_per_second
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._in_flight = asyncio.Semaphore(max(1, max_concurrency))
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second)
+        self._updated_at = now
+
+    async def acquire_token(self) -> None:
+        if self.rate_per_second <= 0:
+            return
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate_per_second)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self._in_flight.acquire()
+        try:
+            await self.acquire_token()
+        except BaseException:
+            self._in_flight.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._in_flight.release()
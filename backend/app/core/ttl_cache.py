@@ -0,0 +1,83 @@
+# backend/app/core/ttl_cache.py
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Iterable, Optional, TypeVar
+import threading
+import time
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    프로세스 내 LRU + TTL 캐시.
+    - max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 제거한다.
+    - ttl_seconds가 지난 항목은 조회 시 만료로 처리한다. (0 이하면 만료 없음)
+    - 스레드 간에 공유해도 안전하도록 lock으로 보호한다.
+
+    hits / misses 외에 saved_seconds(적중으로 아낀 시간 추정치)를 함께 기록한다.
+    미스 때 실제로 걸린 시간을 record_miss_latency로 알려주면 그 평균을 적중 1회당 절약 시간으로 본다.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self._miss_seconds = 0.0
+        self._miss_samples = 0
+        self.saved_seconds = 0.0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                stored_at, value = item
+                if self.ttl_seconds <= 0 or now - stored_at < self.ttl_seconds:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    if self._miss_samples:
+                        self.saved_seconds += self._miss_seconds / self._miss_samples
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: Hashable, value: V) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def record_miss_latency(self, seconds: float) -> None:
+        with self._lock:
+            self._miss_seconds += seconds
+            self._miss_samples += 1
+
+    def delete_many(self, keys: Iterable[Hashable]) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "avg_miss_ms": round(self._miss_seconds / self._miss_samples * 1000, 1) if self._miss_samples else 0.0,
+                "saved_seconds": round(self.saved_seconds, 3),
+            }
@@ -1,5 +1,6 @@
 # backend/app/db/database.py
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from app.core.config import settings
@@ -13,5 +14,42 @@ engine = create_engine(
 # 세션 관리 객체
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def _async_database_url(url: str) -> str:
+    """
+    DATABASE_URL(postgresql:// 또는 postgresql+psycopg2://)의 드라이버를 asyncpg로 바꾼다
+    """
+    scheme, _, rest = url.partition("://")
+    if scheme.split("+")[0] in ("postgresql", "postgres"):
+        return f"postgresql+asyncpg://{rest}"
+    return url
+
+
+# 비동기 DB 엔진 (챗봇 그래프 / 스트리밍 API용). 수집/임베딩 워커와 일반 API는 위의 동기 엔진을 그대로 사용한다.
+async_engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
+    pool_pre_ping=True,
+    pool_size=settings.ASYNC_DB_POOL_SIZE,
+    max_overflow=settings.ASYNC_DB_MAX_OVERFLOW,
+)
+
+# 커밋 후에도 객체 속성을 그대로 읽을 수 있도록 expire_on_commit=False (비동기 세션은 lazy load 불가)
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+
+async def _set_vector_codec(conn) -> None:
+    # pgvector.sqlalchemy.Vector는 '[1,2,3]' 문자열로 주고받으므로 asyncpg에도 text 형식으로 등록한다
+    try:
+        await conn.set_type_codec("vector", encoder=str, decoder=str, format="text")
+    except ValueError:
+        # vector 확장이 아직 설치되지 않은 DB (init_db에서 생성)
+        pass
+
+
+@event.listens_for(async_engine.sync_engine, "connect")
+def _register_vector_codec(dbapi_connection, connection_record) -> None:
+    dbapi_connection.run_async(_set_vector_codec)
+
+
 # ORM 모델의 베이스 클래스
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
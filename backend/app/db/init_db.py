@@ -5,9 +5,26 @@ from app.entity.user_entity import User
 from app.entity.seoul_event_like_entity import SeoulEventLike
 from app.entity.conversation_entity import Conversation
 from app.entity.message_entity import Message
+from app.entity.sync_checkpoint_entity import SyncCheckpoint
+from app.entity.embedding_cache_entity import EmbeddingCache
+from app.db.vector_index import ensure_vector_index
 from datetime import date
 from sqlalchemy import text
 
+# create_all은 이미 존재하는 테이블에 컬럼/인덱스를 추가하지 않으므로, 이후 추가된 스키마는 여기서 보정한다.
+SCHEMA_PATCHES = [
+    "ALTER TABLE seoul_events ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);",
+    "ALTER TABLE seoul_events ADD COLUMN IF NOT EXISTS embedding_claimed_at TIMESTAMP;",
+    "ALTER TABLE seoul_events ADD COLUMN IF NOT EXISTS embedding_attempts INTEGER NOT NULL DEFAULT 0;",
+    # 임베딩 워커가 선점할 대상(embedding IS NULL)만 담는 부분 인덱스
+    "CREATE INDEX IF NOT EXISTS ix_seoul_events_embedding_pending ON seoul_events (id) WHERE embedding IS NULL;",
+    "ALTER TABLE seoul_events ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP;",
+    "CREATE INDEX IF NOT EXISTS ix_seoul_events_updated_at ON seoul_events (updated_at);",
+    # 채팅 턴마다 실행되는 대화 컨텍스트 조회(한 번의 쿼리)용 인덱스
+    "CREATE INDEX IF NOT EXISTS ix_messages_conversation_role_turn ON messages (conversation_id, role, turn DESC);",
+    "CREATE INDEX IF NOT EXISTS ix_conversations_username_updated_at ON conversations (username, updated_at DESC);",
+]
+
 def init_db():
     db = SessionLocal()
     try:
@@ -16,6 +33,13 @@ def init_db():
         print("✅ pgvector 확장 활성화 완료.")
         
         Base.metadata.create_all(bind=engine)
+
+        for patch in SCHEMA_PATCHES:
+            db.execute(text(patch))
+        db.commit()
+
+        # 벡터 검색용 ANN 인덱스 (VECTOR_INDEX_TYPE)
+        ensure_vector_index(db)
         
         print("✅ DB 스키마 초기화 완료.")
         
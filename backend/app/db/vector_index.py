@@ -0,0 +1,346 @@
+# backend/app/db/vector_index.py
+"""
+seoul_events.embedding 용 ANN(근사 최근접) 인덱스 관리.
+
+pgvector 인덱스는 차원 수에 제한이 있어 EMBEDDING_DIMENSION에 따라 인덱싱할 표현을 고른다.
+  - 2000차원 이하: vector 그대로 (vector_l2_ops)
+  - 4000차원 이하: halfvec으로 캐스팅한 식 인덱스 (halfvec_l2_ops)
+  - 그 이상 (Solar 임베딩 4096차원 등): binary_quantize 비트 벡터 인덱스 (bit_hamming_ops)
+    -> 해밍 거리로 후보를 top_k * VECTOR_BINARY_RERANK_FACTOR개 고른 뒤 원본 벡터의 L2 거리로 재정렬
+
+인덱스는 ORDER BY 식이 인덱스 식과 같아야 사용되므로, 검색 쿼리는 반드시 nearest_stmt()로 만든다.
+
+실행 (backend 디렉토리에서, 대량 적재 후 인덱스 재생성):
+    poetry run python -m app.db.vector_index rebuild
+    poetry run python -m app.db.vector_index status
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+import argparse
+import json
+import logging
+
+from sqlalchemy import Float, Select, cast, func, literal, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.types import UserDefinedType
+from pgvector.sqlalchemy import Vector
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+INDEX_TYPES = ("hnsw", "ivfflat", "none")
+
+# pgvector 인덱스가 지원하는 최대 차원 수
+VECTOR_INDEX_MAX_DIM = 2000
+HALFVEC_INDEX_MAX_DIM = 4000
+
+
+class HalfVec(UserDefinedType):
+    """
+    pgvector halfvec 타입 (식 인덱스/캐스팅 전용)
+    """
+    cache_ok = True
+
+    def __init__(self, dim: int):
+        self.dim = dim
+
+    def get_col_spec(self, **kw) -> str:
+        return f"halfvec({self.dim})"
+
+
+class Bit(UserDefinedType):
+    """
+    PostgreSQL bit(n) 타입 (binary_quantize 결과 캐스팅 전용)
+    """
+    cache_ok = True
+
+    def __init__(self, dim: int):
+        self.dim = dim
+
+    def get_col_spec(self, **kw) -> str:
+        return f"bit({self.dim})"
+
+
+def storage_for(dim: int) -> str:
+    """
+    차원 수에 맞는 인덱스 표현: vector | halfvec | bit
+    """
+    if dim <= VECTOR_INDEX_MAX_DIM:
+        return "vector"
+    if dim <= HALFVEC_INDEX_MAX_DIM:
+        return "halfvec"
+    return "bit"
+
+
+def index_name(table: str, column: str, index_type: str) -> str:
+    return f"ix_{table}_{column}_{index_type}"
+
+
+def _index_expression(column: str, dim: int) -> tuple[str, str]:
+    """
+    (인덱스 식, operator class)
+    """
+    storage = storage_for(dim)
+    if storage == "vector":
+        return column, "vector_l2_ops"
+    if storage == "halfvec":
+        return f"({column}::halfvec({dim}))", "halfvec_l2_ops"
+    return f"(binary_quantize({column})::bit({dim}))", "bit_hamming_ops"
+
+
+def ivfflat_lists(row_count: int) -> int:
+    """
+    IVFFlat 리스트 수. 설정값이 0이면 pgvector 권장값(행 100만 개 이하: rows / 1000, 최소 10)을 사용한다.
+    """
+    if settings.VECTOR_IVFFLAT_LISTS > 0:
+        return settings.VECTOR_IVFFLAT_LISTS
+    return max(10, row_count // 1000)
+
+
+def create_index_sql(
+    table: str,
+    column: str,
+    dim: int,
+    index_type: Optional[str] = None,
+    row_count: int = 0,
+    name: Optional[str] = None,
+) -> Optional[str]:
+    index_type = index_type or settings.VECTOR_INDEX_TYPE
+    if index_type == "none":
+        return None
+    if index_type not in INDEX_TYPES:
+        raise ValueError(f"지원하지 않는 VECTOR_INDEX_TYPE: {index_type} ({'|'.join(INDEX_TYPES)})")
+
+    expression, opclass = _index_expression(column, dim)
+    if index_type == "hnsw":
+        options = f"m = {settings.VECTOR_HNSW_M}, ef_construction = {settings.VECTOR_HNSW_EF_CONSTRUCTION}"
+    else:
+        options = f"lists = {ivfflat_lists(row_count)}"
+
+    return (
+        f"CREATE INDEX IF NOT EXISTS {name or index_name(table, column, index_type)} "
+        f"ON {table} USING {index_type} ({expression} {opclass}) WITH ({options});"
+    )
+
+
+def _row_count(db: Session, table: str, column: str) -> int:
+    return db.execute(text(f"SELECT count(*) FROM {table} WHERE {column} IS NOT NULL")).scalar() or 0
+
+
+def _drop_other_indexes(db: Session, table: str, column: str, index_type: str) -> None:
+    # 설정으로 인덱스 종류를 바꾼 경우 이전 종류의 인덱스를 정리한다
+    for other in INDEX_TYPES:
+        if other not in ("none", index_type):
+            db.execute(text(f"DROP INDEX IF EXISTS {index_name(table, column, other)};"))
+
+
+def ensure_vector_index(
+    db: Session,
+    table: str = "seoul_events",
+    column: str = "embedding",
+    dim: Optional[int] = None,
+    index_type: Optional[str] = None,
+) -> None:
+    """
+    init_db에서 호출. 설정된 종류의 인덱스가 없을 때만 만든다. (이미 있으면 그대로 둠)
+    IVFFlat은 생성 시점의 데이터로 리스트를 나누므로, 빈 테이블에 만든 경우 적재 후 rebuild가 필요하다.
+    """
+    dim = dim or settings.EMBEDDING_DIMENSION
+    index_type = index_type or settings.VECTOR_INDEX_TYPE
+    _drop_other_indexes(db, table, column, index_type)
+
+    sql = create_index_sql(table, column, dim, index_type, row_count=_row_count(db, table, column))
+    if sql:
+        db.execute(text(sql))
+    db.commit()
+
+
+def rebuild_vector_index(
+    db: Session,
+    table: str = "seoul_events",
+    column: str = "embedding",
+    dim: Optional[int] = None,
+    index_type: Optional[str] = None,
+) -> Optional[str]:
+    """
+    대량 적재(임베딩 백필) 후 인덱스를 새로 만든다.
+    - HNSW: 그래프를 처음부터 다시 만들어 삽입 순서에 따른 품질 저하를 없앤다.
+    - IVFFlat: 현재 행 수로 lists를 다시 계산하고 centroid를 새로 학습한다.
+    새 인덱스를 임시 이름으로 만든 뒤 교체하므로 재생성 중에도 기존 인덱스로 검색할 수 있다.
+
+    Returns:
+        생성한 인덱스 이름 (VECTOR_INDEX_TYPE=none이면 None)
+    """
+    dim = dim or settings.EMBEDDING_DIMENSION
+    index_type = index_type or settings.VECTOR_INDEX_TYPE
+    if index_type == "none":
+        return None
+
+    name = index_name(table, column, index_type)
+    tmp_name = f"{name}_new"
+    db.execute(text(f"DROP INDEX IF EXISTS {tmp_name};"))
+    db.execute(text(create_index_sql(
+        table, column, dim, index_type, row_count=_row_count(db, table, column), name=tmp_name,
+    )))
+    db.execute(text(f"DROP INDEX IF EXISTS {name};"))
+    db.execute(text(f"ALTER INDEX {tmp_name} RENAME TO {name};"))
+    _drop_other_indexes(db, table, column, index_type)
+    db.commit()
+    logger.info("Rebuilt vector index %s", name)
+    return name
+
+
+def search_param_sql(top_k: int = 0, index_type: Optional[str] = None, filtered: bool = False) -> List[str]:
+    """
+    현재 트랜잭션에만 적용되는(SET LOCAL) ANN 검색 파라미터 설정문. 검색 쿼리 직전에 같은 세션에서 실행한다.
+    - HNSW: hnsw.ef_search (후보 리스트 크기, 클수록 recall↑ 속도↓). 최소 top_k 이상이어야 top_k개를 돌려준다.
+    - IVFFlat: ivfflat.probes (탐색할 리스트 수)
+    - filtered: WHERE 필터와 함께 검색하는 경우. VECTOR_ITERATIVE_SCAN이 설정되어 있으면 (pgvector 0.8+)
+      인덱스 후보가 필터로 모두 걸러져도 결과가 모자라지 않도록 iterative scan을 켠다.
+    """
+    index_type = index_type or settings.VECTOR_INDEX_TYPE
+    statements: List[str] = []
+    if index_type == "hnsw":
+        ef_search = max(settings.VECTOR_HNSW_EF_SEARCH, candidate_count(top_k))
+        statements.append(f"SET LOCAL hnsw.ef_search = {int(ef_search)}")
+    elif index_type == "ivfflat":
+        statements.append(f"SET LOCAL ivfflat.probes = {int(settings.VECTOR_IVFFLAT_PROBES)}")
+
+    if filtered and index_type != "none" and settings.VECTOR_ITERATIVE_SCAN in ("relaxed_order", "strict_order"):
+        statements.append(f"SET LOCAL {index_type}.iterative_scan = {settings.VECTOR_ITERATIVE_SCAN}")
+    return statements
+
+
+def apply_search_params(db: Session, top_k: int = 0, index_type: Optional[str] = None, filtered: bool = False) -> None:
+    """
+    search_param_sql()의 설정을 동기 세션에 적용한다.
+    """
+    for sql in search_param_sql(top_k, index_type, filtered):
+        db.execute(text(sql))
+
+
+async def apply_search_params_async(
+    db: AsyncSession, top_k: int = 0, index_type: Optional[str] = None, filtered: bool = False,
+) -> None:
+    """
+    search_param_sql()의 설정을 비동기 세션에 적용한다.
+    """
+    for sql in search_param_sql(top_k, index_type, filtered):
+        await db.execute(text(sql))
+
+
+def candidate_count(top_k: int, dim: Optional[int] = None) -> int:
+    """
+    인덱스에서 가져올 후보 수. 비트 인덱스는 근사 오차가 커서 top_k보다 넉넉히 가져와 재정렬한다.
+    """
+    dim = dim or settings.EMBEDDING_DIMENSION
+    if storage_for(dim) == "bit":
+        return top_k * max(1, settings.VECTOR_BINARY_RERANK_FACTOR)
+    return top_k
+
+
+def index_distance(column: Any, query_vector: list, dim: Optional[int] = None) -> Any:
+    """
+    인덱스 식과 동일한 형태의 거리 식. ORDER BY에 이 식을 써야 ANN 인덱스가 사용된다.
+    """
+    dim = dim or settings.EMBEDDING_DIMENSION
+    storage = storage_for(dim)
+    if storage == "vector":
+        return column.l2_distance(query_vector)
+
+    query = literal(query_vector, type_=Vector(dim))
+    if storage == "halfvec":
+        return cast(column, HalfVec(dim)).op("<->", return_type=Float)(cast(query, HalfVec(dim)))
+    return cast(func.binary_quantize(column), Bit(dim)).op("<~>", return_type=Float)(
+        cast(func.binary_quantize(cast(query, Vector(dim))), Bit(dim))
+    )
+
+
+def nearest_stmt(
+    entity: Any,
+    column: Any,
+    query_vector: list,
+    top_k: int,
+    dim: Optional[int] = None,
+    where: tuple = (),
+    id_column: Any = None,
+    max_distance: Optional[float] = None,
+) -> Select:
+    """
+    query_vector와 가까운 순으로 top_k개를 고르는 SELECT.
+    bit 표현이면 인덱스로 후보를 넉넉히 고른 뒤 원본 벡터 거리로 다시 정렬한다.
+
+    Args:
+        where: 추가 WHERE 조건 (필터와 함께 검색할 때)
+        id_column: 후보 재정렬에 쓸 PK 컬럼 (기본값: entity.id)
+        max_distance: 원본 벡터 L2 거리가 이보다 먼 결과는 제외
+    """
+    dim = dim or settings.EMBEDDING_DIMENSION
+    conditions = (column.is_not(None), *where)
+    within = (column.l2_distance(query_vector) <= max_distance,) if max_distance else ()
+
+    if storage_for(dim) != "bit":
+        return (
+            select(entity)
+            .where(*conditions, *within)
+            .order_by(index_distance(column, query_vector, dim))
+            .limit(top_k)
+        )
+
+    id_column = id_column if id_column is not None else entity.id
+    candidates = (
+        select(id_column)
+        .where(*conditions)
+        .order_by(index_distance(column, query_vector, dim))
+        .limit(candidate_count(top_k, dim))
+        .scalar_subquery()
+    )
+    return (
+        select(entity)
+        .where(id_column.in_(candidates), *within)
+        .order_by(column.l2_distance(query_vector))
+        .limit(top_k)
+    )
+
+
+def index_status(db: Session, table: str = "seoul_events", column: str = "embedding") -> Dict[str, Any]:
+    rows = db.execute(
+        text(
+            "SELECT indexname, indexdef, pg_size_pretty(pg_relation_size(quote_ident(indexname)::regclass)) AS size "
+            "FROM pg_indexes WHERE tablename = :table AND indexname LIKE :pattern"
+        ),
+        {"table": table, "pattern": f"ix_{table}_{column}_%"},
+    ).mappings().all()
+    return {
+        "index_type": settings.VECTOR_INDEX_TYPE,
+        "storage": storage_for(settings.EMBEDDING_DIMENSION),
+        "rows_with_embedding": _row_count(db, table, column),
+        "indexes": [dict(row) for row in rows],
+    }
+
+
+def main(argv: Optional[list] = None) -> None:
+    from app.db.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="seoul_events 임베딩 ANN 인덱스 관리")
+    parser.add_argument("command", choices=("rebuild", "ensure", "status"))
+    parser.add_argument("--type", choices=INDEX_TYPES, default=None, help="기본값: VECTOR_INDEX_TYPE")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        if args.command == "rebuild":
+            rebuild_vector_index(db, index_type=args.type)
+        elif args.command == "ensure":
+            ensure_vector_index(db, index_type=args.type)
+        print(json.dumps(index_status(db), ensure_ascii=False, indent=2, default=str))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -1,11 +1,15 @@
 # backend/app/entity/conversation_entity.py
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index, text
 from app.db.database import Base
 
 
 class Conversation(Base):
     __tablename__ = "conversations"
+    __table_args__ = (
+        # 사용자의 가장 최근 대화 조회용
+        Index("ix_conversations_username_updated_at", "username", text("updated_at DESC")),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     username = Column(String, index=True, nullable=False)
@@ -0,0 +1,23 @@
+# backend/app/entity/embedding_cache_entity.py
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from pgvector.sqlalchemy import Vector
+from app.db.database import Base
+from app.core.config import settings
+
+
+class EmbeddingCache(Base):
+    """
+    임베딩 API 결과 캐시. sha256(모델명 + input_type + 입력 텍스트)를 키로 벡터를 저장한다.
+    같은 텍스트(예: 날짜만 바뀌어 재등록된 행사)는 API를 다시 호출하지 않고 이 테이블에서 가져온다.
+    """
+    __tablename__ = "embedding_cache"
+
+    cache_key = Column(String(64), primary_key=True)
+    model = Column(String(100), nullable=False)
+    input_type = Column(String(20), nullable=False)
+    embedding: Mapped[list[float]] = mapped_column(Vector(settings.EMBEDDING_DIMENSION), nullable=False)
+    hit_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_used_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)  # 오래 안 쓰인 항목부터 정리
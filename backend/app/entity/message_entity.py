@@ -1,13 +1,17 @@
 # backend/app/entity/message_entity.py
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 from app.db.database import Base
 
 
 class Message(Base):
     __tablename__ = "messages"
+    __table_args__ = (
+        # 대화별 역할별 마지막 메시지 조회용 (AsyncConversationRepository.load_context)
+        Index("ix_messages_conversation_role_turn", "conversation_id", "role", text("turn DESC")),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     conversation_id = Column(Integer, ForeignKey("conversations.id"), nullable=False, index=True)
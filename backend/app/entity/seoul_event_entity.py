@@ -1,8 +1,9 @@
 # backend/app/entity/seoul_event_entity.py
 from sqlalchemy import (
-    Column, Integer, String, Text, Date, Float,
+    Column, Integer, String, Text, Date, Float, DateTime,
     UniqueConstraint
 )
+from datetime import datetime
 from app.db.database import Base
 from sqlalchemy.orm import Mapped, mapped_column
 from pgvector.sqlalchemy import Vector
@@ -44,11 +45,18 @@ class SeoulEvent(Base):
     hmpg_addr  = Column(Text)          # 문화포털상세URL
     pro_time   = Column(String(100))   # 행사시간
 
+    content_hash = Column(String(64))  # 정규화된 API row의 sha256 (증분 동기화용)
+
     embedding: Mapped[list[float]] = mapped_column(
         Vector(EMBEDDING_DIMENSION), 
         nullable=True,
         doc="이벤트 제목과 내용을 결합한 텍스트의 임베딩 벡터"
     )
+
+    # 임베딩 워커 작업 선점/재시도 관리
+    embedding_claimed_at = Column(DateTime)                                   # 워커가 선점한 시각 (lease)
+    embedding_attempts = Column(Integer, nullable=False, default=0, server_default="0")  # 임베딩 실패 횟수
+    updated_at = Column(DateTime, default=datetime.utcnow, index=True)       # 행 내용/임베딩이 마지막으로 바뀐 시각 (인메모리 벡터 인덱스 증분 갱신용)
     
     # 💡 RAG 검색을 위한 텍스트 청크 생성 메서드
     def get_rag_chunk(self) -> str:
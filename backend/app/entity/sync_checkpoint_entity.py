@@ -0,0 +1,24 @@
+# backend/app/entity/sync_checkpoint_entity.py
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime
+from app.db.database import Base
+
+
+class SyncCheckpoint(Base):
+    """
+    서울시 문화행사 동기화 진행 상황.
+    워커가 중간에 재시작되면 status="running"인 체크포인트의 next_start부터 이어서 수집한다.
+    """
+    __tablename__ = "sync_checkpoints"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    run_id = Column(String(32), unique=True, nullable=False)
+    mode = Column(String(20), nullable=False)
+    status = Column(String(20), index=True, nullable=False, default="running")  # "running" | "completed" | "abandoned"
+    next_start = Column(Integer, nullable=False, default=1)  # 아직 기록되지 않은 첫 row 번호
+    total = Column(Integer, nullable=True)                   # API list_total_count
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<SyncCheckpoint(run_id={self.run_id}, status={self.status}, next_start={self.next_start}, total={self.total})>"
@@ -2,12 +2,16 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 
+from app.db.database import async_engine
 from app.db.init_db import init_db
 from app.api import seoul_event, auth, chat
 from app.core.config import settings
 from app.services.collect_event import fetch_page, sync_seoul_events
+from app.services.embedding_service import close_embedding_service
+from app.services.vector_index import get_vector_index, memory_backend_enabled
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -20,9 +24,17 @@ async def lifespan(app: FastAPI):
     logger.info("Initializing database...")
     init_db()
     logger.info("Database initialization complete.")
+    if memory_backend_enabled():
+        # 첫 채팅 요청이 전체 적재를 기다리지 않도록 시작 시 미리 올려 둔다
+        try:
+            await asyncio.to_thread(get_vector_index)
+        except Exception as e:
+            logger.warning("In-memory vector index load failed (pgvector will be used): %s", e)
     yield
     # 서버 종료 시: 필요한 정리 작업 수행 (없으면 생략 가능)
     logger.info("Application shutting down.")
+    await close_embedding_service()
+    await async_engine.dispose()
 
 
 app = FastAPI(
@@ -64,8 +76,8 @@ def get_seoul_events():
 @app.post("/sync-seoul-events")
 def sync_seoul_events_endpoint():
     try:
-        saved = sync_seoul_events()
-        return {"message": "ok", "saved": saved}
+        stats = sync_seoul_events()
+        return {"message": "ok", "saved": stats["inserted"], "stats": stats}
     except Exception as e:
         logger.exception("Failed to sync seoul events: %s", e)
         raise
@@ -6,9 +6,11 @@ from typing import Optional
 class ChatRequest(BaseModel):
     username: str
     message: str
+    bypass_cache: bool = False  # True면 답변 캐시를 사용하지 않고 새로 생성
 
 
 class ChatResponse(BaseModel):
     reply: str
     related_event_ids: list[int]
+    response_cache: Optional[str] = None  # "hit" | "miss" | "bypass"
 
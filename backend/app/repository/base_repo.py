@@ -1,4 +1,6 @@
 # backend/app/repository/base_repo.py
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import TypeVar, Generic, Type, List, Optional
 
@@ -21,4 +23,27 @@ class BaseRepository(Generic[T]):
         self.db.add(db_item)
         self.db.commit()
         self.db.refresh(db_item)
-        return db_item
\ No newline at end of file
+        return db_item
+
+
+class AsyncBaseRepository(Generic[T]):
+    """
+    AsyncSession(asyncpg)용 BaseRepository. 이벤트 루프를 막지 않아야 하는 챗봇 경로에서 사용한다.
+    """
+    def __init__(self, model: Type[T], db: AsyncSession):
+        self.model = model
+        self.db = db
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[T]:
+        result = await self.db.execute(select(self.model).offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def get_by_id(self, item_id: int) -> Optional[T]:
+        return await self.db.get(self.model, item_id)
+
+    async def create(self, item_data: dict) -> T:
+        db_item = self.model(**item_data)
+        self.db.add(db_item)
+        await self.db.commit()
+        await self.db.refresh(db_item)
+        return db_item
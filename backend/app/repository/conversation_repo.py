@@ -0,0 +1,148 @@
+# backend/app/repository/conversation_repo.py
+from dataclasses import dataclass, field
+from datetime import datetime
+from sqlalchemy import func, select, true, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.entity.conversation_entity import Conversation
+from app.entity.message_entity import Message
+from app.repository.base_repo import AsyncBaseRepository
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ConversationContext:
+    """
+    채팅 한 턴을 처리하는 데 필요한 이전 대화 정보
+    """
+    conversation_id: Optional[int] = None                      # 대화가 없으면 None
+    last_turn: int = 0
+    prev_user_message: Optional[str] = None                    # 마지막 사용자 질문 (꼬리 질문의 검색 조건 비교용)
+    prev_user_emb: List[float] = field(default_factory=list)   # 마지막 사용자 질문 임베딩
+    prev_event_ids: List[int] = field(default_factory=list)    # 마지막 답변에서 추천한 행사 id
+
+
+class AsyncConversationRepository(AsyncBaseRepository[Conversation]):
+    """
+    챗봇 대화/메시지 저장소 (AsyncSession)
+    """
+    def __init__(self, db: AsyncSession):
+        super().__init__(Conversation, db)
+
+    async def load_context(self, username: str) -> ConversationContext:
+        """
+        사용자의 가장 최근 대화와 그 대화의 마지막 turn / 마지막 질문(본문, 임베딩) / 마지막 추천 행사 id를
+        한 번의 SQL로 조회한다. (대화 1건 + 역할별 마지막 메시지를 LATERAL JOIN, ix_messages_conversation_role_turn 사용)
+
+        Args:
+            username: 사용자 이름
+
+        Returns:
+            ConversationContext: 대화가 없으면 conversation_id=None (대화는 add_turn에서 만든다)
+        """
+        convo = (
+            select(Conversation.id)
+            .where(Conversation.username == username)
+            .order_by(Conversation.updated_at.desc())
+            .limit(1)
+            .subquery("convo")
+        )
+        last_user = (
+            select(Message.turn, Message.content, Message.embedding)
+            .where(Message.conversation_id == convo.c.id, Message.role == "user")
+            .order_by(Message.turn.desc())
+            .limit(1)
+            .lateral("last_user")
+        )
+        last_assistant = (
+            select(Message.turn, Message.related_event_ids)
+            .where(Message.conversation_id == convo.c.id, Message.role == "assistant")
+            .order_by(Message.turn.desc())
+            .limit(1)
+            .lateral("last_assistant")
+        )
+        stmt = (
+            select(
+                convo.c.id,
+                # 메시지 역할은 user / assistant 두 가지뿐이므로 둘 중 큰 turn이 대화의 마지막 turn (GREATEST는 NULL 무시)
+                func.coalesce(func.greatest(last_user.c.turn, last_assistant.c.turn), 0).label("last_turn"),
+                last_user.c.content,
+                last_user.c.embedding,
+                last_assistant.c.related_event_ids,
+            )
+            .select_from(convo)
+            .outerjoin(last_user, true())
+            .outerjoin(last_assistant, true())
+        )
+
+        row = (await self.db.execute(stmt)).first()
+        if row is None:
+            return ConversationContext()
+        return ConversationContext(
+            conversation_id=row.id,
+            last_turn=row.last_turn,
+            prev_user_message=row.content,
+            prev_user_emb=row.embedding or [],
+            prev_event_ids=[int(x) for x in row.related_event_ids or []],
+        )
+
+    async def add_turn(
+        self,
+        conversation_id: Optional[int],
+        username: str,
+        user_content: str,
+        user_embedding: Optional[List[float]],
+        assistant_content: str,
+        related_event_ids: Optional[List[int]],
+        last_turn: int,
+    ) -> int:
+        """
+        사용자 질문과 챗봇 답변을 한 트랜잭션으로 저장하고 대화의 updated_at을 갱신한다.
+        대화가 아직 없으면(첫 질문) 이때 만든다.
+
+        Args:
+            conversation_id: 대화 id (없으면 None)
+            username: 사용자 이름
+            user_content: 사용자 질문
+            user_embedding: 질문 임베딩 (꼬리 질문 판단용)
+            assistant_content: 챗봇 답변
+            related_event_ids: 답변에 사용한 행사 id 목록
+            last_turn: 저장 전 마지막 turn 번호
+
+        Returns:
+            int: 대화 id
+        """
+        if conversation_id is None:
+            convo = Conversation(username=username)
+            self.db.add(convo)
+            await self.db.flush()  # id 발급
+            conversation_id = convo.id
+        else:
+            await self.db.execute(
+                update(Conversation)
+                .where(Conversation.id == conversation_id)
+                .values(updated_at=datetime.utcnow())
+            )
+
+        self.db.add_all([
+            Message(
+                conversation_id=conversation_id,
+                username=username,
+                role="user",
+                content=user_content,
+                embedding=user_embedding,
+                turn=last_turn + 1,
+            ),
+            Message(
+                conversation_id=conversation_id,
+                username=username,
+                role="assistant",
+                content=assistant_content,
+                related_event_ids=related_event_ids,
+                turn=last_turn + 2,
+            ),
+        ])
+        await self.db.commit()
+        return conversation_id
@@ -0,0 +1,104 @@
+# backend/app/repository/embedding_cache_repo.py
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import Dict, List
+from datetime import datetime, timedelta
+from app.entity.embedding_cache_entity import EmbeddingCache
+from app.repository.base_repo import BaseRepository
+import logging
+
+logger = logging.getLogger(__name__)
+
+class EmbeddingCacheRepository(BaseRepository[EmbeddingCache]):
+    def __init__(self, db: Session):
+        super().__init__(EmbeddingCache, db)
+
+    def get_many(self, cache_keys: List[str], touch_interval_seconds: int = 0) -> Dict[str, List[float]]:
+        """
+        캐시 키 목록으로 저장된 벡터를 한 번에 조회하고, 찾은 항목의 사용 시각/횟수를 갱신한다.
+        읽을 때마다 UPDATE가 나가지 않도록 마지막 갱신 후 touch_interval_seconds가 지난 항목만 갱신한다.
+        (hit_count는 갱신 구간당 최대 1회로 세는 근사치, last_used_at은 eviction 순서용으로 충분한 정밀도)
+
+        Args:
+            cache_keys: 조회할 캐시 키 목록
+            touch_interval_seconds: 사용 시각 갱신 간격 (0이면 항상 갱신)
+
+        Returns:
+            Dict[str, List[float]]: {캐시 키: 벡터} (없는 키는 포함되지 않음)
+        """
+        if not cache_keys:
+            return {}
+
+        rows = self.db.execute(
+            select(EmbeddingCache.cache_key, EmbeddingCache.embedding, EmbeddingCache.last_used_at)
+            .where(EmbeddingCache.cache_key.in_(cache_keys))
+        ).all()
+        found = {key: [float(x) for x in vector] for key, vector, _ in rows}
+
+        now = datetime.utcnow()
+        stale_before = now - timedelta(seconds=touch_interval_seconds)
+        stale = [key for key, _, last_used_at in rows if last_used_at is None or last_used_at <= stale_before]
+        if stale:
+            self.db.execute(
+                update(EmbeddingCache)
+                .where(EmbeddingCache.cache_key.in_(stale))
+                .values(last_used_at=now, hit_count=EmbeddingCache.hit_count + 1)
+                .execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+        return found
+
+    def put_many(self, model: str, input_type: str, vectors: Dict[str, List[float]]) -> None:
+        """
+        새로 받은 벡터를 저장한다. 이미 있는 키는 그대로 둔다.
+
+        Args:
+            model: 임베딩 모델명
+            input_type: "document" | "query"
+            vectors: {캐시 키: 벡터}
+        """
+        if not vectors:
+            return
+        now = datetime.utcnow()
+        stmt = pg_insert(EmbeddingCache).values([
+            {
+                "cache_key": key,
+                "model": model,
+                "input_type": input_type,
+                "embedding": vector,
+                "hit_count": 0,
+                "created_at": now,
+                "last_used_at": now,
+            }
+            for key, vector in vectors.items()
+        ]).on_conflict_do_nothing(index_elements=["cache_key"])
+        self.db.execute(stmt)
+        self.db.commit()
+
+    def evict(self, max_entries: int) -> int:
+        """
+        항목 수가 max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 삭제한다.
+
+        Returns:
+            int: 삭제된 항목 수
+        """
+        count = self.db.query(func.count(EmbeddingCache.cache_key)).scalar() or 0
+        overflow = count - max_entries
+        if overflow <= 0:
+            return 0
+
+        oldest = (
+            select(EmbeddingCache.cache_key)
+            .order_by(EmbeddingCache.last_used_at.asc())
+            .limit(overflow)
+            .scalar_subquery()
+        )
+        result = self.db.execute(
+            delete(EmbeddingCache)
+            .where(EmbeddingCache.cache_key.in_(oldest))
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        logger.info(f"Evicted {result.rowcount} embedding cache entries (limit={max_entries})")
+        return result.rowcount
@@ -1,14 +1,126 @@
 # backend/app/repository/seoul_event_repo.py
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, func
+from sqlalchemy import Select, or_, and_, case, func, update
 from typing import List, Optional, Dict
+from datetime import datetime, timedelta
 from app.entity.seoul_event_entity import SeoulEvent
-from app.repository.base_repo import BaseRepository
+from app.repository.base_repo import AsyncBaseRepository, BaseRepository
+from app.db.vector_index import apply_search_params, apply_search_params_async, nearest_stmt
+from app.services.event_cache import event_cache, event_cache_enabled
+from app.services.vector_index import get_vector_index, l2_to_cosine, memory_backend_enabled
+import asyncio
 import logging
 from sqlalchemy import select
 
 logger = logging.getLogger(__name__)
 
+
+# ---------- 동기/비동기 저장소가 함께 쓰는 쿼리 구성 ----------
+
+def _search_in_memory(query_vector: list, top_k: int, **filters) -> Optional[List[int]]:
+    """
+    인메모리 VectorIndex로 검색한 event id 목록. 인덱스를 쓸 수 없으면 None (pgvector로 대체)
+    """
+    try:
+        index = get_vector_index()
+        index.maybe_refresh()
+        min_similarity = l2_to_cosine(filters.pop("max_distance", None))
+        hits = index.search([query_vector], top_k, min_similarity=min_similarity, **filters)[0]
+    except Exception as e:
+        logger.warning(f"In-memory vector search failed, falling back to pgvector: {e}")
+        return None
+    return [event_id for event_id, _ in hits]
+
+
+def _vectors_in_memory(ids: List[int]) -> Optional[Dict[int, List[float]]]:
+    """
+    인메모리 VectorIndex에서 임베딩 조회. 쓸 수 없으면 None (DB로 대체)
+    """
+    if not memory_backend_enabled():
+        return None
+    try:
+        return get_vector_index().vectors_for(ids)
+    except Exception as e:
+        logger.warning(f"In-memory vector lookup failed, falling back to DB: {e}")
+        return None
+
+
+def _embeddings_stmt(ids: List[int]) -> Select:
+    return (
+        select(SeoulEvent.id, SeoulEvent.embedding)
+        .where(SeoulEvent.id.in_(ids), SeoulEvent.embedding.is_not(None))
+    )
+
+
+def _ids_ordered_stmt(ids: List[int]) -> Select:
+    ordering = case({id_: idx for idx, id_ in enumerate(ids)}, value=SeoulEvent.id)
+    return select(SeoulEvent).where(SeoulEvent.id.in_(ids)).order_by(ordering)
+
+
+def _hybrid_conditions(
+    start_date: Optional[str],
+    end_date: Optional[str],
+    gu_name: Optional[str],
+    codename: Optional[str],
+    is_free: Optional[str],
+) -> list:
+    conditions = []
+    if start_date:
+        conditions.append(SeoulEvent.end_date >= start_date)
+    if end_date:
+        conditions.append(SeoulEvent.start_date <= end_date)
+    if gu_name:
+        conditions.append(SeoulEvent.gu_name == gu_name)
+    if codename:
+        conditions.append(SeoulEvent.codename.startswith(codename, autoescape=True))
+    if is_free:
+        conditions.append(SeoulEvent.is_free == is_free)
+    return conditions
+
+
+def _hybrid_stmt(query_vector: Optional[list], conditions: list, top_k: int, max_distance: Optional[float]) -> Optional[Select]:
+    """
+    질문 임베딩도 필터도 없으면 None (정렬 기준이 없어 오래된 행사만 나오므로 검색하지 않는다)
+    """
+    if not query_vector and not conditions:
+        return None
+    if not query_vector:
+        return select(SeoulEvent).where(*conditions).order_by(SeoulEvent.start_date.asc()).limit(top_k)
+    return nearest_stmt(
+        SeoulEvent,
+        SeoulEvent.embedding,
+        query_vector,
+        top_k,
+        where=tuple(conditions),
+        max_distance=max_distance,
+    )
+
+
+def _exact_hybrid_stmt(query_vector: list, conditions: list, top_k: int, max_distance: Optional[float]) -> Select:
+    """
+    필터를 먼저 적용하고 남은 행만 정확한 L2 거리로 정렬하는 쿼리.
+    ANN 인덱스는 ef_search개 후보를 뽑은 뒤 필터를 적용하므로(post-filter) 선택적인 필터에서는 결과가 모자랄 수 있다.
+    ORDER BY에 + 0을 붙여 인덱스 식과 달라지게 해 ANN 인덱스 대신 필터 인덱스/순차 스캔을 쓰게 한다.
+    ANN / 인메모리 검색과 같이 임베딩이 없는 행사는 제외한다.
+    """
+    distance = SeoulEvent.embedding.l2_distance(query_vector)
+    where = [SeoulEvent.embedding.is_not(None), *conditions]
+    if max_distance is not None:
+        where.append(distance <= max_distance)
+    return select(SeoulEvent).where(*where).order_by((distance + 0).asc()).limit(top_k)
+
+
+def _filtered_count_stmt(conditions: list, limit: int) -> Select:
+    """
+    필터에 맞고 임베딩이 있는 행사 수 (limit개까지만 센다). 벡터 연산 없이 필터 인덱스만 사용한다.
+    ANN 결과가 top_k보다 적을 때, 필터에 맞는 행사가 원래 그만큼뿐인지(재검색 불필요)
+    ANN 후보가 필터에 걸려 잘린 것인지(정확 검색 필요) 구분하는 데 쓴다.
+    """
+    matched = select(SeoulEvent.id).where(SeoulEvent.embedding.is_not(None), *conditions).limit(limit).subquery()
+    return select(func.count()).select_from(matched)
+
+
 class SeoulEventRepository(BaseRepository[SeoulEvent]):
     def __init__(self, db: Session):
         super().__init__(SeoulEvent, db)
@@ -214,11 +326,293 @@ class SeoulEventRepository(BaseRepository[SeoulEvent]):
 
     def search_similar_events(self, db: Session, query_vector: list, top_k: int = 3):
         """
-        벡터 유사도 검색을 통해 가장 관련성 높은 이벤트 3개를 반환합니다.
-        pgvector의 l2_distance(<->) 혹은 cosine_distance(<=>) 사용 가정.
+        벡터 유사도 검색을 통해 가장 관련성 높은 이벤트 top_k개를 반환합니다.
+        pgvector l2_distance(<->) 기준이며, ORDER BY 식을 ANN 인덱스 식과 맞춰 인덱스 스캔을 사용합니다.
+        """
+        if memory_backend_enabled():
+            hits = _search_in_memory(query_vector, top_k)
+            if hits is not None:
+                return self.find_by_ids_ordered(hits)
+
+        apply_search_params(db, top_k)
+        stmt = nearest_stmt(SeoulEvent, SeoulEvent.embedding, query_vector, top_k)
+
+        return db.execute(stmt).scalars().all()
+
+    def get_embeddings_by_ids(self, ids: List[int]) -> Dict[int, List[float]]:
+        """
+        이벤트 id별 임베딩 조회 (임베딩이 없는 이벤트는 제외)
+        인메모리 VectorIndex를 쓰는 경우 DB 대신 인덱스에서 가져온다.
+        """
+        if not ids:
+            return {}
+        vectors = _vectors_in_memory(ids)
+        if vectors is not None:
+            return vectors
+
+        rows = self.db.execute(_embeddings_stmt(ids)).all()
+        return {int(row.id): [float(x) for x in row.embedding] for row in rows}
+
+    def find_by_ids_ordered(self, ids: List[int]) -> List[SeoulEvent]:
+        """
+        id 목록 순서를 유지한 채 이벤트 조회
+        """
+        if not ids:
+            return []
+        return self.db.execute(_ids_ordered_stmt(ids)).scalars().all()
+
+    def search_events_hybrid(
+        self,
+        query_vector: Optional[list],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        gu_name: Optional[str] = None,
+        codename: Optional[str] = None,
+        is_free: Optional[str] = None,
+        top_k: int = 10,
+        max_distance: Optional[float] = None,
+    ) -> List[SeoulEvent]:
+        """
+        구조화된 필터를 적용한 뒤 남은 후보를 벡터 거리 순으로 정렬해 top_k개를 한 번의 SQL로 조회
+
+        Args:
+            query_vector: 질문 임베딩. 없으면 필터 결과를 시작일 순으로 top_k개 반환 (필터도 없으면 빈 목록)
+            start_date: 이 날짜 이후에 끝나는 행사 (기간 겹침, YYYY-MM-DD)
+            end_date: 이 날짜 이전에 시작하는 행사 (기간 겹침, YYYY-MM-DD)
+            gu_name: 자치구 (예: "송파구")
+            codename: 분류. 접두어로 비교하므로 "축제"는 "축제-문화/예술" 등을 모두 포함
+            is_free: 유무료 (예: "무료")
+            top_k: 최대 반환 개수
+            max_distance: 이보다 먼(L2) 행사는 제외
+
+        Returns:
+            List[SeoulEvent]: 가까운 순으로 정렬된 이벤트 목록
+        """
+        conditions = _hybrid_conditions(start_date, end_date, gu_name, codename, is_free)
+
+        if query_vector and memory_backend_enabled():
+            hits = _search_in_memory(
+                query_vector, top_k,
+                start_date=start_date, end_date=end_date, gu_name=gu_name,
+                codename=codename, is_free=is_free, max_distance=max_distance,
+            )
+            if hits is not None:
+                logger.info(f"Hybrid search (memory) found {len(hits)} events")
+                return self.find_by_ids_ordered(hits)
+
+        if query_vector:
+            apply_search_params(self.db, top_k, filtered=bool(conditions))
+
+        stmt = _hybrid_stmt(query_vector, conditions, top_k, max_distance)
+        events = self.db.execute(stmt).scalars().all() if stmt is not None else []
+        if query_vector and conditions and len(events) < top_k:
+            # ANN 후보가 필터에 걸려 잘린 경우에만 필터 범위 안에서 정확 검색으로 다시 조회
+            # (필터에 맞는 행사가 원래 그만큼뿐이면 벡터 쿼리를 한 번 더 하지 않는다)
+            matched = self.db.execute(_filtered_count_stmt(conditions, top_k)).scalar() or 0
+            if matched > len(events):
+                events = self.db.execute(_exact_hybrid_stmt(query_vector, conditions, top_k, max_distance)).scalars().all()
+        logger.info(
+            f"Hybrid search found {len(events)} events with filters: start_date={start_date}, end_date={end_date}, "
+            f"gu_name={gu_name}, codename={codename}, is_free={is_free}"
+        )
+        return events
+
+    def claim_events_for_embedding(self, batch_size: int, lease_seconds: int, max_attempts: int) -> List[SeoulEvent]:
+        """
+        임베딩이 필요한 이벤트를 batch_size개 선점한다.
+        FOR UPDATE SKIP LOCKED로 다른 워커가 동시에 고르는 행은 건너뛰고, embedding_claimed_at(lease)을 기록해
+        커밋 이후에도 lease가 만료되기 전까지는 다른 워커가 같은 행을 가져가지 않는다.
+
+        Args:
+            batch_size: 한 번에 선점할 최대 개수
+            lease_seconds: 선점 유효 시간 (워커가 죽으면 이 시간이 지난 뒤 다시 선점 가능)
+            max_attempts: 이 횟수 이상 실패한 이벤트는 더 이상 선점하지 않음
+
+        Returns:
+            List[SeoulEvent]: 선점한 이벤트 목록 (세션에서 분리된 상태, 결과는 save_embeddings/mark_embedding_failed로 기록)
+        """
+        now = datetime.utcnow()
+        candidates = (
+            select(SeoulEvent.id)
+            .where(
+                SeoulEvent.embedding.is_(None),
+                SeoulEvent.embedding_attempts < max_attempts,
+                or_(
+                    SeoulEvent.embedding_claimed_at.is_(None),
+                    SeoulEvent.embedding_claimed_at < now - timedelta(seconds=lease_seconds),
+                ),
+            )
+            .order_by(SeoulEvent.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(SeoulEvent)
+            .where(SeoulEvent.id.in_(candidates))
+            .values(embedding_claimed_at=now)
+            .returning(SeoulEvent)
+            .execution_options(synchronize_session=False)
+        )
+        events = self.db.scalars(stmt).all()
+        # 커밋 시 만료되어 행마다 다시 SELECT 하지 않도록 분리한 뒤 커밋 (선점 lock 즉시 해제)
+        for event in events:
+            self.db.expunge(event)
+        self.db.commit()
+        return events
+
+    def save_embeddings(self, embeddings: Dict[int, List[float]]) -> None:
+        """
+        임베딩 결과를 한 번의 executemany UPDATE로 저장하고 선점을 해제한다.
+
+        Args:
+            embeddings: {event_id: 임베딩 벡터}
+        """
+        if not embeddings:
+            return
+        now = datetime.utcnow()
+        self.db.execute(
+            update(SeoulEvent),
+            [
+                {"id": event_id, "embedding": vector, "embedding_claimed_at": None, "updated_at": now}
+                for event_id, vector in embeddings.items()
+            ],
+        )
+        self.db.commit()
+
+    def mark_embedding_failed(self, event_ids: List[int]) -> None:
+        """
+        임베딩에 실패한 이벤트의 실패 횟수를 올리고 선점을 해제한다.
+        """
+        if not event_ids:
+            return
+        self.db.execute(
+            update(SeoulEvent)
+            .where(SeoulEvent.id.in_(event_ids))
+            .values(
+                embedding_attempts=SeoulEvent.embedding_attempts + 1,
+                embedding_claimed_at=None,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+
+
+
+class AsyncSeoulEventRepository(AsyncBaseRepository[SeoulEvent]):
+    """
+    챗봇 그래프에서 쓰는 조회 메서드의 AsyncSession(asyncpg) 버전.
+    쿼리 구성은 SeoulEventRepository와 같고, DB 왕복 동안 이벤트 루프를 막지 않는다.
+    """
+    def __init__(self, db: AsyncSession):
+        super().__init__(SeoulEvent, db)
+
+    async def search_similar_events(self, query_vector: list, top_k: int = 3) -> List[SeoulEvent]:
+        """
+        SeoulEventRepository.search_similar_events 참고
         """
-        stmt = select(SeoulEvent).order_by(
-            SeoulEvent.embedding.l2_distance(query_vector)
-        ).limit(top_k)
-        
-        return db.execute(stmt).scalars().all()
\ No newline at end of file
+        if memory_backend_enabled():
+            # 인덱스 갱신(maybe_refresh)이 동기 DB 조회를 하므로 스레드에서 실행
+            hits = await asyncio.to_thread(_search_in_memory, query_vector, top_k)
+            if hits is not None:
+                return await self.find_by_ids_ordered(hits)
+
+        await apply_search_params_async(self.db, top_k)
+        stmt = nearest_stmt(SeoulEvent, SeoulEvent.embedding, query_vector, top_k)
+        events = list((await self.db.execute(stmt)).scalars().all())
+        self._remember(events)
+        return events
+
+    async def get_embeddings_by_ids(self, ids: List[int]) -> Dict[int, List[float]]:
+        """
+        SeoulEventRepository.get_embeddings_by_ids 참고
+        """
+        if not ids:
+            return {}
+        # 첫 사용 시 인덱스 전체 적재(동기 DB 조회)가 일어날 수 있으므로 이벤트 루프 밖에서 실행
+        vectors = await asyncio.to_thread(_vectors_in_memory, ids) if memory_backend_enabled() else None
+        if vectors is not None:
+            return vectors
+
+        rows = (await self.db.execute(_embeddings_stmt(ids))).all()
+        return {int(row.id): [float(x) for x in row.embedding] for row in rows}
+
+    async def find_by_ids_ordered(self, ids: List[int]) -> List[SeoulEvent]:
+        """
+        id 목록 순서를 유지한 채 이벤트 조회. 행사 캐시(event_cache)에 없는 id만 DB에서 읽는다.
+        """
+        if not ids:
+            return []
+        if not event_cache_enabled():
+            return list((await self.db.execute(_ids_ordered_stmt(ids))).scalars().all())
+
+        if event_cache.catalog_check_due():
+            # 다른 프로세스(수집/임베딩 워커)에서 갱신된 행사가 있으면 캐시를 비운다
+            event_cache.set_catalog_watermark(await self.get_catalog_watermark())
+        found, missing = event_cache.get_many(ids)
+        if missing:
+            loaded = (await self.db.execute(select(SeoulEvent).where(SeoulEvent.id.in_(missing)))).scalars().all()
+            self._remember(loaded)
+            found.update((int(event.id), event) for event in loaded)
+        return [found[event_id] for event_id in ids if event_id in found]
+
+    def _remember(self, events: List[SeoulEvent]) -> None:
+        """
+        조회한 이벤트를 세션에서 분리해 행사 캐시에 넣는다 (다른 요청에서 읽기 전용으로 재사용)
+        """
+        if not event_cache_enabled():
+            return
+        for event in events:
+            self.db.expunge(event)
+        event_cache.put_many(events)
+
+    async def get_catalog_watermark(self) -> Optional[datetime]:
+        """
+        행사 카탈로그의 마지막 변경 시각 (max(updated_at), 수집/임베딩 시 갱신됨). ix_seoul_events_updated_at 사용
+        """
+        return (await self.db.execute(select(func.max(SeoulEvent.updated_at)))).scalar()
+
+    async def search_events_hybrid(
+        self,
+        query_vector: Optional[list],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        gu_name: Optional[str] = None,
+        codename: Optional[str] = None,
+        is_free: Optional[str] = None,
+        top_k: int = 10,
+        max_distance: Optional[float] = None,
+    ) -> List[SeoulEvent]:
+        """
+        SeoulEventRepository.search_events_hybrid 참고
+        """
+        conditions = _hybrid_conditions(start_date, end_date, gu_name, codename, is_free)
+
+        if query_vector and memory_backend_enabled():
+            hits = await asyncio.to_thread(
+                _search_in_memory,
+                query_vector, top_k,
+                start_date=start_date, end_date=end_date, gu_name=gu_name,
+                codename=codename, is_free=is_free, max_distance=max_distance,
+            )
+            if hits is not None:
+                logger.info(f"Hybrid search (memory) found {len(hits)} events")
+                return await self.find_by_ids_ordered(hits)
+
+        if query_vector:
+            await apply_search_params_async(self.db, top_k, filtered=bool(conditions))
+
+        stmt = _hybrid_stmt(query_vector, conditions, top_k, max_distance)
+        events = list((await self.db.execute(stmt)).scalars().all()) if stmt is not None else []
+        if query_vector and conditions and len(events) < top_k:
+            # ANN 후보가 필터에 걸려 잘린 경우에만 필터 범위 안에서 정확 검색으로 다시 조회
+            matched = (await self.db.execute(_filtered_count_stmt(conditions, top_k))).scalar() or 0
+            if matched > len(events):
+                result = await self.db.execute(_exact_hybrid_stmt(query_vector, conditions, top_k, max_distance))
+                events = list(result.scalars().all())
+        self._remember(events)
+        logger.info(
+            f"Hybrid search found {len(events)} events with filters: start_date={start_date}, end_date={end_date}, "
+            f"gu_name={gu_name}, codename={codename}, is_free={is_free}"
+        )
+        return events
@@ -0,0 +1,75 @@
+# backend/app/repository/sync_checkpoint_repo.py
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import datetime, timedelta
+from app.entity.sync_checkpoint_entity import SyncCheckpoint
+from app.repository.base_repo import BaseRepository
+import logging
+
+logger = logging.getLogger(__name__)
+
+class SyncCheckpointRepository(BaseRepository[SyncCheckpoint]):
+    def __init__(self, db: Session):
+        super().__init__(SyncCheckpoint, db)
+
+    def find_running(self, max_age_hours: int) -> Optional[SyncCheckpoint]:
+        """
+        이어서 수집할 수 있는 진행 중 체크포인트 조회
+
+        Args:
+            max_age_hours: 이보다 오래 갱신되지 않은 체크포인트는 무시 (피드가 바뀌었을 수 있으므로)
+
+        Returns:
+            Optional[SyncCheckpoint]: 가장 최근의 진행 중 체크포인트 또는 None
+        """
+        threshold = datetime.utcnow() - timedelta(hours=max_age_hours)
+        return (
+            self.db.query(SyncCheckpoint)
+            .filter(SyncCheckpoint.status == "running", SyncCheckpoint.updated_at >= threshold)
+            .order_by(SyncCheckpoint.updated_at.desc())
+            .first()
+        )
+
+    def start_or_resume(self, mode: str, max_age_hours: int) -> SyncCheckpoint:
+        """
+        진행 중 체크포인트가 있으면 그대로 반환하고, 없으면 새 실행을 시작한다.
+
+        Args:
+            mode: 동기화 모드 (row | bulk | incremental)
+            max_age_hours: 재개 가능한 체크포인트의 최대 나이
+
+        Returns:
+            SyncCheckpoint: 이번 실행에 사용할 체크포인트
+        """
+        checkpoint = self.find_running(max_age_hours)
+        if checkpoint:
+            logger.info(f"Resuming sync run {checkpoint.run_id} from row {checkpoint.next_start} (total={checkpoint.total})")
+            return checkpoint
+
+        # 오래되어 재개하지 않는 체크포인트는 정리
+        self.db.query(SyncCheckpoint).filter(SyncCheckpoint.status == "running").update({"status": "abandoned"})
+        run_id = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+        return self.create({"run_id": run_id, "mode": mode, "status": "running", "next_start": 1})
+
+    def advance(self, checkpoint: SyncCheckpoint, next_start: int, total: Optional[int]) -> None:
+        """
+        기록이 끝난 위치까지 체크포인트를 전진시킨다.
+
+        Args:
+            checkpoint: 갱신할 체크포인트
+            next_start: 다음에 수집할 첫 row 번호
+            total: API list_total_count (모르면 None)
+        """
+        checkpoint.next_start = max(checkpoint.next_start, next_start)
+        if total is not None:
+            checkpoint.total = total
+        checkpoint.updated_at = datetime.utcnow()
+        self.db.commit()
+
+    def complete(self, checkpoint: SyncCheckpoint) -> None:
+        """
+        전체 수집이 끝난 체크포인트를 완료 처리한다.
+        """
+        checkpoint.status = "completed"
+        checkpoint.updated_at = datetime.utcnow()
+        self.db.commit()
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-from sqlalchemy.orm import Session
+from typing import Any, AsyncIterator, Dict
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
-from app.db.database import SessionLocal
+from app.db.database import AsyncSessionLocal
 from app.core.llm_client import get_chat_client
-from .graph import _compiled_chat_graph
+from .graph import _compiled_chat_graph, CACHED_REPLY_NODE, REPLY_NODES
+from .response_cache import response_cache
 from .types import ChatState, ChatResult
 
 
-async def generate_chat_reply(username: str, message: str) -> ChatResult:
+async def generate_chat_reply(username: str, message: str, bypass_cache: bool = False) -> ChatResult:
     get_chat_client() 
     
-    db: Session = SessionLocal()
+    db: AsyncSession = AsyncSessionLocal()
     try:
         current_date_str = date.today().isoformat()
         
@@ -20,14 +22,87 @@ async def generate_chat_reply(username: str, message: str) -> ChatResult:
             "message": message,
             "db": db,
             "current_date": current_date_str,
+            "bypass_cache": bypass_cache,
         }
         
         result_state = await _compiled_chat_graph.ainvoke(initial_state)
         return ChatResult(
             reply=result_state.get("reply", ""),
             related_event_ids=result_state.get("related_event_ids", []),
+            response_cache=result_state.get("response_cache"),
         )
     except RuntimeError as e:
         return ChatResult(reply=f"챗봇 시스템 오류: {e}", related_event_ids=[])
     finally:
-        db.close()
\ No newline at end of file
+        await db.close()
+
+
+async def stream_chat_reply(username: str, message: str, bypass_cache: bool = False) -> AsyncIterator[Dict[str, Any]]:
+    """
+    generate_chat_reply의 스트리밍 버전. 그래프 실행 중 다음 이벤트를 순서대로 yield 한다.
+      - {"event": "progress", "data": {"node": 노드 이름}}: 노드 시작
+      - {"event": "token", "data": {"text": ...}}: build_reply / handle_general_chat 답변 토큰
+      - {"event": "done", "data": {"reply": ..., "related_event_ids": [...], "response_cache": ...}}: 최종 결과 (메시지 저장 후)
+      - {"event": "error", "data": {"message": ...}}
+    """
+    try:
+        get_chat_client()
+    except RuntimeError as e:
+        yield {"event": "error", "data": {"message": f"챗봇 시스템 오류: {e}"}}
+        return
+
+    db: AsyncSession = AsyncSessionLocal()
+    try:
+        initial_state: ChatState = {
+            "username": username,
+            "message": message,
+            "db": db,
+            "current_date": date.today().isoformat(),
+            "bypass_cache": bypass_cache,
+        }
+
+        reply_result: Dict[str, Any] = {}
+        response_status = None
+        streamed = False
+
+        async for event in _compiled_chat_graph.astream_events(initial_state, version="v2"):
+            kind = event["event"]
+            node = event.get("metadata", {}).get("langgraph_node")
+
+            if kind == "on_chain_start" and node == event["name"]:
+                yield {"event": "progress", "data": {"node": node}}
+
+            elif kind == "on_chat_model_stream" and node in REPLY_NODES:
+                text = event["data"]["chunk"].content
+                if text:
+                    streamed = True
+                    yield {"event": "token", "data": {"text": text}}
+
+            elif kind == "on_chain_end" and node == event["name"] and node == CACHED_REPLY_NODE:
+                output = event["data"].get("output") or {}
+                response_status = output.get("response_cache")
+                # 캐시된 답변은 한 번에 보낸다 (이후 답변 생성 노드는 실행되지 않음)
+                if response_status == "hit":
+                    reply_result = {
+                        "reply": output.get("reply", ""),
+                        "related_event_ids": output.get("related_event_ids") or [],
+                    }
+                    yield {"event": "token", "data": {"text": reply_result["reply"]}}
+
+            elif kind == "on_chain_end" and node == event["name"] and node in REPLY_NODES:
+                output = event["data"].get("output") or {}
+                reply_result = {
+                    "reply": output.get("reply", ""),
+                    "related_event_ids": output.get("related_event_ids") or [],
+                }
+                # LLM 없이 만든 답변(추천 결과 없음 등)은 토큰이 없으므로 한 번에 보낸다
+                if not streamed and reply_result["reply"]:
+                    yield {"event": "token", "data": {"text": reply_result["reply"]}}
+
+        # 그래프는 save_messages까지 끝난 뒤 종료되므로 여기서는 메시지 저장이 완료된 상태
+        done = reply_result or {"reply": "", "related_event_ids": []}
+        yield {"event": "done", "data": {**done, "response_cache": response_status}}
+    except Exception as e:
+        yield {"event": "error", "data": {"message": f"챗봇 시스템 오류: {e}"}}
+    finally:
+        await db.close()
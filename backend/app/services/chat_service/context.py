@@ -0,0 +1,163 @@
+import math
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.prompts import ChatPromptTemplate
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
+from .similarity import cosine_similarity
+
+# 추천 후보 행사를 LLM 프롬프트용 텍스트로 만드는 builder.
+# 긴 필드(program, etc_desc 등)는 잘라내고, 후보를 질문과 가까운 순으로 정렬한 뒤 토큰 예산 안에서만 넣는다.
+# 행사별 문자열은 (id, content_hash, style) 기준으로 캐시해 요청마다 다시 만들지 않는다.
+
+# 스타일별 필드 최대 글자 수 (0이면 생략). select: 후보 고르기용 요약, reply: 최종 답변용 상세
+FIELD_LIMITS: Dict[str, Dict[str, int]] = {
+    "select": {"place": 60, "use_fee": 60, "inquiry": 0, "program": 120, "etc_desc": 60},
+    "reply": {"place": 100, "use_fee": 120, "inquiry": 60, "program": 300, "etc_desc": 200},
+}
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_HANGUL_RE = re.compile(r"[가-힣ㄱ-ㅎㅏ-ㅣ]")
+
+_snippet_cache: TTLCache[str] = TTLCache(max_entries=max(1, settings.EVENT_CACHE_SIZE) * 2, ttl_seconds=0)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토크나이저 없이 계산하는 토큰 수 추정치. 한글은 글자당 1토큰, 그 외는 4글자당 1토큰으로 (넉넉하게) 센다.
+    """
+    hangul = len(_HANGUL_RE.findall(text))
+    return hangul + math.ceil((len(text) - hangul) / 4)
+
+
+def _truncate(value: Any, limit: int) -> str:
+    text = _WHITESPACE_RE.sub(" ", str(value)).strip() if value is not None else ""
+    if len(text) <= limit:
+        return text
+    return text[:limit].rstrip() + "…"
+
+
+def _render(ev: Any, style: str) -> str:
+    limits = FIELD_LIMITS[style]
+    parts = [
+        f"- id={ev.id}, 제목: {ev.title}",
+        f"장소: {_truncate(ev.place, limits['place'])}",
+        f"기간: {ev.start_date} ~ {ev.end_date}",
+        f"분류: {ev.codename}",
+        f"요금: {_truncate(ev.use_fee, limits['use_fee'])}",
+    ]
+    for field, label in (("inquiry", "문의"), ("program", "프로그램"), ("etc_desc", "기타")):
+        if limits[field] > 0:
+            parts.append(f"{label}: {_truncate(getattr(ev, field), limits[field])}")
+    return ", ".join(parts)
+
+
+def render_event(ev: Any, style: str = "reply") -> str:
+    """
+    행사 한 건의 프롬프트용 문자열. content_hash가 있으면 캐시를 사용한다 (내용이 바뀌면 해시도 바뀜).
+    """
+    content_hash = getattr(ev, "content_hash", None)
+    if not content_hash:
+        return _render(ev, style)
+    key = (int(ev.id), content_hash, style)
+    snippet = _snippet_cache.get(key)
+    if snippet is None:
+        snippet = _render(ev, style)
+        _snippet_cache.set(key, snippet)
+    return snippet
+
+
+def rank_events(events: Sequence[Any], query_emb: Optional[Sequence[float]]) -> List[Any]:
+    """
+    질문 임베딩과의 코사인 유사도가 높은 순으로 정렬한다. 임베딩이 없는 행사는 원래 순서대로 뒤에 둔다.
+    """
+    if not query_emb:
+        return list(events)
+    scored = []
+    for order, ev in enumerate(events):
+        score = cosine_similarity(query_emb, getattr(ev, "embedding", None))
+        scored.append((score is None, -(score or 0.0), order, ev))
+    scored.sort(key=lambda item: item[:3])
+    return [item[3] for item in scored]
+
+
+def build_event_context(
+    events: Sequence[Any],
+    token_budget: int,
+    style: str = "reply",
+    query_emb: Optional[Sequence[float]] = None,
+) -> Tuple[str, List[Any], int]:
+    """
+    후보 행사를 정렬한 뒤 token_budget 안에 들어가는 만큼만 프롬프트 context로 만든다.
+
+    Args:
+        events: 후보 행사 목록
+        token_budget: context에 쓸 최대 토큰 수 (0 이하면 제한 없음). 첫 행사는 예산을 넘어도 항상 포함한다.
+        style: "select" | "reply" (FIELD_LIMITS 참고)
+        query_emb: 질문 임베딩 (있으면 유사도 순으로 정렬)
+
+    Returns:
+        (context, included_events, tokens): context 문자열, 실제로 넣은 행사, 추정 토큰 수
+    """
+    lines: List[str] = []
+    included: List[Any] = []
+    tokens = 0
+    for ev in rank_events(events, query_emb):
+        snippet = render_event(ev, style)
+        cost = estimate_tokens(snippet) + 1  # 줄바꿈
+        if included and token_budget > 0 and tokens + cost > token_budget:
+            break
+        lines.append(snippet)
+        included.append(ev)
+        tokens += cost
+
+    if not lines:
+        return "현재 추천 가능한 행사가 없습니다.", [], 0
+    return "\n".join(lines), included, tokens
+
+
+class PromptTokenStats:
+    """
+    노드별 프롬프트 토큰 수. estimated는 estimate_tokens 기준, actual은 LLM 응답의 usage_metadata (있을 때만)
+    """
+
+    def __init__(self) -> None:
+        self._nodes: Dict[str, Dict[str, int]] = {}
+
+    def record(self, node: str, estimated: int, actual: Optional[int] = None) -> None:
+        entry = self._nodes.setdefault(node, {"calls": 0, "estimated": 0, "actual": 0, "actual_calls": 0})
+        entry["calls"] += 1
+        entry["estimated"] += estimated
+        if actual is not None:
+            entry["actual"] += actual
+            entry["actual_calls"] += 1
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        return {
+            node: {
+                "calls": entry["calls"],
+                "avg_estimated": round(entry["estimated"] / entry["calls"], 1),
+                "avg_actual": round(entry["actual"] / entry["actual_calls"], 1) if entry["actual_calls"] else None,
+            }
+            for node, entry in self._nodes.items()
+        }
+
+
+prompt_token_stats = PromptTokenStats()
+
+
+def record_prompt_tokens(node: str, prompt: ChatPromptTemplate, inputs: Dict[str, Any], response: Any = None) -> int:
+    """
+    노드가 보낸 프롬프트의 토큰 수를 기록하고 로그로 남긴다.
+
+    Returns:
+        int: 추정 토큰 수
+    """
+    estimated = sum(estimate_tokens(str(message.content)) for message in prompt.format_messages(**inputs))
+    usage = getattr(response, "usage_metadata", None) or {}
+    actual = usage.get("input_tokens")
+    prompt_token_stats.record(node, estimated, actual)
+    print(f"✅ [Log] Prompt tokens ({node}): estimated={estimated}, actual={actual}")
+    return estimated
@@ -0,0 +1,248 @@
+import calendar
+import re
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from .types import DateRange
+
+# 한국어 상대 날짜 표현을 current_date 기준으로 바로 계산하는 규칙 기반 파서.
+# 자주 쓰는 표현("내일", "이번 주말", "다음 주", "12월 5일" 등)은 LLM 없이 처리하고,
+# 해석할 수 없는 날짜 표현이 남아 있으면 판단을 LLM에 넘긴다.
+
+_WEEK_OFFSETS = {"이번": 0, "금": 0, "다음": 1, "담": 1, "차": 1, "다다음": 2, "지난": -1, "저번": -1}
+_MONTH_OFFSETS = {"이번": 0, "이": 0, "다음": 1, "담": 1, "다다음": 2, "지난": -1, "저번": -1}
+_YEAR_OFFSETS = {"올해": 0, "금년": 0, "내년": 1, "작년": -1}
+_DAY_COUNTS = {"하루": 1, "이틀": 2, "사흘": 3, "나흘": 4, "닷새": 5, "엿새": 6, "이레": 7, "열흘": 10}
+_DAY_WORDS = {"오늘": 0, "금일": 0, "내일": 1, "명일": 1, "모레": 2, "내일모레": 2, "글피": 3, "어제": -1, "그제": -2}
+_WEEKDAYS = "월화수목금토일"
+
+# 한 글자 수식어(금/차)는 앞에 다른 한글이 없을 때만 인정한다 ("지금 주차장"의 "금 주" 등 오탐 방지)
+_WEEK_MOD = r"(?P<{name}>다다음|이번|다음|지난|저번|담|(?<![가-힣])금|(?<![가-힣])차)"
+
+_DATE_RE = re.compile(
+    "|".join([
+        r"(?P<iso>(?P<iso_y>\d{4})[-./](?P<iso_m>\d{1,2})[-./](?P<iso_d>\d{1,2}))",
+        # "12월 3~5일": 같은 달 안의 일자 범위 (ym 규칙이 "12월"만 가져가고 "3~"를 버리지 않도록 먼저 검사)
+        r"(?P<mdr>(?:(?P<mdr_y>\d{4})\s*년|(?P<mdr_yw>올해|금년|내년|작년))?\s*(?P<mdr_m>\d{1,2})\s*월\s*"
+        r"(?P<mdr_d1>\d{1,2})\s*일?\s*[~〜-]\s*(?P<mdr_d2>\d{1,2})\s*일)",
+        r"(?P<ymd>(?:(?P<ymd_y>\d{4})\s*년|(?P<ymd_yw>올해|금년|내년|작년))?\s*(?P<ymd_m>\d{1,2})\s*월\s*(?P<ymd_d>\d{1,2})\s*일)",
+        r"(?P<ym>(?:(?P<ym_y>\d{4})\s*년|(?P<ym_yw>올해|금년|내년|작년))?\s*(?P<ym_m>\d{1,2})\s*월)",
+        # "m/d"는 분수/비율("1/2 가격")과 구분되지 않으므로 기간 연결어와 붙어 있을 때만 날짜로 본다 (그 외는 LLM)
+        r"(?P<slash>(?:(?<=[~〜-])|(?<=[~〜-]\s))(?P<slash_m>\d{1,2})/(?P<slash_d>\d{1,2})(?![\d/])|"
+        r"(?<![\d/])(?P<slash_m2>\d{1,2})/(?P<slash_d2>\d{1,2})(?=\s*(?:~|〜|-|부터|까지)))",
+        r"(?P<after>(?:(?P<after_n>\d{1,3})\s*일|(?P<after_w>하루|이틀|사흘|나흘|닷새|엿새|이레|열흘))\s*(?:후|뒤))",
+        r"(?P<day>(?<!\d)(?P<day_d>\d{1,2})\s*일(?!\s*(?:간|동안|째)))",
+        r"(?P<weekday>(?:" + _WEEK_MOD.format(name="wd_mod") + r"\s*주\s*)?(?P<wd_day>[월화수목금토일])요일)",
+        r"(?P<weekend>(?:" + _WEEK_MOD.format(name="we_mod") + r"\s*(?:주\s*)?)?주\s*말)",
+        r"(?P<week>" + _WEEK_MOD.format(name="wk_mod") + r"\s*주(?![제년변소민식차]))",
+        r"(?P<month>(?P<mo_mod>다다음|이번|다음|지난|저번|담|(?<![가-힣])이)\s*달(?!리))",
+        r"(?P<word>내일모레|오늘|금일|내일|명일|모레|글피|어제|그제)",
+    ])
+)
+
+# 위 규칙으로 처리하지 못했을 때 남아 있으면 "날짜 표현이 있다"고 보는 단어들 (-> LLM으로 넘김)
+_DATE_HINT_RE = re.compile(
+    r"\d+\s*(?:일|월|주|년|박)|\d{1,2}[./]\d{1,2}|오늘|내일|모레|글피|어제|그제|주말|평일|요일|"
+    r"이번\s*주|다음\s*주|지난\s*주|담주|금주|차주|이번\s*달(?!리)|다음\s*달(?!리)|이달(?!리)|"
+    r"연말|연초|연휴|크리스마스|성탄|설날|추석|방학|새해|올해|내년|작년|월말|월초|초순|중순|하순|"
+    r"봄|여름|가을|겨울|언제까지|며칠|이틀|사흘|나흘|닷새|엿새|이레|열흘|"
+    # 요일 나열 ("토,일 공연", "금/토", "토일") -> 규칙으로 계산하지 않고 LLM에 맡긴다
+    r"(?<![가-힣])[월화수목금토일](?:\s*[,/·]\s*[월화수목금토일])+(?![가-힣])|(?<![가-힣])(?:금토일|토일|금토)(?![가-힣])|"
+    # 규칙이 처리하지 못한 채 기간 연결어에 붙어 남은 숫자 ("3~", "~5")
+    r"\d\s*[~〜-]|[~〜-]\s*\d"
+)
+
+# 연결어: 두 날짜 사이에 있으면 기간으로 본다 (예: "5일부터 7일까지", "12/5~12/7")
+_RANGE_JOINERS = re.compile(r"^\s*(?:부터|에서|~|-|〜)\s*$")
+
+DateSpan = Tuple[date, date]
+
+
+class DateParserStats:
+    """
+    규칙 기반 날짜 파서의 처리 결과 카운터 (fast path 적중률 확인용)
+    """
+
+    def __init__(self) -> None:
+        self.rule_hits = 0    # 규칙으로 기간을 계산함
+        self.no_date = 0      # 날짜 표현이 없다고 판단함 (LLM 호출 생략)
+        self.llm_fallbacks = 0
+
+    def record(self, decided: bool, date_range: Optional[DateRange]) -> None:
+        if not decided:
+            self.llm_fallbacks += 1
+        elif date_range is None:
+            self.no_date += 1
+        else:
+            self.rule_hits += 1
+
+    def as_dict(self) -> Dict[str, float]:
+        total = self.rule_hits + self.no_date + self.llm_fallbacks
+        fast = self.rule_hits + self.no_date
+        return {
+            "rule_hits": self.rule_hits,
+            "no_date": self.no_date,
+            "llm_fallbacks": self.llm_fallbacks,
+            "fast_path_ratio": round(fast / total, 4) if total else 0.0,
+        }
+
+
+date_parser_stats = DateParserStats()
+
+
+def _month_range(year: int, month: int) -> DateSpan:
+    year += (month - 1) // 12
+    month = (month - 1) % 12 + 1
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+
+def _year_for(match: re.Match, prefix: str, month: int, today: date) -> int:
+    """
+    연도가 없으면 올해, 단 이미 지난 달이면 내년으로 본다.
+    """
+    if match.group(f"{prefix}_y"):
+        return int(match.group(f"{prefix}_y"))
+    if match.group(f"{prefix}_yw"):
+        return today.year + _YEAR_OFFSETS[match.group(f"{prefix}_yw")]
+    return today.year + 1 if month < today.month else today.year
+
+
+def _resolve(
+    match: re.Match, today: date, context_month: Optional[Tuple[int, int]], week_mod: Optional[str] = None,
+) -> Optional[DateSpan]:
+    """
+    week_mod: 기간의 뒤쪽 요일에 이어받을 앞쪽 요일의 주 수식어 ("다음주 월요일부터 수요일까지"의 "다음")
+    """
+    kind = match.lastgroup
+    monday = today - timedelta(days=today.weekday())
+
+    if kind == "iso":
+        day = date(int(match.group("iso_y")), int(match.group("iso_m")), int(match.group("iso_d")))
+        return day, day
+
+    if kind == "mdr":
+        month = int(match.group("mdr_m"))
+        year = _year_for(match, "mdr", month, today)
+        start = date(year, month, int(match.group("mdr_d1")))
+        end = date(year, month, int(match.group("mdr_d2")))
+        return (start, end) if start <= end else None
+
+    if kind == "ymd":
+        month = int(match.group("ymd_m"))
+        day = date(_year_for(match, "ymd", month, today), month, int(match.group("ymd_d")))
+        return day, day
+
+    if kind == "ym":
+        month = int(match.group("ym_m"))
+        if not 1 <= month <= 12:
+            return None
+        return _month_range(_year_for(match, "ym", month, today), month)
+
+    if kind == "slash":
+        month = int(match.group("slash_m") or match.group("slash_m2"))
+        day_of_month = int(match.group("slash_d") or match.group("slash_d2"))
+        year = today.year + 1 if month < today.month else today.year
+        day = date(year, month, day_of_month)
+        return day, day
+
+    if kind == "after":
+        days = int(match.group("after_n")) if match.group("after_n") else _DAY_COUNTS[match.group("after_w")]
+        day = today + timedelta(days=days)
+        return day, day
+
+    if kind == "day":
+        # "7일"처럼 월이 없으면 앞에서 언급한 달 기준으로만 해석한다 (없으면 LLM에 맡김)
+        if context_month is None:
+            return None
+        day = date(context_month[0], context_month[1], int(match.group("day_d")))
+        return day, day
+
+    if kind == "weekday":
+        weekday = _WEEKDAYS.index(match.group("wd_day"))
+        modifier = match.group("wd_mod") or week_mod
+        if modifier:
+            day = monday + timedelta(weeks=_WEEK_OFFSETS[modifier], days=weekday)
+        else:
+            day = today + timedelta(days=(weekday - today.weekday()) % 7)
+        return day, day
+
+    if kind == "weekend":
+        offset = _WEEK_OFFSETS[match.group("we_mod")] if match.group("we_mod") else 0
+        saturday = monday + timedelta(weeks=offset, days=5)
+        return max(saturday, today) if offset == 0 else saturday, saturday + timedelta(days=1)
+
+    if kind == "week":
+        offset = _WEEK_OFFSETS[match.group("wk_mod")]
+        start = monday + timedelta(weeks=offset)
+        return max(start, today) if offset == 0 else start, start + timedelta(days=6)
+
+    if kind == "month":
+        offset = _MONTH_OFFSETS[match.group("mo_mod")]
+        start, end = _month_range(today.year, today.month + offset)
+        return max(start, today) if offset == 0 else start, end
+
+    if kind == "word":
+        day = today + timedelta(days=_DAY_WORDS[match.group("word")])
+        return day, day
+
+    return None
+
+
+def resolve_date_range(message: str, current_date: str) -> Tuple[bool, Optional[DateRange]]:
+    """
+    질문에서 검색 기간을 규칙으로 계산한다.
+
+    Args:
+        message: 사용자 질문
+        current_date: 기준 날짜 (YYYY-MM-DD)
+
+    Returns:
+        (decided, date_range)
+        - (True, DateRange): 규칙으로 기간을 계산함
+        - (True, None): 날짜 표현이 없음
+        - (False, None): 해석할 수 없는 날짜 표현이 있음 -> LLM으로 추출해야 함
+    """
+    today = date.fromisoformat(current_date)
+    spans: List[DateSpan] = []
+    leftover: List[str] = []
+    context_month: Optional[Tuple[int, int]] = None
+    week_mod: Optional[str] = None
+    cursor = 0
+
+    try:
+        for match in _DATE_RE.finditer(message):
+            between = message[cursor:match.start()]
+            joined = bool(spans) and bool(_RANGE_JOINERS.match(between or " "))
+
+            span = _resolve(match, today, context_month, week_mod if joined else None)
+            if span is None:
+                return False, None
+
+            if joined:
+                # "A부터 B까지" / "A~B": 앞 날짜부터 뒤 날짜까지 하나의 기간으로 합친다
+                if span[1] < spans[-1][0]:
+                    # 끝이 시작보다 앞서면 해석이 잘못된 것이므로 LLM에 맡긴다
+                    return False, None
+                spans[-1] = (spans[-1][0], max(span[1], spans[-1][1]))
+            else:
+                leftover.append(between)
+                spans.append(span)
+
+            if match.lastgroup in ("iso", "mdr", "ymd", "ym", "slash"):
+                context_month = (span[0].year, span[0].month)
+            week_mod = match.group("wd_mod") if match.lastgroup == "weekday" else None
+            cursor = match.end()
+    except ValueError:
+        # 2월 30일처럼 존재하지 않는 날짜
+        return False, None
+
+    leftover.append(message[cursor:])
+    if any(_DATE_HINT_RE.search(text) for text in leftover):
+        return False, None
+
+    if not spans:
+        return True, None
+
+    start = min(s for s, _ in spans)
+    end = max(e for _, e in spans)
+    return True, DateRange(start_date=start.isoformat(), end_date=end.isoformat())
@@ -0,0 +1,53 @@
+import re
+from typing import List
+
+from .types import EventFilters
+
+SEOUL_GU_NAMES = (
+    "강남구", "강동구", "강북구", "강서구", "관악구", "광진구", "구로구", "금천구", "노원구",
+    "도봉구", "동대문구", "동작구", "마포구", "서대문구", "서초구", "성동구", "성북구", "송파구",
+    "양천구", "영등포구", "용산구", "은평구", "종로구", "중구", "중랑구",
+)
+
+# 긴 이름부터 비교해야 "동대문구"가 "대문구" 등으로 잘못 잡히지 않는다
+_GU_RE = re.compile("|".join(sorted(SEOUL_GU_NAMES, key=len, reverse=True)))
+
+# 질문 키워드 -> 분류(codename) 접두어
+CODENAME_KEYWORDS = {
+    "뮤지컬/오페라": ("뮤지컬", "오페라"),
+    "콘서트": ("콘서트",),
+    "클래식": ("클래식", "오케스트라", "교향악"),
+    "국악": ("국악",),
+    "연극": ("연극",),
+    "영화": ("영화",),
+    "전시/미술": ("전시", "미술"),
+    "무용": ("무용", "발레"),
+    "교육/체험": ("체험", "교육", "강좌"),
+    "독주/독창회": ("독주", "독창회", "리사이틀"),
+    "축제": ("축제", "페스티벌"),
+}
+
+
+def extract_event_filters(message: str) -> EventFilters:
+    """
+    질문에서 자치구/분류/유무료 조건을 규칙 기반으로 추출한다. (LLM 호출 없음)
+    분류 키워드가 여러 개 잡히면 의도가 모호하므로 분류 필터는 걸지 않는다.
+    """
+    gu_match = _GU_RE.search(message)
+
+    codenames: List[str] = [
+        codename for codename, keywords in CODENAME_KEYWORDS.items()
+        if any(keyword in message for keyword in keywords)
+    ]
+
+    is_free = None
+    if "무료" in message:
+        is_free = "무료"
+    elif "유료" in message:
+        is_free = "유료"
+
+    return EventFilters(
+        gu_name=gu_match.group(0) if gu_match else None,
+        codename=codenames[0] if len(codenames) == 1 else None,
+        is_free=is_free,
+    )
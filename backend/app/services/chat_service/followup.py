@@ -0,0 +1,105 @@
+from typing import Dict, Optional, Sequence
+
+from app.core.config import settings
+from .date_parser import resolve_date_range
+from .filters import extract_event_filters
+from .similarity import cosine_similarity, max_cosine_similarity
+
+# 이전 추천을 가리키는 표현. 이런 표현이 있으면 임베딩 유사도가 낮아도 "새 질문"으로 단정하지 않는다.
+REFERENCE_MARKERS = (
+    "그거", "그것", "그곳", "거기", "그 행사", "그 축제", "그 공연", "그 전시", "그중", "그 중",
+    "이거", "이것", "저거", "방금", "아까", "위에", "첫 번째", "첫번째", "두 번째", "두번째", "세 번째", "세번째",
+    "마지막", "추천해준", "추천한", "말한",
+)
+
+
+class FollowupStats:
+    """
+    꼬리 질문 판단 카운터 (로컬 판단 비율 확인용)
+    """
+
+    def __init__(self) -> None:
+        self.local_followup = 0
+        self.local_new = 0
+        self.llm = 0
+
+    def as_dict(self) -> Dict[str, float]:
+        total = self.local_followup + self.local_new + self.llm
+        local = self.local_followup + self.local_new
+        return {
+            "local_followup": self.local_followup,
+            "local_new": self.local_new,
+            "llm": self.llm,
+            "local_ratio": round(local / total, 4) if total else 0.0,
+        }
+
+
+followup_stats = FollowupStats()
+
+
+def _same_conditions(message: str, prev_message: Optional[str], current_date: str) -> bool:
+    """
+    현재 질문에 적힌 검색 조건(자치구/분류/유무료, 날짜 범위)이 이전 질문의 조건과 같은지.
+    조건을 적지 않은 항목은 이전 조건을 이어받는 것으로 본다. ("그거 몇 시에 해?")
+    "다음 주말은?", "송파구는?"처럼 질문은 비슷해도 조건이 바뀌면 새 검색이 필요하므로 False.
+    """
+    if prev_message is None:
+        return False
+
+    filters = extract_event_filters(message).model_dump()
+    prev_filters = extract_event_filters(prev_message).model_dump()
+    if any(value is not None and value != prev_filters[key] for key, value in filters.items()):
+        return False
+
+    decided, date_range = resolve_date_range(message, current_date)
+    if not decided:
+        return False  # 규칙으로 해석할 수 없는 날짜 표현 -> 비교 불가
+    if date_range is None:
+        return True
+    prev_decided, prev_range = resolve_date_range(prev_message, current_date)
+    return prev_decided and prev_range == date_range
+
+
+def decide_followup_locally(
+    message: str,
+    current_date: str,
+    prev_message: Optional[str],
+    query_emb: Optional[Sequence[float]],
+    prev_user_emb: Optional[Sequence[float]],
+    prev_event_embs: Sequence[Sequence[float]],
+) -> tuple[Optional[bool], Optional[float], Optional[float]]:
+    """
+    현재 질문 임베딩을 이전 질문 / 이전 추천 행사 임베딩과 비교해 꼬리 질문 여부를 판단한다.
+    질문-질문(query-query)과 질문-행사 본문(query-passage)은 유사도 분포가 달라 임계값을 따로 쓴다.
+
+    Returns:
+        (is_followup, question_score, event_score)
+        - is_followup:
+          - True: 이전 질문(FOLLOWUP_SIM_HIGH) 또는 이전 추천 행사(FOLLOWUP_EVENT_SIM_HIGH)와 충분히 가깝고
+            검색 조건(필터, 날짜 범위)도 이전 질문과 같을 때
+          - False: 이전 질문/행사 모두와 LOW 임계값 이하이고 이전 추천을 가리키는 표현이 없을 때
+          - None: 그 외 (애매한 구간, 조건이 바뀐 경우, 비교할 임베딩이 없는 경우 -> LLM으로 판단)
+        - question_score: 이전 질문과의 코사인 유사도
+        - event_score: 이전 추천 행사와의 최대 코사인 유사도
+    """
+    question_score = cosine_similarity(query_emb, prev_user_emb)
+    event_score = max_cosine_similarity(query_emb, [v for v in prev_event_embs if v is not None and len(v)])
+    if question_score is None and event_score is None:
+        return None, None, None
+
+    close = (
+        (question_score is not None and question_score >= settings.FOLLOWUP_SIM_HIGH)
+        or (event_score is not None and event_score >= settings.FOLLOWUP_EVENT_SIM_HIGH)
+    )
+    if close:
+        if _same_conditions(message, prev_message, current_date):
+            return True, question_score, event_score
+        return None, question_score, event_score
+
+    far = (
+        (question_score is None or question_score <= settings.FOLLOWUP_SIM_LOW)
+        and (event_score is None or event_score <= settings.FOLLOWUP_EVENT_SIM_LOW)
+    )
+    if far and not any(marker in message for marker in REFERENCE_MARKERS):
+        return False, question_score, event_score
+    return None, question_score, event_score
@@ -1,7 +1,5 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import case
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph, START, END
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 
@@ -14,87 +12,71 @@ from .prompts import (
     RECOMMENDATION_SELECTION_PROMPT,
     DATE_EXTRACTION_PROMPT
 )
-from .types import ChatState, DateRange
+from .types import ChatState, DateRange, EventFilters
+from .context import build_event_context, record_prompt_tokens
+from .filters import extract_event_filters
+from .date_parser import date_parser_stats, resolve_date_range
+from .followup import decide_followup_locally, followup_stats
+from .intent import classify_intent_locally, intent_stats
+from .response_cache import cache_scope, response_cache
+from app.core.config import settings
 from app.entity.seoul_event_entity import SeoulEvent
-from app.entity.conversation_entity import Conversation
-from app.entity.message_entity import Message
-from app.repository.seoul_event_repo import SeoulEventRepository
+from app.repository.conversation_repo import AsyncConversationRepository
+from app.repository.seoul_event_repo import AsyncSeoulEventRepository
 from datetime import datetime
-
-
-def _build_context_from_events(events: List[SeoulEvent]) -> str:
-    lines: List[str] = []
-    for ev in events:
-        lines.append(
-            f"- id={ev.id}, 제목: {ev.title}, 장소: {ev.place}, 기간: {ev.start_date} ~ {ev.end_date}, 분류: {ev.codename}"
-            f", 요금: {ev.use_fee}, 문의: {ev.inquiry}"
-            f", 프로그램: {ev.program}, 기타: {ev.etc_desc}"
-        )
-    if not lines:
-        return "현재 추천 가능한 행사가 없습니다."
-    return "\n".join(lines)
+import time
 
 
 # ---------- LangGraph Node Functions ----------
 
-def _node_load_conversation(state: ChatState) -> ChatState:
-    db = state["db"]
-    username = state["username"]
-    
-    convo: Optional[Conversation] = (
-        db.query(Conversation)
-        .filter(Conversation.username == username)
-        .order_by(Conversation.updated_at.desc())
-        .first()
-    )
-    if not convo:
-        convo = Conversation(username=username)
-        db.add(convo)
-        db.commit()
-        db.refresh(convo)
-
-    last_turn: int = db.query(Message.turn).filter(Message.conversation_id == convo.id).order_by(Message.turn.desc()).limit(1).scalar() or 0
-    
-    last_user_msg: Optional[Message] = (
-        db.query(Message).filter(Message.conversation_id == convo.id, Message.role == "user")
-        .order_by(Message.turn.desc()).first()
-    )
-    prev_user_emb: List[float] = last_user_msg.embedding if last_user_msg and last_user_msg.embedding else []
-
-    last_assistant: Optional[Message] = (
-        db.query(Message).filter(Message.conversation_id == convo.id, Message.role == "assistant")
-        .order_by(Message.turn.desc()).first()
-    )
-    prev_event_ids: List[int] = (
-        [int(x) for x in last_assistant.related_event_ids] 
-        if last_assistant and last_assistant.related_event_ids 
-        else []
-    )
+async def _node_load_conversation(state: ChatState) -> ChatState:
+    # 병렬 단계에서 DB 세션을 쓰는 노드는 이것 하나뿐이다 (AsyncSession은 동시 사용 불가)
+    # 대화 / 마지막 turn / 이전 질문 임베딩 / 이전 추천 행사를 한 번의 쿼리로 조회 (대화가 없으면 저장할 때 만든다)
+    context = await AsyncConversationRepository(state["db"]).load_context(state["username"])
     
+    # 병렬 단계에서 실행되므로 자신이 만든 값만 반환한다 (LangGraph가 state에 병합)
     return {
-        **state,
-        "convo": convo,
-        "last_turn": last_turn,
-        "prev_user_emb": prev_user_emb,
-        "prev_event_ids": prev_event_ids,
+        "conversation_id": context.conversation_id,
+        "last_turn": context.last_turn,
+        "prev_user_message": context.prev_user_message,
+        "prev_user_emb": context.prev_user_emb,
+        "prev_event_ids": context.prev_event_ids,
     }
 
 
 async def _node_embed_question(state: ChatState) -> ChatState:
     client = get_chat_client() 
     query_emb = await client.embedding_service.query_embedding(state["message"])
-    return {**state, "query_emb": query_emb or []}
+    query_cache = client.embedding_service.query_cache
+    if query_cache is not None:
+        print(f"✅ [Log] Query Embedding Cache: {query_cache.stats()}")
+    return {"query_emb": query_emb or []}
 
 
 async def _node_classify_intent(state: ChatState) -> ChatState:
     client = get_chat_client() 
+
+    # 1. 키워드 사전 / 질문 임베딩 centroid로 확실한 경우는 로컬에서 분류
+    intent, method = await classify_intent_locally(state["message"], client.embedding_service)
+    if intent:
+        if method == "keyword":
+            intent_stats.keyword += 1
+        else:
+            intent_stats.centroid += 1
+        print(f"✅ [Log] Intent Classified ({method}): {intent}. Stats: {intent_stats.as_dict()}")
+        return {"intent": intent}
+
+    # 2. 불확실한 경우만 LLM으로 분류
     prompt = ChatPromptTemplate.from_messages([
         ("system", INTENT_CLASSIFICATION_PROMPT),
         ("user", "질문: {query}")
     ])
     chain = prompt | client.chat_llm
     
+    started = time.perf_counter()
     response = await chain.ainvoke({"query": state["message"]})
+    intent_stats.record_llm(time.perf_counter() - started)
+    record_prompt_tokens("classify_intent", prompt, {"query": state["message"]}, response)
     
     intent_raw = response.content.strip().lower()
     
@@ -103,9 +85,9 @@ async def _node_classify_intent(state: ChatState) -> ChatState:
     else:
         intent = "general"
         
-    print(f"✅ [Log] Intent Classified: {intent}")
+    print(f"✅ [Log] Intent Classified (llm): {intent}. Stats: {intent_stats.as_dict()}")
     
-    return {**state, "intent": intent}
+    return {"intent": intent}
 
 
 async def _node_decide_followup(state: ChatState) -> ChatState:
@@ -116,6 +98,25 @@ async def _node_decide_followup(state: ChatState) -> ChatState:
         print(f"✅ [Log] Follow-up Check: False (No previous recommended IDs)")
         return {**state, "is_followup": False}
 
+    # 1. 임베딩 유사도 + 검색 조건 비교로 확실한 경우는 로컬에서 판단 (이전 질문 + 이전 추천 행사와 비교)
+    prev_event_embs = list((await AsyncSeoulEventRepository(state["db"]).get_embeddings_by_ids(prev_ids)).values())
+    is_followup, question_score, event_score = decide_followup_locally(
+        state["message"], state["current_date"], state.get("prev_user_message"),
+        state.get("query_emb"), state.get("prev_user_emb"), prev_event_embs,
+    )
+    if is_followup is not None:
+        if is_followup:
+            followup_stats.local_followup += 1
+        else:
+            followup_stats.local_new += 1
+        print(
+            f"✅ [Log] Follow-up Check (embedding): {is_followup}. "
+            f"Similarity: question={question_score}, events={event_score}. Stats: {followup_stats.as_dict()}"
+        )
+        return {**state, "is_followup": is_followup}
+
+    # 2. 애매한 구간만 LLM으로 판단
+    followup_stats.llm += 1
     context = f"이전 추천 이벤트 ID 목록: {prev_ids}"
     
     prompt = ChatPromptTemplate.from_messages([
@@ -130,18 +131,29 @@ async def _node_decide_followup(state: ChatState) -> ChatState:
     chain = prompt | client.chat_llm
     
     response = await chain.ainvoke({"context": context, "message": state['message']}) 
+    record_prompt_tokens("decide_followup", prompt, {}, response)
     
     followup_raw = response.content.strip().lower()
     is_followup = 'follow-up' in followup_raw
         
-    print(f"✅ [Log] Follow-up Check (LLM): {is_followup}. LLM Response: {followup_raw}")
+    print(f"✅ [Log] Follow-up Check (LLM): {is_followup}. Similarity: question={question_score}, events={event_score}. LLM Response: {followup_raw}")
     
     return {**state, "is_followup": is_followup}
 
 
 async def _node_extract_date_filter(state: ChatState) -> ChatState:
-    client = get_chat_client()
     current_date = state["current_date"]
+
+    # 1. 규칙 기반 파서로 먼저 해석 ("내일", "이번 주말", "12월 5일" 등은 LLM 호출 없이 처리)
+    decided, date_range_filter = resolve_date_range(state["message"], current_date)
+    date_parser_stats.record(decided, date_range_filter)
+    if decided:
+        result = date_range_filter.model_dump_json() if date_range_filter else "No date expression"
+        print(f"✅ [Log] Date Extraction (rule): {result}. Stats: {date_parser_stats.as_dict()}")
+        return {"date_range_filter": date_range_filter}
+
+    # 2. 규칙으로 판단할 수 없는 표현만 LLM으로 추출
+    client = get_chat_client()
     
     prompt = ChatPromptTemplate.from_messages([
         ("system", DATE_EXTRACTION_PROMPT.format(current_date=current_date)),
@@ -150,9 +162,9 @@ async def _node_extract_date_filter(state: ChatState) -> ChatState:
     
     chain = prompt | client.chat_llm | JsonOutputParser(pydantic_object=DateRange)
     
-    date_range_filter: Optional[DateRange] = None
     try:
         response = await chain.ainvoke({"query": state["message"]})
+        record_prompt_tokens("extract_date_filter", prompt, {"query": state["message"]})
         
         date_range_filter = DateRange(**response) 
         
@@ -166,50 +178,91 @@ async def _node_extract_date_filter(state: ChatState) -> ChatState:
         print(f"❌ [Log] Date Extraction Failed: {e}. Falling back to no date filter.")
         date_range_filter = None
         
-    return {**state, "date_range_filter": date_range_filter}
+    return {"date_range_filter": date_range_filter}
+
+
+async def _node_lookup_response_cache(state: ChatState) -> ChatState:
+    # 꼬리 질문이 아닌 질문은 같은 검색 조건의 비슷한 이전 질문 답변을 재사용한다 (행사 검색 + LLM 2회 생략)
+    event_filters = extract_event_filters(state["message"])
+    result = {"event_filters": event_filters, "response_cache": "miss"}
+
+    if not response_cache.enabled:
+        bypass_reason = "disabled"
+    elif state.get("bypass_cache"):
+        bypass_reason = "request"
+    elif state.get("is_followup"):
+        bypass_reason = "followup"
+    elif not state.get("query_emb"):
+        bypass_reason = "no_embedding"
+    else:
+        bypass_reason = None
+    if bypass_reason:
+        response_cache.record_bypass(bypass_reason)
+        print(f"✅ [Log] Response Cache: bypass ({bypass_reason})")
+        return {**result, "response_cache": "bypass"}
+
+    # 날짜가 바뀌었거나 행사 카탈로그가 갱신되었으면 캐시를 비운다
+    response_cache.set_day(state["current_date"])
+    if response_cache.catalog_check_due():
+        watermark = await AsyncSeoulEventRepository(state["db"]).get_catalog_watermark()
+        response_cache.set_catalog_watermark(watermark)
+
+    scope = cache_scope(state.get("date_range_filter"), event_filters)
+    entry, score = response_cache.lookup(state["query_emb"], scope)
+    if entry is None:
+        print(f"✅ [Log] Response Cache: miss. Best similarity: {score:.3f}. Stats: {response_cache.stats()}")
+        return result
+
+    print(f"✅ [Log] Response Cache: hit. Similarity: {score:.3f}. Related IDs: {entry.related_event_ids}. Stats: {response_cache.stats()}")
+    return {
+        **result,
+        "response_cache": "hit",
+        "reply": entry.reply,
+        "related_event_ids": list(entry.related_event_ids),
+    }
 
 
-def _node_fetch_events(state: ChatState) -> ChatState:
-    db = state["db"]
-    repo = SeoulEventRepository(db) 
+async def _node_fetch_events(state: ChatState) -> ChatState:
+    repo = AsyncSeoulEventRepository(state["db"])
     events: List[SeoulEvent] = []
+    event_filters: Optional[EventFilters] = None
     
     # 1. 꼬리 질문일 경우: 기존 추천 이벤트 재활용 (SQL ID IN 검색)
     if state.get("is_followup") and state.get("prev_event_ids"):
         ids = [int(x) for x in state["prev_event_ids"]]
-        ordering = case({id_: idx for idx, id_ in enumerate(ids)}, value=SeoulEvent.id)
-        events = (
-            db.query(SeoulEvent)
-            .filter(SeoulEvent.id.in_(ids))
-            .order_by(ordering)
-            .all()
-        )
+        events = await repo.find_by_ids_ordered(ids)
         print(f"✅ [Log] Follow-up detected. Reusing {len(events)} previous events.")
     
-    # 2. 새로운 질문일 경우: 날짜 필터링을 우선 적용 (SQL 검색)
-    elif state.get("date_range_filter"):
-        date_filter: DateRange = state["date_range_filter"]
-        
-        try:
-             events = repo.find_events_by_date_range(
-                 start_date_str=date_filter.start_date, 
-                 end_date_str=date_filter.end_date
-             )
-             print(f"✅ [Log] Date search executed using SQL filter. Found {len(events)} events.")
-        except AttributeError:
-             print("❌ [Log] SeoulEventRepository에 find_events_by_date_range 메서드가 필요합니다. (Vector Search로 대체)")
-             pass 
+    # 2. 새로운 질문일 경우: 날짜/자치구/분류/유무료 필터 + 벡터 거리 정렬을 한 번의 SQL로 검색
+    else:
+        date_filter: Optional[DateRange] = state.get("date_range_filter")
+        event_filters = state.get("event_filters") or extract_event_filters(state["message"])
+        events = await repo.search_events_hybrid(
+            query_vector=state.get("query_emb"),
+            start_date=date_filter.start_date if date_filter else None,
+            end_date=date_filter.end_date if date_filter else None,
+            gu_name=event_filters.gu_name,
+            codename=event_filters.codename,
+            is_free=event_filters.is_free,
+            top_k=settings.CHAT_EVENT_TOP_K,
+            max_distance=settings.CHAT_EVENT_MAX_DISTANCE or None,
+        )
+        print(f"✅ [Log] Hybrid search executed. Filters: {event_filters.model_dump_json()}. Found {len(events)} events.")
              
-    # 3. 모든 이전 단계에서 이벤트 검색에 실패했거나, 날짜 정보가 없을 경우: 벡터 검색
-    if not events and state.get("query_emb"):
-        events = repo.search_similar_events(
-            db=db, 
+    # 3. 날짜/필터 조건이 전혀 없는 새 질문에서 검색에 실패했을 경우에만 필터 없이 벡터 검색
+    #    (조건이 있는 질문은 그 범위 밖의 행사를 추천하지 않는다)
+    has_conditions = bool(state.get("date_range_filter")) or bool(
+        event_filters and (event_filters.gu_name or event_filters.codename or event_filters.is_free)
+    )
+    if not events and state.get("query_emb") and not state.get("is_followup") and not has_conditions:
+        events = await repo.search_similar_events(
             query_vector=state["query_emb"], 
             top_k=5 
         )
         print(f"✅ [Log] Vector search executed using pgvector. Found {len(events)} events.")
         
-    return {**state, "events": events}
+    event_map = {int(ev.id): ev for ev in events}
+    return {**state, "events": events, "event_map": event_map, "event_filters": event_filters}
 
 
 async def _node_select_recommendations(state: ChatState) -> ChatState:
@@ -221,7 +274,11 @@ async def _node_select_recommendations(state: ChatState) -> ChatState:
         print("❌ [Log] No events to select from.")
         return {**state, "selected_event_ids": []}
 
-    context = _build_context_from_events(events)
+    # 질문과 가까운 순으로 정렬해 토큰 예산 안에 들어가는 후보만 요약 형태로 넣는다
+    context, events, context_tokens = build_event_context(
+        events, settings.PROMPT_SELECT_TOKEN_BUDGET, style="select", query_emb=state.get("query_emb"),
+    )
+    print(f"✅ [Log] Selection context: {len(events)} events, ~{context_tokens} tokens")
     
     system_content = RECOMMENDATION_SELECTION_PROMPT.format(current_date=current_date)
     
@@ -235,6 +292,7 @@ async def _node_select_recommendations(state: ChatState) -> ChatState:
     chain = prompt | client.chat_llm
 
     resp = await chain.ainvoke({}) 
+    record_prompt_tokens("select_recommendations", prompt, {}, resp)
     
     selected_ids_raw = resp.content.strip()
     selected_event_ids: List[int] = []
@@ -262,6 +320,7 @@ async def _node_handle_general_chat(state: ChatState) -> ChatState:
     chain = prompt | client.chat_llm
     
     resp = await chain.ainvoke({"query": state["message"]})
+    record_prompt_tokens("handle_general_chat", prompt, {"query": state["message"]}, resp)
     
     print(f"✅ [Log] Handled General Chat.")
     return {**state, "reply": resp.content, "related_event_ids": []}
@@ -272,18 +331,13 @@ async def _node_build_reply(state: ChatState) -> ChatState:
     
     selected_event_ids: List[int] = state.get("selected_event_ids") or []
     
-    db = state["db"]
-    
-    if selected_event_ids:
-        ordering = case({id_: idx for idx, id_ in enumerate(selected_event_ids)}, value=SeoulEvent.id)
-        selected_events = (
-            db.query(SeoulEvent)
-            .filter(SeoulEvent.id.in_(selected_event_ids))
-            .order_by(ordering)
-            .all()
-        )
-    else:
-        selected_events = []
+    # fetch_events에서 이미 읽은 행사를 그대로 사용한다 (없는 id만 조회)
+    event_map = state.get("event_map") or {}
+    missing_ids = [id_ for id_ in selected_event_ids if id_ not in event_map]
+    if missing_ids:
+        loaded = await AsyncSeoulEventRepository(state["db"]).find_by_ids_ordered(missing_ids)
+        event_map = {**event_map, **{int(ev.id): ev for ev in loaded}}
+    selected_events = [event_map[id_] for id_ in selected_event_ids if id_ in event_map]
     
     if not selected_events:
         return {
@@ -292,7 +346,9 @@ async def _node_build_reply(state: ChatState) -> ChatState:
             "related_event_ids": [],
         }
 
-    context = _build_context_from_events(selected_events)
+    # 추천 순서(선택 순서)를 유지한 채 토큰 예산 안에서 상세 형태로 넣는다
+    # 예산 때문에 빠진 행사는 답변에 언급되지 않으므로 related_event_ids(꼬리 질문 대상)에도 넣지 않는다
+    context, included_events, _ = build_event_context(selected_events, settings.PROMPT_REPLY_TOKEN_BUDGET, style="reply")
     current_date = state["current_date"]
     system_content = SYSTEM_PROMPT.format(current_date=current_date)
     
@@ -309,67 +365,84 @@ async def _node_build_reply(state: ChatState) -> ChatState:
     chain = prompt | client.chat_llm
 
     resp = await chain.ainvoke({}) 
+    record_prompt_tokens("build_reply", prompt, {}, resp)
     
-    related_ids = selected_event_ids
+    related_ids = [int(ev.id) for ev in included_events]
     print(f"✅ [Log] Final Reply Built. Related IDs: {related_ids}")
     
     return {**state, "reply": resp.content, "related_event_ids": related_ids}
 
 
-def _node_save_messages(state: ChatState) -> ChatState:
-    db = state["db"]
-    convo = state["convo"]
-    last_turn = state.get("last_turn", 0)
+def _node_store_response_cache(state: ChatState) -> ChatState:
+    # 캐시를 조회했지만 없었던 질문의 답변만 저장한다 (추천 행사가 없는 답변은 저장하지 않음)
+    if state.get("response_cache") == "miss" and state.get("related_event_ids"):
+        response_cache.store(
+            state["query_emb"],
+            cache_scope(state.get("date_range_filter"), state.get("event_filters")),
+            state.get("reply", ""),
+            state["related_event_ids"],
+        )
+    return {"response_cache": state.get("response_cache", "bypass")}
 
-    user_msg = Message(
-        conversation_id=convo.id,
-        username=state["username"],
-        role="user",
-        content=state["message"],
-        embedding=state.get("query_emb"),
-        turn=last_turn + 1,
-    )
-    db.add(user_msg)
 
-    assistant_msg = Message(
-        conversation_id=convo.id,
+async def _node_save_messages(state: ChatState) -> ChatState:
+    last_turn = state.get("last_turn", 0)
+
+    await AsyncConversationRepository(state["db"]).add_turn(
+        conversation_id=state.get("conversation_id"),
         username=state["username"],
-        role="assistant",
-        content=state.get("reply", ""),
+        user_content=state["message"],
+        user_embedding=state.get("query_emb"),
+        assistant_content=state.get("reply", ""),
         related_event_ids=state.get("related_event_ids"),
-        turn=last_turn + 2,
+        last_turn=last_turn,
     )
-    db.add(assistant_msg)
-
-    convo.touch()
-    db.commit()
     print(f"✅ [Log] Messages Saved (Turn: {last_turn + 2})")
     return state
 
 
 # ---------- LangGraph Build ----------
 
+# 사용자에게 보여줄 답변을 생성하는 노드 (스트리밍 시 이 노드들의 LLM 토큰만 전달)
+REPLY_NODES = ("build_reply", "handle_general_chat")
+# 캐시된 답변을 돌려주는 노드 (response_cache == "hit"일 때 reply를 채움)
+CACHED_REPLY_NODE = "lookup_response_cache"
+
+# 원본 메시지에만 의존하는 단계들. 동시에 실행한 뒤 join_inputs에서 모두 끝나기를 기다린다.
+# (날짜 추출은 의도가 general로 분류되면 버려지지만, seoul_event 경로의 대기 시간을 줄이기 위해 미리 시작한다)
+_PARALLEL_INPUT_NODES = ["load_conversation", "embed_question", "classify_intent", "extract_date_filter"]
+
+
+def _node_join_inputs(state: ChatState) -> ChatState:
+    # LangGraph 노드는 최소 한 개의 키를 써야 하므로, 병렬 단계의 결과(intent)를 그대로 확정해 반환한다
+    print(f"✅ [Log] Parallel inputs joined. Intent: {state.get('intent')}")
+    return {"intent": state.get("intent") or "seoul_event"}
+
+
 _chat_graph = StateGraph(ChatState)
 _chat_graph.add_node("load_conversation", _node_load_conversation)
 _chat_graph.add_node("embed_question", _node_embed_question)
 _chat_graph.add_node("classify_intent", _node_classify_intent) 
+_chat_graph.add_node("extract_date_filter", _node_extract_date_filter)
+_chat_graph.add_node("join_inputs", _node_join_inputs)
 _chat_graph.add_node("handle_general_chat", _node_handle_general_chat)
 _chat_graph.add_node("decide_followup", _node_decide_followup)
-_chat_graph.add_node("extract_date_filter", _node_extract_date_filter)
+_chat_graph.add_node("lookup_response_cache", _node_lookup_response_cache)
 _chat_graph.add_node("fetch_events", _node_fetch_events)
 _chat_graph.add_node("select_recommendations", _node_select_recommendations)
 _chat_graph.add_node("build_reply", _node_build_reply)
+_chat_graph.add_node("store_response_cache", _node_store_response_cache)
 _chat_graph.add_node("save_messages", _node_save_messages)
 
-_chat_graph.set_entry_point("load_conversation")
-_chat_graph.add_edge("load_conversation", "embed_question")
-_chat_graph.add_edge("embed_question", "classify_intent") 
+for _node in _PARALLEL_INPUT_NODES:
+    _chat_graph.add_edge(START, _node)
+_chat_graph.add_edge(_PARALLEL_INPUT_NODES, "join_inputs")
 
 def _route_intent(state: ChatState):
     return "handle_general_chat" if state["intent"] == "general" else "decide_followup"
 
 _chat_graph.add_conditional_edges(
-    "classify_intent",
+    "join_inputs",
     _route_intent,
     {
         "handle_general_chat": "handle_general_chat",
@@ -377,22 +450,22 @@ _chat_graph.add_conditional_edges(
     }
 )
 
-def _route_post_followup(state: ChatState):
-    return "fetch_events" if state["is_followup"] else "extract_date_filter"
+def _route_response_cache(state: ChatState):
+    return "save_messages" if state.get("response_cache") == "hit" else "fetch_events"
 
+_chat_graph.add_edge("decide_followup", "lookup_response_cache")
 _chat_graph.add_conditional_edges(
-    "decide_followup",
-    _route_post_followup,
+    "lookup_response_cache",
+    _route_response_cache,
     {
-        "fetch_events": "fetch_events",
-        "extract_date_filter": "extract_date_filter"
+        "save_messages": "save_messages",
+        "fetch_events": "fetch_events"
     }
 )
-
-_chat_graph.add_edge("extract_date_filter", "fetch_events")
 _chat_graph.add_edge("fetch_events", "select_recommendations")
 _chat_graph.add_edge("select_recommendations", "build_reply")
-_chat_graph.add_edge("build_reply", "save_messages")
+_chat_graph.add_edge("build_reply", "store_response_cache")
+_chat_graph.add_edge("store_response_cache", "save_messages")
 
 _chat_graph.add_edge("handle_general_chat", "save_messages") 
 
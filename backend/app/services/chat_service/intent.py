@@ -0,0 +1,166 @@
+import asyncio
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from .filters import SEOUL_GU_NAMES
+
+# 이 단어가 있으면 서울 행사 질문으로 본다. 다른 뜻으로 거의 쓰이지 않는 행사 명사와 자치구 이름만 둔다.
+# 분류 키워드(교육, 영화, 체험, 연극 등)나 "티켓", "데이트", "갈만한"은 일반 대화에도 흔히 나오므로
+# ("파이썬 교육 자료", "영화 줄거리 요약", "연극성 인격장애") 여기 넣지 않고 centroid / LLM으로 판단한다.
+EVENT_KEYWORDS = (
+    "축제", "페스티벌", "공연", "전시", "콘서트", "뮤지컬", "행사",
+    *SEOUL_GU_NAMES,
+)
+
+# 행사 키워드 없이 이 표현만 있으면 일반 대화로 본다
+GENERAL_KEYWORDS = (
+    "안녕", "하이", "반가워", "고마워", "감사", "수고", "잘가", "넌 누구", "너는 누구", "누구야", "이름이 뭐",
+    "뭘 할 수", "뭐 할 수", "할 수 있는 게", "기능", "사용법", "도움말", "ㅎㅎ", "ㅋㅋ",
+)
+
+# nearest-centroid 기준 문장 (질문 임베딩과 각 분류 평균 벡터의 유사도를 비교)
+INTENT_EXAMPLES: Dict[str, List[str]] = {
+    "seoul_event": [
+        "이번 주말에 서울에서 갈만한 축제 알려줘",
+        "아이랑 같이 볼 수 있는 공연 있어?",
+        "무료로 볼 수 있는 전시 추천해줘",
+        "강남구에서 하는 행사 뭐 있어",
+        "12월에 열리는 콘서트 알려줘",
+        "데이트하기 좋은 문화행사 추천",
+        "오늘 저녁에 볼만한 연극 있나요",
+        "한강에서 하는 불꽃놀이 언제야",
+        "서울 크리스마스 마켓 어디서 해?",
+        "부모님이랑 가기 좋은 국악 공연",
+    ],
+    "general": [
+        "안녕하세요",
+        "너는 누구야?",
+        "오늘 날씨 어때?",
+        "고마워 잘 쓸게",
+        "파이썬으로 리스트 정렬하는 법 알려줘",
+        "점심 메뉴 추천해줘",
+        "너는 어떤 걸 할 수 있어?",
+        "영어로 번역해줘",
+        "요즘 기분이 좀 우울해",
+        "재미있는 농담 하나 해줘",
+    ],
+}
+
+
+class IntentStats:
+    """
+    의도 분류 경로별 카운터와 LLM 호출 시간.
+    로컬에서 처리한 건수 x 평균 LLM 지연 시간을 절약한 시간으로 추정한다.
+    """
+
+    def __init__(self) -> None:
+        self.keyword = 0
+        self.centroid = 0
+        self.llm = 0
+        self.llm_seconds = 0.0
+
+    def record_llm(self, seconds: float) -> None:
+        self.llm += 1
+        self.llm_seconds += seconds
+
+    def as_dict(self) -> Dict[str, float]:
+        total = self.keyword + self.centroid + self.llm
+        local = self.keyword + self.centroid
+        avg_llm = self.llm_seconds / self.llm if self.llm else 0.0
+        return {
+            "keyword": self.keyword,
+            "centroid": self.centroid,
+            "llm": self.llm,
+            "local_ratio": round(local / total, 4) if total else 0.0,
+            "avg_llm_ms": round(avg_llm * 1000, 1),
+            "saved_seconds_est": round(local * avg_llm, 3),
+        }
+
+
+intent_stats = IntentStats()
+
+
+def classify_by_keywords(message: str) -> Optional[str]:
+    """
+    키워드 사전으로 확실한 경우만 분류한다. 판단할 수 없으면 None.
+    """
+    if any(keyword in message for keyword in EVENT_KEYWORDS):
+        return "seoul_event"
+    if any(keyword in message for keyword in GENERAL_KEYWORDS):
+        return "general"
+    return None
+
+
+class IntentCentroids:
+    """
+    INTENT_EXAMPLES의 분류별 평균 임베딩(centroid). 처음 사용할 때 한 번만 계산한다.
+    """
+
+    def __init__(self) -> None:
+        self.labels: List[str] = []
+        self.matrix: Optional[np.ndarray] = None
+        self._lock = asyncio.Lock()
+
+    async def ensure(self, embedding_service) -> bool:
+        if self.matrix is not None:
+            return True
+        async with self._lock:
+            if self.matrix is not None:
+                return True
+            labels, rows = [], []
+            for label, examples in INTENT_EXAMPLES.items():
+                vectors = [v for v in await embedding_service.query_embeddings(examples) if v]
+                if not vectors:
+                    return False
+                centroid = np.mean([np.asarray(v, dtype=np.float32) / np.linalg.norm(v) for v in vectors], axis=0)
+                labels.append(label)
+                rows.append(centroid / np.linalg.norm(centroid))
+            self.labels, self.matrix = labels, np.vstack(rows)
+        return True
+
+    def classify(self, query_emb: Sequence[float]) -> Tuple[Optional[str], float]:
+        """
+        Returns:
+            (label, margin): 가장 가까운 분류와 두 번째와의 유사도 차이.
+            차이가 INTENT_CENTROID_MARGIN보다 작으면 label은 None (-> LLM)
+        """
+        if self.matrix is None or not query_emb:
+            return None, 0.0
+        query = np.asarray(query_emb, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return None, 0.0
+        scores = self.matrix @ (query / norm)
+        order = np.argsort(-scores)
+        margin = float(scores[order[0]] - scores[order[1]])
+        if margin < settings.INTENT_CENTROID_MARGIN:
+            return None, margin
+        return self.labels[int(order[0])], margin
+
+
+intent_centroids = IntentCentroids()
+
+
+async def classify_intent_locally(message: str, embedding_service) -> Tuple[Optional[str], str]:
+    """
+    키워드 -> 질문 임베딩 centroid 순서로 분류한다.
+
+    Returns:
+        (intent, method): intent가 None이면 LLM으로 분류해야 함. method는 "keyword" | "centroid" | "llm"
+    """
+    intent = classify_by_keywords(message)
+    if intent:
+        return intent, "keyword"
+
+    try:
+        # embed_question 노드와 같은 질문이므로 진행 중인 요청/캐시를 공유한다
+        query_emb = await embedding_service.query_embedding(message)
+        if query_emb and await intent_centroids.ensure(embedding_service):
+            intent, _ = intent_centroids.classify(query_emb)
+            if intent:
+                return intent, "centroid"
+    except Exception as e:
+        print(f"⚠️ [Log] Local intent classification failed: {e}")
+    return None, "llm"
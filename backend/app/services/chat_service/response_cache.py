@@ -0,0 +1,179 @@
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+
+# 첫 질문(꼬리 질문이 아닌 질문)의 답변을 질문 임베딩 기준으로 재사용하는 semantic 캐시.
+# 같은 검색 조건(날짜 범위, 자치구/분류/유무료 필터) 안에서 질문 임베딩의 코사인 유사도가
+# RESPONSE_CACHE_SIM_THRESHOLD 이상인 이전 답변이 있으면 행사 검색과 LLM 호출(후보 선택/답변 생성)을 건너뛴다.
+#
+# 무효화:
+#   - 날짜가 바뀌면 전부 비운다 (프롬프트에 current_date가 들어가고 "오늘/이번 주말"의 의미가 바뀜)
+#   - 행사 카탈로그의 max(updated_at)가 바뀌면 전부 비운다 (수집/임베딩 결과 반영)
+#   - 항목은 RESPONSE_CACHE_TTL_SECONDS가 지나면 만료된다
+
+
+@dataclass
+class CachedResponse:
+    vector: np.ndarray           # 정규화된 질문 임베딩
+    scope: Hashable              # 검색 조건 (이 값이 같은 항목끼리만 비교)
+    reply: str
+    related_event_ids: List[int]
+    created_at: float
+
+
+class SemanticResponseCache:
+    def __init__(self, max_entries: int, threshold: float, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, CachedResponse]" = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+        self._day: Optional[str] = None
+        self._watermark: Optional[datetime] = None
+        self._watermark_known = False
+        self._watermark_checked_at = float("-inf")
+
+        self.hits = 0
+        self.misses = 0
+        self.bypasses: Counter = Counter()
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    # ---------- 무효화 ----------
+
+    def catalog_check_due(self) -> bool:
+        """
+        카탈로그 watermark를 다시 조회할 때가 되었는지 (RESPONSE_CACHE_CATALOG_CHECK_SECONDS 주기)
+        """
+        return time.monotonic() - self._watermark_checked_at >= settings.RESPONSE_CACHE_CATALOG_CHECK_SECONDS
+
+    def set_catalog_watermark(self, watermark: Optional[datetime]) -> None:
+        with self._lock:
+            if self._watermark_known and watermark != self._watermark:
+                self._clear("catalog changed")
+            self._watermark = watermark
+            self._watermark_known = True
+            self._watermark_checked_at = time.monotonic()
+
+    def set_day(self, current_date: str) -> None:
+        with self._lock:
+            if current_date != self._day:
+                if self._day is not None:
+                    self._clear("day rolled over")
+                self._day = current_date
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._clear("manual")
+
+    def _clear(self, reason: str) -> None:
+        if self._entries:
+            self.invalidations += 1
+            print(f"✅ [Log] Response cache cleared ({reason}): {len(self._entries)} entries")
+        self._entries.clear()
+
+    # ---------- 조회 / 저장 ----------
+
+    @staticmethod
+    def _normalize(query_emb: Sequence[float]) -> Optional[np.ndarray]:
+        vector = np.asarray(query_emb, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def lookup(self, query_emb: Sequence[float], scope: Hashable) -> Tuple[Optional[CachedResponse], float]:
+        """
+        Returns:
+            (entry, similarity): 임계값 이상으로 가장 가까운 항목과 그 유사도. 없으면 (None, 최고 유사도)
+        """
+        query = self._normalize(query_emb)
+        now = time.monotonic()
+        best: Optional[CachedResponse] = None
+        best_key: Optional[int] = None
+        best_score = 0.0
+
+        with self._lock:
+            if query is not None:
+                for key, entry in list(self._entries.items()):
+                    if self.ttl_seconds > 0 and now - entry.created_at >= self.ttl_seconds:
+                        del self._entries[key]
+                        continue
+                    if entry.scope != scope or entry.vector.shape != query.shape:
+                        continue
+                    score = float(entry.vector @ query)
+                    if score > best_score:
+                        best, best_key, best_score = entry, key, score
+
+            if best is not None and best_score >= self.threshold:
+                self._entries.move_to_end(best_key)
+                self.hits += 1
+                return best, best_score
+            self.misses += 1
+            return None, best_score
+
+    def store(self, query_emb: Sequence[float], scope: Hashable, reply: str, related_event_ids: List[int]) -> None:
+        vector = self._normalize(query_emb)
+        if vector is None:
+            return
+        with self._lock:
+            self._entries[self._next_id] = CachedResponse(
+                vector=vector,
+                scope=scope,
+                reply=reply,
+                related_event_ids=list(related_event_ids),
+                created_at=time.monotonic(),
+            )
+            self._next_id += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record_bypass(self, reason: str) -> None:
+        with self._lock:
+            self.bypasses[reason] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "bypasses": dict(self.bypasses),
+                "invalidations": self.invalidations,
+                "day": self._day,
+            }
+
+
+response_cache = SemanticResponseCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    threshold=settings.RESPONSE_CACHE_SIM_THRESHOLD,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
+
+
+def cache_scope(date_range: Any, event_filters: Any) -> Tuple:
+    """
+    같은 답변을 재사용해도 되는 검색 조건. 임베딩이 비슷해도 날짜/필터가 다르면 다른 답이어야 한다.
+    (예: "내일 축제" / "모레 축제")
+    """
+    return (
+        date_range.start_date if date_range else None,
+        date_range.end_date if date_range else None,
+        event_filters.gu_name if event_filters else None,
+        event_filters.codename if event_filters else None,
+        event_filters.is_free if event_filters else None,
+    )
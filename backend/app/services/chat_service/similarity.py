@@ -0,0 +1,22 @@
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+
+def cosine_similarity(a: Optional[Sequence[float]], b: Optional[Sequence[float]]) -> Optional[float]:
+    """
+    두 벡터의 코사인 유사도. 어느 한쪽이 비어 있거나 차원이 다르면 None.
+    """
+    if a is None or b is None or len(a) == 0 or len(a) != len(b):
+        return None
+    va = np.asarray(a, dtype=np.float32)
+    vb = np.asarray(b, dtype=np.float32)
+    denom = float(np.linalg.norm(va) * np.linalg.norm(vb))
+    if denom == 0.0:
+        return None
+    return float(va @ vb) / denom
+
+
+def max_cosine_similarity(query: Optional[Sequence[float]], vectors: Iterable[Sequence[float]]) -> Optional[float]:
+    scores = [score for score in (cosine_similarity(query, v) for v in vectors) if score is not None]
+    return max(scores) if scores else None
@@ -1,23 +1,31 @@
-from typing import List, TypedDict, Literal, Optional
+from typing import Any, Dict, List, TypedDict, Literal, Optional
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # 날짜 추출 결과 타입 정의 
 class DateRange(BaseModel):
     start_date: Optional[str] = None # YYYY-MM-DD 형식
     end_date: Optional[str] = None   # YYYY-MM-DD 형식
 
+# 질문에서 추출한 행사 검색 필터
+class EventFilters(BaseModel):
+    gu_name: Optional[str] = None   # 자치구 (예: "송파구")
+    codename: Optional[str] = None  # 분류 접두어 (예: "콘서트", "축제")
+    is_free: Optional[str] = None   # "무료" / "유료"
+
 class ChatResult(BaseModel):
     reply: str
     related_event_ids: List[int]
+    response_cache: Optional[str] = None  # "hit" | "miss" | "bypass" (일반 대화는 None)
 
 class ChatState(TypedDict, total=False):
     username: str
     message: str
-    db: Session
+    db: AsyncSession
     
-    convo: any
+    conversation_id: Optional[int]  # 첫 질문이면 None (save_messages에서 생성)
     last_turn: int
+    prev_user_message: Optional[str]
     prev_user_emb: List[float]
     prev_event_ids: List[int]
     query_emb: List[float]
@@ -26,9 +34,13 @@ class ChatState(TypedDict, total=False):
     
     # 💡 [개선] 날짜/기간 필터링을 위한 필드 추가
     date_range_filter: Optional[DateRange] 
+    event_filters: Optional[EventFilters]
     
     events: any
+    event_map: Dict[int, Any]  # 요청 내 행사 identity map (id -> SeoulEvent). 같은 행을 다시 조회하지 않는다
     reply: str
     related_event_ids: List[int]
     current_date: str
-    selected_event_ids: List[int]
\ No newline at end of file
+    selected_event_ids: List[int]
+    bypass_cache: bool                  # True면 답변 캐시를 사용하지 않음 (요청 단위)
+    response_cache: str                 # "hit" | "miss" | "bypass"
\ No newline at end of file
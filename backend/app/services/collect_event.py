@@ -2,21 +2,68 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Tuple, Any
-from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+import hashlib
+import json
 import logging
+import random
 import re
+import threading
+import time
 
 import requests
+from requests.adapters import HTTPAdapter
 from sqlalchemy.orm import Session
 from sqlalchemy import exc as sqlalchemy_exc
+from sqlalchemy import case, func, literal_column, null, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.core.config import settings
 from app.db.database import SessionLocal
 from app.entity.seoul_event_entity import SeoulEvent
+from app.entity.sync_checkpoint_entity import SyncCheckpoint
+from app.repository.sync_checkpoint_repo import SyncCheckpointRepository
+from app.services.event_cache import event_cache
+from app.services.event_snapshot import iter_snapshot_pages, new_snapshot_path, record_pages
 
 logger = logging.getLogger(__name__)
 
+
+class SeoulApiServiceError(Exception):
+    """
+    서울시 API가 HTTP 200으로 응답했지만 RESULT.CODE가 정상(INFO-000/INFO-200)이 아닌 경우.
+    """
+    def __init__(self, code: Optional[str], message: Optional[str]):
+        super().__init__(f"Seoul API Service Error: {code} - {message}")
+        self.code = code
+        self.message = message
+
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    서울시 API 호출에 공유하는 keep-alive 세션.
+    동시 요청 수만큼 커넥션을 풀에 유지해 요청마다 TCP 연결을 새로 맺지 않도록 한다.
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                pool_size = max(1, settings.SEOUL_EVENT_FETCH_CONCURRENCY)
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _http_session = session
+    return _http_session
+
+
 def fetch_page(start: int, end: int) -> Tuple[List[Dict[str, Any]], int]:
     url = (
         f"{settings.SEOUL_EVENT_BASE_URL}/"
@@ -28,7 +75,7 @@ def fetch_page(start: int, end: int) -> Tuple[List[Dict[str, Any]], int]:
 
     try:
         # timeout은 30초 이상으로 설정되었다고 가정
-        resp = requests.get(url, timeout=30) 
+        resp = get_http_session().get(url, timeout=30)
         
         # 1. HTTP 상태 코드 확인 (4xx/5xx 오류 처리)
         if resp.status_code != 200:
@@ -70,7 +117,7 @@ def fetch_page(start: int, end: int) -> Tuple[List[Dict[str, Any]], int]:
         
         # 💡 API 키 만료/요청 한도 등 서비스 오류에 대한 처리
         logger.error(f"Seoul API Service Error: {error_code} - {error_msg}")
-        raise Exception(f"Seoul API Service Error: {error_code} - {error_msg}")
+        raise SeoulApiServiceError(error_code, error_msg)
 
 
     rows = root.get("row") or []
@@ -139,8 +186,138 @@ def parse_float_or_none(val: Any):
         return None
 
 
-def row_to_entity(row: Dict[str, Any]) -> SeoulEvent:
-    return SeoulEvent(
+# ---------- 페이지 단위(컬럼) 파서 ----------
+
+# seoul_events 컬럼 -> API 필드
+DATE_COLUMNS = {"rgst_date": "RGSTDATE", "start_date": "STRTDATE", "end_date": "END_DATE"}
+FLOAT_COLUMNS = {"lot": "LOT", "lat": "LAT"}
+
+_DATE_FORMATS = ("%Y-%m-%d %H:%M:%S.0", "%Y-%m-%d", "%Y.%m.%d", "%Y%m%d")
+# API에서 가장 흔한 "2025-12-05 00:00:00.0" / "2025-12-05" 형태는 strptime 없이 바로 변환
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}(?: (?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d\.0)?")
+_FLOAT_SEP_RE = re.compile(r"[~/,]")
+_FLOAT_RE = re.compile(r"[-+]?\d+(\.\d+)?")
+
+
+def parse_date_column(raws: List[Any]) -> List[Optional[date]]:
+    """
+    한 컬럼의 날짜 원문 목록을 한 번에 파싱한다. (parse_date_or_none과 같은 결과)
+    - 같은 원문은 한 번만 파싱 (시작일처럼 여러 row가 공유하는 값)
+    - 컬럼에서 처음 성공한 포맷을 이후 값에 먼저 시도
+    """
+    memo: Dict[str, Optional[date]] = {}
+    formats = list(_DATE_FORMATS)
+    parsed: List[Optional[date]] = []
+
+    for raw in raws:
+        if not raw:
+            parsed.append(None)
+            continue
+
+        raw_str = str(raw).strip()
+        if raw_str in memo:
+            parsed.append(memo[raw_str])
+            continue
+
+        value: Optional[date] = None
+        if _ISO_DATE_RE.fullmatch(raw_str):
+            try:
+                value = date.fromisoformat(raw_str[:10])
+            except ValueError:
+                value = None
+        else:
+            for i, fmt in enumerate(formats):
+                try:
+                    value = datetime.strptime(raw_str, fmt).date()
+                except ValueError:
+                    continue
+                if i:
+                    formats.insert(0, formats.pop(i))
+                break
+
+        if value is None:
+            logger.debug("Failed to parse date: %r", raw)
+        memo[raw_str] = value
+        parsed.append(value)
+
+    return parsed
+
+
+def parse_float_column(raws: List[Any]) -> List[Optional[float]]:
+    """
+    한 컬럼의 좌표 원문 목록을 한 번에 파싱한다. (parse_float_or_none과 같은 결과)
+    미리 컴파일한 정규식을 쓰고, 같은 원문은 한 번만 파싱한다.
+    """
+    memo: Dict[str, Optional[float]] = {}
+    parsed: List[Optional[float]] = []
+
+    for val in raws:
+        if val is None:
+            parsed.append(None)
+            continue
+
+        s = str(val).strip()
+        if s in memo:
+            parsed.append(memo[s])
+            continue
+
+        value: Optional[float] = None
+        if s:
+            m = _FLOAT_RE.search(_FLOAT_SEP_RE.split(s, 1)[0].strip())
+            if m:
+                value = float(m.group(0))
+            else:
+                logger.warning("Cannot parse float from value=%r", val)
+
+        memo[s] = value
+        parsed.append(value)
+
+    return parsed
+
+
+def parse_columns(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    페이지 전체 row의 날짜/좌표 컬럼을 컬럼 단위로 파싱한다.
+
+    Returns:
+        {"rgst_date": [...], "start_date": [...], "end_date": [...], "lot": [...], "lat": [...]}
+        (각 리스트는 rows와 같은 순서/길이)
+    """
+    columns: Dict[str, List[Any]] = {}
+    for col, key in DATE_COLUMNS.items():
+        columns[col] = parse_date_column([row.get(key) for row in rows])
+    for col, key in FLOAT_COLUMNS.items():
+        columns[col] = parse_float_column([row.get(key) for row in rows])
+    return columns
+
+
+def _parse_row_columns(row: Dict[str, Any]) -> Dict[str, Any]:
+    parsed: Dict[str, Any] = {col: parse_date_or_none(row.get(key)) for col, key in DATE_COLUMNS.items()}
+    parsed.update({col: parse_float_or_none(row.get(key)) for col, key in FLOAT_COLUMNS.items()})
+    return parsed
+
+
+def compute_content_hash(values: Dict[str, Any]) -> str:
+    """
+    정규화된 컬럼 값으로 계산한 sha256 지문. 값이 하나라도 바뀌면 해시가 달라진다.
+    """
+    payload = {k: v for k, v in values.items() if k != "content_hash"}
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def row_to_values(row: Dict[str, Any], parsed: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    API row 하나를 seoul_events 컬럼명 기준의 dict로 변환한다.
+    (bulk insert와 ORM 엔티티 생성이 같은 변환 로직을 공유하도록 분리)
+
+    Args:
+        parsed: parse_columns로 미리 파싱한 이 row의 날짜/좌표 값. 없으면 row 단위 파서를 사용한다.
+    """
+    if parsed is None:
+        parsed = _parse_row_columns(row)
+
+    values = dict(
         codename=row.get("CODENAME"),
         gu_name=row.get("GUNAME"),
         title=row.get("TITLE"),
@@ -158,19 +335,25 @@ def row_to_entity(row: Dict[str, Any]) -> SeoulEvent:
         org_link=row.get("ORG_LINK"),
         main_img=row.get("MAIN_IMG"),
 
-        rgst_date=parse_date_or_none(row.get("RGSTDATE")),
+        rgst_date=parsed["rgst_date"],
         ticket_type=row.get("TICKET"),
-        start_date=parse_date_or_none(row.get("STRTDATE")),
-        end_date=parse_date_or_none(row.get("END_DATE")),
+        start_date=parsed["start_date"],
+        end_date=parsed["end_date"],
         theme_code=row.get("THEMECODE"),
 
-        lot=parse_float_or_none(row.get("LOT")),
-        lat=parse_float_or_none(row.get("LAT")),
+        lot=parsed["lot"],
+        lat=parsed["lat"],
 
         is_free=row.get("IS_FREE"),
         hmpg_addr=row.get("HMPG_ADDR"),
         pro_time=row.get("PRO_TIME"),
     )
+    values["content_hash"] = compute_content_hash(values)
+    return values
+
+
+def row_to_entity(row: Dict[str, Any]) -> SeoulEvent:
+    return SeoulEvent(**row_to_values(row))
 
 def save_rows(rows: List[Dict[str, Any]], db: Session) -> int:
     saved = 0
@@ -232,33 +415,477 @@ def save_rows(rows: List[Dict[str, Any]], db: Session) -> int:
     return saved
 
 
-# 전체 페이지 돌며 동기화
-def sync_seoul_events() -> int:
+# ---------- Bulk upsert (INSERT ... ON CONFLICT) ----------
+
+# uq_seoul_events_title_start_place 를 구성하는 컬럼
+UNIQUE_KEY_COLUMNS = ("title", "start_date", "place")
+
+# 충돌(이미 존재하는 행) 시 API 값으로 갱신할 컬럼
+UPSERT_UPDATE_COLUMNS = (
+    "codename", "gu_name", "date_text", "org_name", "use_target", "use_fee",
+    "inquiry", "player", "program", "etc_desc", "org_link", "main_img",
+    "rgst_date", "ticket_type", "end_date", "theme_code", "lot", "lat",
+    "is_free", "hmpg_addr", "pro_time", "content_hash",
+)
+
+EventKey = Tuple[Any, ...]
+SyncStats = Dict[str, int]
+
+
+def _empty_stats() -> SyncStats:
+    return {"inserted": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+
+
+def _merge_stats(total: SyncStats, part: SyncStats) -> SyncStats:
+    for name, count in part.items():
+        total[name] = total.get(name, 0) + count
+    return total
+
+
+def event_key(values: Dict[str, Any]) -> EventKey:
+    return tuple(values[col] for col in UNIQUE_KEY_COLUMNS)
+
+
+def _missing_key_column(values: Dict[str, Any]) -> Optional[str]:
+    for col in UNIQUE_KEY_COLUMNS:
+        if not values.get(col):
+            return col
+    return None
+
+
+def parse_rows(rows: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
     """
-    서울시 문화행사 전체를 API에서 가져와 DB에 적재.
+    API row 목록을 컬럼 dict로 변환하고, 유니크 키 컬럼이 비어 있는 row는 걸러낸다.
+    날짜/좌표는 parse_columns로 페이지 단위로 한 번에 파싱한다.
+
+    Returns:
+        (values 목록, 건너뛴 row 수)
+    """
+    values_list: List[Dict[str, Any]] = []
+    skipped = 0
+    columns = parse_columns(rows)
+
+    for i, row in enumerate(rows):
+        try:
+            values = row_to_values(row, {col: parsed[i] for col, parsed in columns.items()})
+        except Exception as e:
+            logger.exception("Failed to convert row to values: %s (row=%r)", e, row)
+            skipped += 1
+            continue
+
+        missing = _missing_key_column(values)
+        if missing:
+            logger.warning("Skipped: %s is missing for row=%r", missing, row)
+            skipped += 1
+            continue
+
+        values_list.append(values)
+
+    return values_list, skipped
+
+
+def prepare_bulk_rows(rows: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    parse_rows 결과를 유니크 키 기준으로 메모리에서 중복 제거한다.
+    같은 키가 여러 번 나오면 마지막 row가 남는다.
+
+    Returns:
+        (중복 제거된 values 목록, 건너뛴 row 수)
+    """
+    values_list, skipped = parse_rows(rows)
+    unique: Dict[EventKey, Dict[str, Any]] = {}
+
+    for values in values_list:
+        key = event_key(values)
+        if key in unique:
+            skipped += 1
+        unique[key] = values
+
+    return list(unique.values()), skipped
+
+
+def _upsert_batch(batch: List[Dict[str, Any]], db: Session) -> Tuple[int, List[int]]:
+    """
+    batch 전체를 INSERT ... ON CONFLICT DO UPDATE 한 번으로 기록한다.
+    content_hash가 달라진 행만 UPDATE 되며, RETURNING (xmax = 0)으로 insert/update 여부를 구분한다.
+
+    Returns:
+        (inserted, updated_ids): 새로 들어간 행 수와 갱신된 행의 id 목록
+    """
+    stmt = pg_insert(SeoulEvent).values(batch)
+    excluded = stmt.excluded
+    table = SeoulEvent.__table__
+
+    set_ = {col: excluded[col] for col in UPSERT_UPDATE_COLUMNS}
+    # 임베딩 텍스트(get_rag_chunk)에 들어가는 분류가 바뀌면 임베딩을 다시 생성하도록 초기화
+    rag_text_changed = table.c.codename.is_distinct_from(excluded.codename)
+    set_["embedding"] = case((rag_text_changed, null()), else_=table.c.embedding)
+    set_["embedding_attempts"] = case((rag_text_changed, 0), else_=table.c.embedding_attempts)
+    set_["updated_at"] = func.timezone("utc", func.now())  # utcnow와 같은 기준
+
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_seoul_events_title_start_place",
+        set_=set_,
+        where=table.c.content_hash.is_distinct_from(excluded.content_hash),
+    ).returning(SeoulEvent.id, literal_column("(xmax = 0)").label("inserted"))
+
+    rows = db.execute(stmt).all()
+    inserted = sum(1 for row in rows if row.inserted)
+    return inserted, [row.id for row in rows if not row.inserted]
+
+
+def _write_values(values_list: List[Dict[str, Any]], db: Session) -> SyncStats:
+    """
+    중복 제거된 values를 SEOUL_EVENT_BULK_BATCH_SIZE 단위로 upsert + commit 한다.
+    """
+    batch_size = settings.SEOUL_EVENT_BULK_BATCH_SIZE
+    stats = _empty_stats()
+
+    for i in range(0, len(values_list), batch_size):
+        batch = values_list[i:i + batch_size]
+        try:
+            inserted, updated_ids = _upsert_batch(batch, db)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.exception("Bulk upsert failed (batch_size=%d): %s", len(batch), e)
+            raise
+
+        # 챗봇이 캐시해 둔 행사 행 중 내용이 바뀐 것은 바로 버린다
+        event_cache.invalidate(updated_ids)
+
+        stats["inserted"] += inserted
+        stats["updated"] += len(updated_ids)
+        stats["unchanged"] += len(batch) - inserted - len(updated_ids)
+
+    return stats
+
+
+def save_rows_bulk(rows: List[Dict[str, Any]], db: Session) -> SyncStats:
+    """
+    여러 페이지(혹은 전체 피드)의 row를 배치 단위 upsert로 저장한다.
+    row마다 SELECT + commit 하던 save_rows 대신, 배치당 쿼리 1번 + commit 1번만 수행한다.
+
+    Returns:
+        {"inserted": ..., "updated": ..., "unchanged": ..., "skipped": ...}
+    """
+    values_list, skipped = prepare_bulk_rows(rows)
+    stats = _write_values(values_list, db)
+    stats["skipped"] += skipped
+
+    logger.info(
+        "Bulk upsert done: inserted=%d updated=%d unchanged=%d skipped=%d",
+        stats["inserted"], stats["updated"], stats["unchanged"], stats["skipped"],
+    )
+    return stats
+
+
+# ---------- Incremental (delta) sync ----------
+
+def load_existing_index(db: Session) -> Dict[EventKey, Optional[str]]:
+    """
+    DB에 있는 이벤트의 (title, start_date, place) -> content_hash 인덱스를 한 번에 읽어온다.
+    """
+    stmt = select(SeoulEvent.title, SeoulEvent.start_date, SeoulEvent.place, SeoulEvent.content_hash)
+    return {(title, start_date, place): content_hash for title, start_date, place, content_hash in db.execute(stmt)}
+
+
+SYNC_MODES = ("row", "bulk", "incremental")
+
+
+class EventWriter:
+    """
+    동기화 1회 동안 row를 받아 mode에 맞게 DB에 기록하는 writer.
+
+    - "row": 기존 save_rows (행 단위 insert, 기존 행은 갱신하지 않음)
+    - "bulk": SEOUL_EVENT_BULK_BATCH_SIZE 만큼 모아 upsert
+    - "incremental": 기존 content_hash 인덱스를 한 번 읽어 두고, 신규/변경 row만 upsert
+
+    checkpoint=True면 커밋할 때마다 sync_checkpoints에 다음 수집 위치를 기록하고,
+    이전 실행이 중간에 끊겼다면 resume_start부터 이어서 수집하도록 한다.
+    """
+
+    def __init__(self, db: Session, mode: Optional[str] = None, checkpoint: bool = False):
+        self.db = db
+        self.mode = mode or settings.SEOUL_EVENT_SYNC_MODE
+        if self.mode not in SYNC_MODES:
+            raise ValueError(f"Unknown Seoul event sync mode: {self.mode}")
+
+        self._checkpoints = SyncCheckpointRepository(db)
+        self.checkpoint: Optional[SyncCheckpoint] = (
+            self._checkpoints.start_or_resume(self.mode, settings.SEOUL_EVENT_CHECKPOINT_MAX_AGE_HOURS)
+            if checkpoint else None
+        )
+        self.resume_start = self.checkpoint.next_start if self.checkpoint else 1
+        self.total: Optional[int] = self.checkpoint.total if self.checkpoint else None
+        self._next_start: Optional[int] = None
+
+        self.stats = _empty_stats()
+        self.index: Dict[EventKey, Optional[str]] = (
+            load_existing_index(db) if self.mode == "incremental" else {}
+        )
+        self._existing_keys = set(self.index)
+        self._seen: set = set()
+        self._pending: Dict[EventKey, Dict[str, Any]] = {}
+
+    def set_total(self, total: int) -> None:
+        self.total = total
+
+    def add_rows(self, rows: List[Dict[str, Any]], next_start: Optional[int] = None) -> None:
+        if self.mode == "row":
+            self.stats["inserted"] += save_rows(rows, self.db)
+            if next_start is not None:
+                self._next_start = next_start
+            self._save_checkpoint()
+            return
+        values_list, skipped = parse_rows(rows)
+        self.add_values(values_list, skipped, next_start)
+
+    def add_values(
+        self,
+        values_list: List[Dict[str, Any]],
+        skipped: int = 0,
+        next_start: Optional[int] = None,
+    ) -> None:
+        """
+        parse_rows로 변환된 values를 버퍼에 모으고, 배치 크기가 차면 기록한다.
+
+        Args:
+            next_start: 이 values가 속한 페이지 다음 row 번호 (체크포인트용)
+        """
+        self.stats["skipped"] += skipped
+        if next_start is not None:
+            self._next_start = next_start
+        for values in values_list:
+            key = event_key(values)
+            if key in self._pending:
+                self.stats["skipped"] += 1
+            self._pending[key] = values
+
+        if len(self._pending) >= settings.SEOUL_EVENT_BULK_BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            self._save_checkpoint()
+            return
+        values_list = list(self._pending.values())
+        self._pending.clear()
+
+        if self.mode == "incremental":
+            changed: List[Dict[str, Any]] = []
+            for values in values_list:
+                key = event_key(values)
+                self._seen.add(key)
+                if key in self.index and self.index[key] == values["content_hash"]:
+                    self.stats["unchanged"] += 1
+                else:
+                    changed.append(values)
+            values_list = changed
+
+        _merge_stats(self.stats, _write_values(values_list, self.db))
+
+        if self.mode == "incremental":
+            for values in values_list:
+                self.index[event_key(values)] = values["content_hash"]
+
+        self._save_checkpoint()
+
+    def _save_checkpoint(self) -> None:
+        if self.checkpoint is None or self._next_start is None:
+            return
+        self._checkpoints.advance(self.checkpoint, self._next_start, self.total)
+
+    def finish(self) -> SyncStats:
+        """
+        남은 버퍼를 기록하고 최종 카운트를 반환한다.
+        removed는 DB에는 있지만 이번 피드에 없는 이벤트 수이며, 찜/대화 기록 보존을 위해 삭제하지는 않는다.
+        (체크포인트에서 재개한 실행은 피드 전체를 보지 않았으므로 0으로 둔다)
+        """
+        self.flush()
+        if self.checkpoint is not None:
+            self._checkpoints.complete(self.checkpoint)
+
+        full_scan = self.mode == "incremental" and self.resume_start == 1
+        self.stats["removed"] = len(self._existing_keys - self._seen) if full_scan else 0
+        return self.stats
+
+
+class _PageSizer:
+    """
+    요청 1회당 row 수를 조절한다.
+    성공하면 두 배씩 늘려 SEOUL_EVENT_MAX_PAGE_SIZE까지 키우고, 오류가 나면 절반으로 줄인다.
+    """
+
+    def __init__(self, initial: int):
+        self.max_size = max(1, settings.SEOUL_EVENT_MAX_PAGE_SIZE)
+        self.size = min(max(1, initial), self.max_size)
+        self._lock = threading.Lock()
+
+    def grow(self) -> None:
+        if not settings.SEOUL_EVENT_ADAPTIVE_PAGE_SIZE:
+            return
+        with self._lock:
+            self.size = min(self.size * 2, self.max_size)
+
+    def shrink(self) -> None:
+        with self._lock:
+            self.size = max(1, self.size // 2)
+
+
+Page = Tuple[int, List[Dict[str, Any]]]
+
+
+def _fetch_window(start: int, end: int, sizer: _PageSizer, attempt: int = 0) -> Tuple[List[Page], int]:
+    """
+    [start, end] 구간을 가져온다. 네트워크 오류나 서비스 오류(INFO-/ERROR- 코드)가 나면
+    페이지 크기를 줄이고 지수 백오프 후 같은 구간을 더 작은 페이지로 나눠 다시 요청한다.
+
+    Returns:
+        ([(start, rows), ...], list_total_count)
     """
-    db = SessionLocal()
     try:
-        page_size = settings.SEOUL_EVENT_PAGE_SIZE
-        start = 1
-        total_saved = 0
+        rows, total = fetch_page(start, end)
+    except (requests.exceptions.RequestException, SeoulApiServiceError) as e:
+        if attempt >= settings.SEOUL_EVENT_FETCH_MAX_RETRIES:
+            raise
+
+        sizer.shrink()
+        delay = settings.SEOUL_EVENT_FETCH_BACKOFF_SECONDS * (2 ** attempt) + random.uniform(0, 0.5)
+        logger.warning(
+            "Fetch failed for %d-%d (attempt=%d): %s. Retrying in %.1fs with page_size=%d",
+            start, end, attempt + 1, e, delay, sizer.size,
+        )
+        time.sleep(delay)
+
+        step = sizer.size
+        pages: List[Page] = []
+        total = 0
+        for sub_start in range(start, end + 1, step):
+            sub_pages, total = _fetch_window(sub_start, min(sub_start + step - 1, end), sizer, attempt + 1)
+            pages.extend(sub_pages)
+        return pages, total
+
+    sizer.grow()
+    return [(start, rows)], total
+
+
+def iter_pages(
+    page_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    start: int = 1,
+    on_total: Optional[Callable[[int], None]] = None,
+) -> Iterator[Page]:
+    """
+    첫 페이지로 list_total_count를 확인한 뒤, 나머지 구간을 스레드 풀로 동시에 가져온다.
+    페이지 크기는 _PageSizer가 응답 결과에 따라 조절하며, 결과는 항상 start 순서대로 yield 된다.
+    미리 받아 두는 구간 수는 concurrency * 2개로 제한된다.
 
-        while True:
-            end = start + page_size - 1
-            rows, total = fetch_page(start, end)
+    Args:
+        start: 수집을 시작할 row 번호 (체크포인트에서 재개할 때 사용)
+        on_total: list_total_count를 알게 되었을 때 호출되는 콜백
 
-            if not rows:
+    Yields:
+        (start, rows)
+    """
+    sizer = _PageSizer(page_size or settings.SEOUL_EVENT_PAGE_SIZE)
+    concurrency = max(1, concurrency or settings.SEOUL_EVENT_FETCH_CONCURRENCY)
+
+    first_end = start + sizer.size - 1
+    pages, total = _fetch_window(start, first_end, sizer)
+    if on_total:
+        on_total(total)
+    if not any(rows for _, rows in pages):
+        return
+    for page in pages:
+        if page[1]:
+            yield page
+
+    next_start = first_end + 1
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="seoul-fetch") as executor:
+        in_flight: deque = deque()
+
+        def submit_next() -> bool:
+            nonlocal next_start
+            if next_start > total:
+                return False
+            end = min(next_start + sizer.size - 1, total)
+            in_flight.append(executor.submit(_fetch_window, next_start, end, sizer))
+            next_start = end + 1
+            return True
+
+        for _ in range(concurrency * 2):
+            if not submit_next():
                 break
 
-            total_saved += save_rows(rows, db)
+        try:
+            while in_flight:
+                future = in_flight.popleft()
+                window_pages, _ = future.result()
+                submit_next()
+                for page in window_pages:
+                    if page[1]:
+                        yield page
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+def source_pages(
+    replay_path: Optional[str] = None,
+    page_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    start: int = 1,
+    on_total: Optional[Callable[[int], None]] = None,
+) -> Iterable[Page]:
+    """
+    동기화에 사용할 페이지 소스.
+    replay_path가 있으면 스냅샷 파일을 재생하고, 없으면 API의 start번째 row부터 가져오며
+    SEOUL_EVENT_SNAPSHOT_DIR이 설정된 경우 받아온 페이지를 스냅샷으로 함께 저장한다.
+    체크포인트에서 이어서 받는 경우(start > 1)는 카탈로그 일부만 받으므로 스냅샷을 남기지 않는다.
+    (--replay-latest가 카탈로그 일부만 재생하는 일을 막기 위함)
+    """
+    if replay_path:
+        return iter_snapshot_pages(replay_path)
+
+    pages: Iterable[Page] = iter_pages(page_size, concurrency, start=start, on_total=on_total)
+    if settings.SEOUL_EVENT_SNAPSHOT_DIR:
+        if start > 1:
+            logger.info("Resuming from row %d: snapshot is not recorded for a partial run", start)
+        else:
+            pages = record_pages(pages, new_snapshot_path())
+    return pages
 
-            if end >= total:
-                break
 
-            start = end + 1
+# 전체 페이지 돌며 동기화
+def sync_seoul_events(mode: Optional[str] = None, replay_path: Optional[str] = None) -> SyncStats:
+    """
+    서울시 문화행사 전체를 API에서 가져와 DB에 적재.
+
+    Args:
+        mode: 저장 방식 ("row" | "bulk" | "incremental"). None이면 settings.SEOUL_EVENT_SYNC_MODE를 따른다.
+        replay_path: 지정하면 API 대신 해당 스냅샷 파일(.ndjson.gz)의 row로 적재한다.
 
-        logger.info("Sync completed. Total newly saved=%d", total_saved)
-        return total_saved
+    Returns:
+        {"inserted", "updated", "unchanged", "skipped", "removed"} 카운트
+    """
+    db = SessionLocal()
+    try:
+        # 스냅샷 재생은 네트워크를 쓰지 않으므로 체크포인트 없이 처음부터 적재
+        writer = EventWriter(db, mode, checkpoint=not replay_path)
+        pages = source_pages(replay_path, start=writer.resume_start, on_total=writer.set_total)
+
+        # 페이지는 병렬로 받아오되, 저장은 start 순서대로 한 세션에서 처리
+        for start, rows in pages:
+            writer.add_rows(rows, next_start=start + len(rows))
+
+        stats = writer.finish()
+        logger.info(
+            "Sync completed (mode=%s). inserted=%d updated=%d unchanged=%d skipped=%d removed=%d",
+            writer.mode, stats["inserted"], stats["updated"], stats["unchanged"], stats["skipped"], stats["removed"],
+        )
+        return stats
 
     finally:
         db.close()
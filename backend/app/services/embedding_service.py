@@ -2,11 +2,130 @@
 
 import os
 import asyncio
-from typing import List, Optional, Literal
+import hashlib
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Literal, Tuple
 from app.core.config import settings
+from app.core.rate_limiter import AsyncRateLimiter
+from app.core.ttl_cache import TTLCache
+from app.db.database import SessionLocal
+from app.repository.embedding_cache_repo import EmbeddingCacheRepository
 import json
 import httpx
 
+# 재시도할 HTTP 상태 코드 (요청 한도 초과 / 일시적인 서버 오류)
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# 요청이 너무 커서 실패한 경우에만 배치를 나눠 다시 보낸다 (인증 오류, 한도 초과 등은 나눠도 실패하므로 바로 포기)
+_PAYLOAD_TOO_LARGE_RE = re.compile(r"too\s+(?:long|large|many)|exceed|maximum|max_tokens|token\s*limit|context\s*length", re.I)
+
+
+def _is_payload_too_large(response: Optional[httpx.Response]) -> bool:
+    if response is None:
+        return False
+    if response.status_code == 413:
+        return True
+    return response.status_code in (400, 422) and bool(_PAYLOAD_TOO_LARGE_RE.search(response.text or ""))
+
+
+def _estimate_tokens(text: str) -> int:
+    # 한국어 위주 텍스트라 글자 수를 토큰 수의 보수적인 상한으로 사용
+    return max(1, len(text))
+
+
+def _retry_after_seconds(response: Optional[httpx.Response]) -> Optional[float]:
+    """
+    Retry-After 헤더(초 또는 HTTP 날짜)를 초 단위로 변환. 없거나 해석할 수 없으면 None.
+    """
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TRAILING_PUNCT_RE = re.compile(r"[\s?!.~]+$")
+
+
+def normalize_query(text: str) -> str:
+    """
+    질문 캐시 키용 정규화: 공백 정리, 소문자화, 끝의 물음표/마침표 등 제거
+    ("이번 주말 축제 추천?" 과 "이번  주말 축제 추천" 을 같은 질문으로 본다)
+    """
+    text = _WHITESPACE_RE.sub(" ", text.strip().lower())
+    return _TRAILING_PUNCT_RE.sub("", text)
+
+
+def _cache_key(model_name: str, input_type: str, text: str) -> str:
+    return hashlib.sha256(f"{model_name}\x1f{input_type}\x1f{text}".encode("utf-8")).hexdigest()
+
+
+def _cache_lookup(cache_keys: List[str]) -> Dict[str, List[float]]:
+    # 이벤트 루프를 막지 않도록 asyncio.to_thread에서 별도 세션으로 실행
+    db = SessionLocal()
+    try:
+        return EmbeddingCacheRepository(db).get_many(cache_keys, settings.SOLAR_EMBEDDING_CACHE_TOUCH_SECONDS)
+    except Exception as e:
+        db.rollback()
+        print(f"임베딩 캐시 조회 실패 (API로 대체): {e}")
+        return {}
+    finally:
+        db.close()
+
+
+# 캐시 정리(count + delete)는 저장할 때마다가 아니라 SOLAR_EMBEDDING_CACHE_EVICT_SECONDS 주기로 한 번만 실행
+_evict_lock = threading.Lock()
+_last_evict_at = float("-inf")
+
+
+def _evict_due() -> bool:
+    global _last_evict_at
+    with _evict_lock:
+        now = time.monotonic()
+        if now - _last_evict_at < settings.SOLAR_EMBEDDING_CACHE_EVICT_SECONDS:
+            return False
+        _last_evict_at = now
+        return True
+
+
+def _cache_store(model_name: str, input_type: str, vectors: Dict[str, List[float]]) -> None:
+    if not vectors:
+        return
+    db = SessionLocal()
+    try:
+        repo = EmbeddingCacheRepository(db)
+        repo.put_many(model_name, input_type, vectors)
+        if _evict_due():
+            repo.evict(settings.SOLAR_EMBEDDING_CACHE_MAX_ENTRIES)
+    except Exception as e:
+        db.rollback()
+        print(f"임베딩 캐시 저장 실패: {e}")
+    finally:
+        db.close()
+
+
+def _backoff_seconds(attempt: int) -> float:
+    # full jitter 지수 백오프: 0 ~ base * 2^(attempt-1) 사이 임의 값 (상한 30초)
+    return random.uniform(0, min(30.0, settings.SOLAR_API_BACKOFF_SECONDS * (2 ** (attempt - 1))))
+
+
 class EmbeddingService: 
     """
     Upstage Solar API를 사용하여 임베딩 작업을 처리하는 서비스.
@@ -19,50 +138,221 @@ class EmbeddingService:
 
         if not self.api_key:
             raise ValueError("SOLAR_API_KEY 환경 변수가 설정되지 않았습니다. 워커를 실행할 수 없습니다.")
+
+        # 이벤트 루프마다 하나씩 만들어 재사용하는 커넥션 풀 클라이언트와 rate limiter
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._limiter: Optional[AsyncRateLimiter] = None
+
+        # 임베딩 캐시 적중/미스 카운터
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # 진행 중인 질문 임베딩 요청 (같은 질문의 동시 요청을 하나로 합침)
+        self._inflight: Dict[tuple, "asyncio.Future"] = {}
+
+        # 챗봇 질문 임베딩용 프로세스 내 캐시
+        self.query_cache: Optional[TTLCache[List[float]]] = (
+            TTLCache(settings.QUERY_EMBEDDING_CACHE_SIZE, settings.QUERY_EMBEDDING_CACHE_TTL_SECONDS)
+            if settings.QUERY_EMBEDDING_CACHE_SIZE > 0
+            else None
+        )
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        """
+        keep-alive 커넥션 풀을 가진 AsyncClient를 한 번만 만들어 재사용한다.
+        httpx/asyncio 객체는 이벤트 루프에 묶이므로, 다른 루프에서 호출되면 새로 만든다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop or self._client.is_closed:
+            self._loop = loop
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=settings.SOLAR_API_MAX_CONCURRENCY,
+                    max_keepalive_connections=settings.SOLAR_API_MAX_CONCURRENCY,
+                ),
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                },
+            )
+            self._limiter = AsyncRateLimiter(
+                rate_per_second=settings.SOLAR_API_RATE_PER_SECOND,
+                burst=settings.SOLAR_API_BURST,
+                max_concurrency=settings.SOLAR_API_MAX_CONCURRENCY,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._limiter = None
+        self._loop = None
     
-    async def _create_embedding(self, text: str, model_name: str, input_type: Literal["document", "query"]) -> Optional[List[float]]:
+    async def _request_embeddings(self, texts: List[str], model_name: str, input_type: Literal["document", "query"]) -> Tuple[Optional[List[Optional[List[float]]]], bool]:
         """
-        내부적으로 임베딩 API를 호출하는 비동기 함수
+        texts 전체를 한 번의 임베딩 API 요청으로 보내고, 응답의 data[i].index 기준으로 입력 순서에 맞춰 벡터를 돌려준다.
+        공유 클라이언트와 rate limiter를 거치며, 429/5xx/네트워크 오류는 Retry-After 또는 지터 백오프 후 재시도한다.
+
+        Returns:
+            (vectors, too_large): 요청 자체가 실패하면 vectors는 None.
+            too_large는 요청 크기 때문에 거절된 경우(413 등)에만 True (-> 배치를 나눠 다시 보낼 수 있음)
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
         data = {
             "model": model_name,
-            "input": [text],
+            "input": texts,
             "input_type": input_type
         }
 
-        for attempt in (1, 2, 3):
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                try:
-                    response = await client.post(self.api_endpoint_url, headers=headers, json=data)
-                    response.raise_for_status()
-
-                    result = response.json()
-                    
-                    if result.get('data') and result['data'][0].get('embedding'):
-                        return result['data'][0]['embedding']
-                    
+        client = self._ensure_client()
+        limiter = self._limiter
+        max_attempts = max(1, settings.SOLAR_API_MAX_ATTEMPTS)
+
+        for attempt in range(1, max_attempts + 1):
+            retry_delay: Optional[float] = None
+            try:
+                async with limiter:
+                    response = await client.post(self.api_endpoint_url, json=data)
+                response.raise_for_status()
+
+                result = response.json()
+                
+                if not result.get('data'):
                     print(f"임베딩 API 응답에 벡터 데이터가 없습니다: {result}")
-                    return None
+                    return None, False
 
-                except httpx.HTTPStatusError as e:
-                    status = e.response.status_code if e.response else None
-                    if status == 429 and attempt < 3:
-                        await asyncio.sleep(3 * attempt)
-                        continue
+                vectors: List[Optional[List[float]]] = [None] * len(texts)
+                for position, item in enumerate(result['data']):
+                    index = item.get('index', position)
+                    if 0 <= index < len(texts) and item.get('embedding'):
+                        vectors[index] = item['embedding']
+                return vectors, False
+
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status not in RETRYABLE_STATUS or attempt == max_attempts:
                     print(f"Upstage Solar API HTTP 오류 발생 (status={status}): {e}")
-                    return None
-                except httpx.RequestError as e:
+                    return None, _is_payload_too_large(e.response)
+                retry_delay = _retry_after_seconds(e.response)
+            except httpx.RequestError as e:
+                if attempt == max_attempts:
                     print(f"Upstage Solar API 호출 오류 발생: {e}")
-                    return None
-                except Exception as e:
-                    print(f"임베딩 생성 중 알 수 없는 오류 발생: {e}")
-                    return None
+                    return None, False
+            except Exception as e:
+                print(f"임베딩 생성 중 알 수 없는 오류 발생: {e}")
+                return None, False
 
-        return None
+            delay = retry_delay if retry_delay is not None else _backoff_seconds(attempt)
+            print(f"Upstage Solar API 재시도 대기 {delay:.1f}초 (attempt={attempt}/{max_attempts})")
+            await asyncio.sleep(delay)
+
+        return None, False
+
+    async def _create_embedding(self, text: str, model_name: str, input_type: Literal["document", "query"]) -> Optional[List[float]]:
+        """
+        내부적으로 임베딩 API를 호출하는 비동기 함수
+        """
+        vectors = await self._embed_many([text], model_name, input_type)
+        return vectors[0]
+
+    async def _embed_many(self, texts: List[str], model_name: str, input_type: Literal["document", "query"]) -> List[Optional[List[float]]]:
+        """
+        임베딩 캐시(embedding_cache 테이블)를 먼저 조회하고, 없는 텍스트만 API로 요청한 뒤 결과를 캐시에 저장한다.
+        같은 텍스트가 여러 번 들어오면 한 번만 요청한다.
+        """
+        if not settings.SOLAR_EMBEDDING_CACHE_ENABLED:
+            return await self._embed_uncached(texts, model_name, input_type)
+
+        keys = [_cache_key(model_name, input_type, text) for text in texts]
+        cached = await asyncio.to_thread(_cache_lookup, list(set(keys)))
+
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached:
+                missing.setdefault(key, text)
+
+        self.cache_hits += len(texts) - sum(1 for key in keys if key in missing)
+        self.cache_misses += sum(1 for key in keys if key in missing)
+
+        if missing:
+            missing_keys = list(missing)
+            new_vectors = await self._embed_uncached([missing[k] for k in missing_keys], model_name, input_type)
+            fetched = {key: vector for key, vector in zip(missing_keys, new_vectors) if vector is not None}
+            cached.update(fetched)
+            await asyncio.to_thread(_cache_store, model_name, input_type, fetched)
+
+        return [cached.get(key) for key in keys]
+
+    def cache_stats(self) -> Dict[str, float]:
+        total = self.cache_hits + self.cache_misses
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_ratio": round(self.cache_hits / total, 4) if total else 0.0,
+        }
+
+    def _pack_batches(self, texts: List[str]) -> List[List[int]]:
+        """
+        입력 인덱스를 요청 단위로 묶는다. 요청당 최대 SOLAR_EMBEDDING_BATCH_SIZE개,
+        추정 토큰 수(글자 수 기준) 합계가 SOLAR_EMBEDDING_BATCH_MAX_TOKENS를 넘지 않도록 한다.
+        """
+        max_inputs = max(1, settings.SOLAR_EMBEDDING_BATCH_SIZE)
+        max_tokens = settings.SOLAR_EMBEDDING_BATCH_MAX_TOKENS
+
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for i, text in enumerate(texts):
+            tokens = _estimate_tokens(text)
+            if current and (len(current) >= max_inputs or current_tokens + tokens > max_tokens):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(i)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _embed_batch(self, texts: List[str], model_name: str, input_type: Literal["document", "query"]) -> List[Optional[List[float]]]:
+        """
+        요청 크기 때문에 거절되었거나 응답에서 일부 벡터가 빠진 경우에만 절반으로 나눠 다시 요청한다.
+        인증 오류 / 재시도를 다 쓴 429 등 나눠도 실패할 오류는 요청을 늘리지 않고 바로 None으로 채운다.
+        """
+        vectors, too_large = await self._request_embeddings(texts, model_name, input_type)
+        if vectors is not None and (len(texts) == 1 or all(v is not None for v in vectors)):
+            return vectors
+        if len(texts) == 1 or (vectors is None and not too_large):
+            return [None] * len(texts)
+
+        mid = len(texts) // 2
+        reason = "요청 크기 초과" if vectors is None else "일부 누락"
+        print(f"임베딩 배치 {reason} (size={len(texts)}). 둘로 나눠 재시도합니다.")
+        left = await self._embed_batch(texts[:mid], model_name, input_type)
+        right = await self._embed_batch(texts[mid:], model_name, input_type)
+        return left + right
+
+    async def _embed_uncached(self, texts: List[str], model_name: str, input_type: Literal["document", "query"]) -> List[Optional[List[float]]]:
+        """
+        texts를 요청당 여러 건씩 묶어 API로 임베딩한다. 반환 리스트는 texts와 같은 순서/길이이며, 실패한 항목은 None.
+        """
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+        for batch in self._pack_batches(texts):
+            batch_vectors = await self._embed_batch([texts[i] for i in batch], model_name, input_type)
+            for i, vector in zip(batch, batch_vectors):
+                vectors[i] = vector
+        return vectors
+
+    # Passage 배치 임베딩 (DB 저장용)
+    async def db_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        여러 이벤트 텍스트(document)를 임베딩한다. 캐시에 있는 텍스트는 API를 호출하지 않는다.
+        반환 리스트는 texts와 같은 순서/길이이며, 실패한 항목은 None.
+        """
+        vectors = await self._embed_many(texts, self.passage_model, "document")
+        print(f"임베딩 캐시 통계: {self.cache_stats()}")
+        return vectors
 
     # Passage 임베딩 (DB 저장용)
     async def db_embedding(self, text: str) -> Optional[List[float]]:
@@ -75,5 +365,53 @@ class EmbeddingService:
     async def query_embedding(self, text: str) -> Optional[List[float]]:
         """
         사용자 질문(query)에 대한 임베딩 벡터를 생성합니다.
+        자주 반복되는 질문은 프로세스 내 LRU+TTL 캐시(정규화한 텍스트 기준)에서 바로 반환하고,
+        없으면 embedding_cache 테이블 -> API 순서로 조회합니다.
+        같은 질문에 대한 요청이 이미 진행 중이면 (예: 챗봇 그래프의 병렬 노드) 새로 호출하지 않고 그 결과를 기다립니다.
+        """
+        key = (self.query_model, normalize_query(text))
+        inflight_key = (id(asyncio.get_running_loop()), key)
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(self._query_embedding_uncoalesced(text, key))
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(inflight_key, None))
+        return await asyncio.shield(task)
+
+    async def _query_embedding_uncoalesced(self, text: str, key: tuple) -> Optional[List[float]]:
+        if self.query_cache is None:
+            return await self._create_embedding(text, self.query_model, "query")
+
+        cached = self.query_cache.get(key)
+        if cached is not None:
+            return cached
+
+        started = time.perf_counter()
+        vector = await self._create_embedding(text, self.query_model, "query")
+        self.query_cache.record_miss_latency(time.perf_counter() - started)
+        if vector is not None:
+            self.query_cache.set(key, vector)
+        return vector
+
+    async def query_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
         """
-        return await self._create_embedding(text, self.query_model, "query")
\ No newline at end of file
+        여러 질문(query) 텍스트를 배치로 임베딩합니다. (임베딩 캐시 사용)
+        """
+        return await self._embed_many(texts, self.query_model, "query")
+
+
+_EMBEDDING_SERVICE_INSTANCE: Optional[EmbeddingService] = None
+
+def get_embedding_service() -> EmbeddingService:
+    """
+    프로세스 전체에서 공유하는 EmbeddingService (커넥션 풀/rate limiter 공유)
+    """
+    global _EMBEDDING_SERVICE_INSTANCE
+    if _EMBEDDING_SERVICE_INSTANCE is None:
+        _EMBEDDING_SERVICE_INSTANCE = EmbeddingService()
+    return _EMBEDDING_SERVICE_INSTANCE
+
+
+async def close_embedding_service() -> None:
+    if _EMBEDDING_SERVICE_INSTANCE is not None:
+        await _EMBEDDING_SERVICE_INSTANCE.aclose()
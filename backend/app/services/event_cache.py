@@ -0,0 +1,88 @@
+# backend/app/services/event_cache.py
+"""
+행사(SeoulEvent) 행의 프로세스 내 read-through 캐시 (id -> 세션에서 분리된 SeoulEvent).
+
+챗봇은 같은 행사를 여러 요청에 걸쳐 반복해서 읽는다 (꼬리 질문 재사용, 인메모리 검색 결과의 id 조회 등).
+AsyncSeoulEventRepository.find_by_ids_ordered가 캐시에 없는 id만 DB에서 읽고 결과를 채운다.
+
+무효화:
+  - 수집기(collect_event)가 같은 프로세스에서 행을 갱신하면 해당 id를 바로 지운다.
+  - 수집/임베딩 워커는 보통 다른 프로세스(컨테이너)에서 돌기 때문에, 조회할 때 EVENT_CACHE_CATALOG_CHECK_SECONDS마다
+    카탈로그의 max(updated_at)을 확인해 바뀌었으면 전체를 비운다. (답변 캐시 response_cache와 같은 방식)
+  - 먼저 시작해 늦게 커밋된 트랜잭션처럼 max(updated_at)을 바꾸지 않는 갱신은 EVENT_CACHE_TTL_SECONDS가 지나면 반영된다.
+캐시된 객체는 어느 세션에도 속하지 않으므로 읽기 전용으로만 사용한다.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+import threading
+import time
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
+from app.entity.seoul_event_entity import SeoulEvent
+
+
+class EventCache:
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._cache: TTLCache[SeoulEvent] = TTLCache(max_entries, ttl_seconds)
+        self._lock = threading.Lock()
+        self._watermark: Optional[datetime] = None
+        self._watermark_known = False
+        self._watermark_checked_at = float("-inf")
+
+    def catalog_check_due(self) -> bool:
+        """
+        카탈로그 watermark를 다시 조회할 때가 되었는지 (EVENT_CACHE_CATALOG_CHECK_SECONDS 주기)
+        """
+        return time.monotonic() - self._watermark_checked_at >= settings.EVENT_CACHE_CATALOG_CHECK_SECONDS
+
+    def set_catalog_watermark(self, watermark: Optional[datetime]) -> None:
+        """
+        다른 프로세스에서 행사가 갱신되어 max(updated_at)이 바뀌었으면 캐시를 비운다.
+        """
+        with self._lock:
+            if self._watermark_known and watermark != self._watermark:
+                self._cache.clear()
+            self._watermark = watermark
+            self._watermark_known = True
+            self._watermark_checked_at = time.monotonic()
+
+    def get_many(self, ids: Iterable[int]) -> Tuple[Dict[int, SeoulEvent], List[int]]:
+        """
+        Returns:
+            (found, missing): 캐시에 있는 {id: 이벤트}와 DB에서 읽어야 할 id 목록
+        """
+        found: Dict[int, SeoulEvent] = {}
+        missing: List[int] = []
+        for event_id in ids:
+            event = self._cache.get(event_id)
+            if event is None:
+                missing.append(event_id)
+            else:
+                found[event_id] = event
+        return found, missing
+
+    def put_many(self, events: Iterable[SeoulEvent]) -> None:
+        for event in events:
+            self._cache.set(int(event.id), event)
+
+    def invalidate(self, ids: Optional[Iterable[int]] = None) -> None:
+        """
+        ids의 항목을 지운다. ids가 None이면 전체를 비운다.
+        """
+        if ids is None:
+            self._cache.clear()
+            return
+        self._cache.delete_many(ids)
+
+    def stats(self) -> Dict[str, float]:
+        return self._cache.stats()
+
+
+event_cache = EventCache(settings.EVENT_CACHE_SIZE, settings.EVENT_CACHE_TTL_SECONDS)
+
+
+def event_cache_enabled() -> bool:
+    return settings.EVENT_CACHE_SIZE > 0
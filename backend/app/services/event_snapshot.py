@@ -0,0 +1,77 @@
+# app/services/event_snapshot.py
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from datetime import datetime
+import gzip
+import json
+import logging
+import os
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_PREFIX = "seoul_events_"
+SNAPSHOT_SUFFIX = ".ndjson.gz"
+
+Page = Tuple[int, List[Dict[str, Any]]]
+
+
+def new_snapshot_path(snapshot_dir: Optional[str] = None) -> str:
+    """
+    동기화 1회에 해당하는 스냅샷 파일 경로 (예: seoul_events_20251205T030000.ndjson.gz)
+    """
+    snapshot_dir = snapshot_dir or settings.SEOUL_EVENT_SNAPSHOT_DIR
+    run_id = datetime.now().strftime("%Y%m%dT%H%M%S")
+    return os.path.join(snapshot_dir, f"{SNAPSHOT_PREFIX}{run_id}{SNAPSHOT_SUFFIX}")
+
+
+def latest_snapshot_path(snapshot_dir: Optional[str] = None) -> Optional[str]:
+    """
+    완료된 스냅샷 중 가장 최근 파일 경로. 없으면 None.
+    """
+    snapshot_dir = snapshot_dir or settings.SEOUL_EVENT_SNAPSHOT_DIR
+    if not snapshot_dir or not os.path.isdir(snapshot_dir):
+        return None
+
+    names = sorted(
+        name for name in os.listdir(snapshot_dir)
+        if name.startswith(SNAPSHOT_PREFIX) and name.endswith(SNAPSHOT_SUFFIX)
+    )
+    return os.path.join(snapshot_dir, names[-1]) if names else None
+
+
+def record_pages(pages: Iterable[Page], path: str) -> Iterator[Page]:
+    """
+    pages를 그대로 흘려보내면서 한 줄에 한 페이지씩 gzip NDJSON으로 기록한다.
+    끝까지 소비된 경우에만 임시 파일(.partial)을 최종 경로로 옮기므로, 중단된 실행은 재생 대상이 되지 않는다.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    partial_path = f"{path}.partial"
+    pages_written = 0
+
+    with gzip.open(partial_path, "wt", encoding="utf-8") as f:
+        for start, rows in pages:
+            f.write(json.dumps({"start": start, "rows": rows}, ensure_ascii=False))
+            f.write("\n")
+            pages_written += 1
+            yield start, rows
+
+    os.replace(partial_path, path)
+    logger.info("Saved Seoul event snapshot: %s (pages=%d)", path, pages_written)
+
+
+def iter_snapshot_pages(path: str) -> Iterator[Page]:
+    """
+    record_pages로 저장한 스냅샷을 네트워크 없이 (start, rows) 순서대로 재생한다.
+    """
+    logger.info("Replaying Seoul event snapshot: %s", path)
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield int(record["start"]), record.get("rows") or []
@@ -0,0 +1,289 @@
+# app/services/ingest_pipeline.py
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import argparse
+import json
+import logging
+import queue
+import threading
+import time
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.services.collect_event import EventWriter, SyncStats, parse_rows, source_pages, sync_seoul_events
+from app.services.event_snapshot import latest_snapshot_path
+
+logger = logging.getLogger(__name__)
+
+# 각 stage가 다음 stage에 "더 이상 데이터 없음"을 알리는 표식
+_END = object()
+
+Pages = Iterable[Tuple[int, List[Dict[str, Any]]]]
+
+
+class StageCounter:
+    """
+    stage 하나의 처리량 카운터.
+    busy_seconds는 실제 작업 시간, wait_seconds는 입력 대기/출력 큐가 가득 차서 막힌 시간(backpressure)이다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.batches = 0
+        self.rows = 0
+        self.busy_seconds = 0.0
+        self.wait_seconds = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        rows_per_sec = self.rows / self.busy_seconds if self.busy_seconds > 0 else 0.0
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "wait_seconds": round(self.wait_seconds, 3),
+            "rows_per_sec": round(rows_per_sec, 1),
+        }
+
+
+class IngestPipeline:
+    """
+    fetch -> parse -> write 3단계를 bounded queue로 연결한 수집 파이프라인.
+    네트워크 대기(fetch), 파싱(parse), DB 기록(write)이 서로 겹쳐서 진행되며,
+    뒤 단계가 느리면 큐가 가득 차 앞 단계가 자연스럽게 멈춘다.
+    """
+
+    def __init__(
+        self,
+        mode: Optional[str] = None,
+        pages: Optional[Pages] = None,
+        queue_size: Optional[int] = None,
+        replay_path: Optional[str] = None,
+        page_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ):
+        """
+        Args:
+            pages: 직접 넘긴 페이지 소스. 없으면 run()에서 source_pages로 만들며,
+                   API에서 가져오는 경우 체크포인트로 중단 지점부터 이어서 수집한다.
+            replay_path: API 대신 재생할 스냅샷 파일
+        """
+        self.mode = mode or settings.SEOUL_EVENT_SYNC_MODE
+        if self.mode == "row":
+            raise ValueError("IngestPipeline은 bulk/incremental 모드만 지원합니다.")
+
+        self.pages = pages
+        self.replay_path = replay_path
+        self.page_size = page_size
+        self.concurrency = concurrency
+        queue_size = queue_size or settings.SEOUL_EVENT_PIPELINE_QUEUE_SIZE
+        self._raw_q: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._parsed_q: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        self._errors: List[BaseException] = []
+
+        self.counters = {name: StageCounter(name) for name in ("fetch", "parse", "write")}
+
+    # ---------- queue helpers ----------
+
+    def _put(self, q: queue.Queue, item: Any, counter: StageCounter) -> bool:
+        started = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                try:
+                    q.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        finally:
+            counter.wait_seconds += time.perf_counter() - started
+
+    def _get(self, q: queue.Queue, counter: StageCounter) -> Any:
+        started = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                try:
+                    return q.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+            return _END
+        finally:
+            counter.wait_seconds += time.perf_counter() - started
+
+    def _run_stage(self, body: Callable[[], None], next_q: queue.Queue, counter: StageCounter) -> None:
+        try:
+            body()
+        except BaseException as e:
+            logger.exception("Ingest pipeline stage '%s' failed: %s", counter.name, e)
+            self._errors.append(e)
+            self._stop.set()
+        finally:
+            # 정상 종료든 실패든 다음 stage가 대기 상태로 남지 않도록 종료 표식을 보낸다
+            self._put(next_q, _END, counter)
+
+    # ---------- stages ----------
+
+    def _fetch_stage(self, pages: Pages) -> None:
+        counter = self.counters["fetch"]
+        pages = iter(pages)
+
+        while not self._stop.is_set():
+            started = time.perf_counter()
+            page = next(pages, None)
+            counter.busy_seconds += time.perf_counter() - started
+            if page is None:
+                break
+
+            counter.batches += 1
+            counter.rows += len(page[1])
+            if not self._put(self._raw_q, page, counter):
+                break
+
+    def _parse_stage(self) -> None:
+        counter = self.counters["parse"]
+
+        while True:
+            page = self._get(self._raw_q, counter)
+            if page is _END:
+                break
+
+            started = time.perf_counter()
+            start, rows = page
+            values_list, skipped = parse_rows(rows)
+            parsed = (values_list, skipped, start + len(rows))
+            counter.busy_seconds += time.perf_counter() - started
+
+            counter.batches += 1
+            counter.rows += len(rows)
+            if not self._put(self._parsed_q, parsed, counter):
+                break
+
+    def _write_stage(self, writer: EventWriter) -> None:
+        counter = self.counters["write"]
+
+        while True:
+            parsed = self._get(self._parsed_q, counter)
+            if parsed is _END:
+                break
+
+            started = time.perf_counter()
+            values_list, skipped, next_start = parsed
+            writer.add_values(values_list, skipped, next_start)
+            counter.busy_seconds += time.perf_counter() - started
+
+            counter.batches += 1
+            counter.rows += len(values_list)
+
+        started = time.perf_counter()
+        if not self._stop.is_set():
+            writer.flush()
+        counter.busy_seconds += time.perf_counter() - started
+
+    # ---------- entry ----------
+
+    def run(self) -> SyncStats:
+        """
+        fetch/parse는 별도 스레드에서, write는 호출 스레드에서 실행한다.
+        어느 stage든 실패하면 나머지 stage를 멈추고 첫 번째 예외를 다시 발생시킨다.
+        """
+        db = SessionLocal()
+        try:
+            use_checkpoint = self.pages is None and not self.replay_path
+            writer = EventWriter(db, self.mode, checkpoint=use_checkpoint)
+            pages = self.pages
+            if pages is None:
+                pages = source_pages(
+                    self.replay_path,
+                    page_size=self.page_size,
+                    concurrency=self.concurrency,
+                    start=writer.resume_start,
+                    on_total=writer.set_total,
+                )
+
+            threads = [
+                threading.Thread(
+                    target=self._run_stage,
+                    args=(lambda: self._fetch_stage(pages), self._raw_q, self.counters["fetch"]),
+                    name="ingest-fetch",
+                    daemon=True,
+                ),
+                threading.Thread(
+                    target=self._run_stage,
+                    args=(self._parse_stage, self._parsed_q, self.counters["parse"]),
+                    name="ingest-parse",
+                    daemon=True,
+                ),
+            ]
+            for t in threads:
+                t.start()
+
+            try:
+                self._write_stage(writer)
+            except BaseException as e:
+                self._errors.append(e)
+                self._stop.set()
+                raise
+            finally:
+                for t in threads:
+                    t.join()
+
+            if self._errors:
+                raise self._errors[0]
+
+            stats = writer.finish()
+            logger.info(
+                "Ingest pipeline completed (mode=%s). stats=%s stages=%s",
+                self.mode, stats, self.stage_stats(),
+            )
+            return stats
+        finally:
+            db.close()
+
+    def stage_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: counter.as_dict() for name, counter in self.counters.items()}
+
+
+def run_ingest_pipeline(mode: Optional[str] = None, replay_path: Optional[str] = None) -> SyncStats:
+    """
+    워커에서 사용하는 파이프라인 실행 헬퍼.
+    파이프라인이 지원하지 않는 "row" 모드면 기존 순차 동기화(sync_seoul_events)로 수집한다.
+    """
+    if (mode or settings.SEOUL_EVENT_SYNC_MODE) == "row":
+        logger.info("SEOUL_EVENT_SYNC_MODE=row: pipeline 대신 순차 동기화로 수집합니다.")
+        return sync_seoul_events(mode="row", replay_path=replay_path)
+    return IngestPipeline(mode=mode, replay_path=replay_path).run()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="서울시 문화행사 수집 파이프라인")
+    parser.add_argument("--mode", choices=("bulk", "incremental"), default=None)
+    parser.add_argument("--page-size", type=int, default=None)
+    parser.add_argument("--concurrency", type=int, default=None)
+    parser.add_argument("--queue-size", type=int, default=None)
+    replay = parser.add_mutually_exclusive_group()
+    replay.add_argument("--replay", metavar="PATH", default=None, help="API 대신 스냅샷 파일을 재생")
+    replay.add_argument("--replay-latest", action="store_true", help="가장 최근 스냅샷을 재생")
+    args = parser.parse_args(argv)
+
+    replay_path = args.replay
+    if args.replay_latest:
+        replay_path = latest_snapshot_path()
+        if replay_path is None:
+            parser.error("재생할 스냅샷이 없습니다. (SEOUL_EVENT_SNAPSHOT_DIR 확인)")
+
+    pipeline = IngestPipeline(
+        mode=args.mode,
+        queue_size=args.queue_size,
+        replay_path=replay_path,
+        page_size=args.page_size,
+        concurrency=args.concurrency,
+    )
+    stats = pipeline.run()
+    print(json.dumps({"stats": stats, "stages": pipeline.stage_stats()}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
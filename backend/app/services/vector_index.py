@@ -0,0 +1,334 @@
+# app/services/vector_index.py
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import logging
+import threading
+import time
+
+import numpy as np
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.entity.seoul_event_entity import SeoulEvent
+
+logger = logging.getLogger(__name__)
+
+# 날짜가 없는 행사는 기간 필터에서 항상 통과하도록 양 끝 값을 사용
+_MIN_ORDINAL = date.min.toordinal()
+_MAX_ORDINAL = date.max.toordinal()
+
+_COLUMNS = (
+    SeoulEvent.id,
+    SeoulEvent.embedding,
+    SeoulEvent.start_date,
+    SeoulEvent.end_date,
+    SeoulEvent.gu_name,
+    SeoulEvent.codename,
+    SeoulEvent.is_free,
+)
+
+
+def _ordinal(value: Any, default: int) -> int:
+    if value is None:
+        return default
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+    return value.toordinal()
+
+
+class _Categorical:
+    """
+    문자열 컬럼을 정수 코드 배열로 보관 (필터 마스크를 정수 비교로 만들기 위함)
+    """
+
+    def __init__(self) -> None:
+        self.codes: Dict[Optional[str], int] = {}
+
+    def code(self, value: Optional[str]) -> int:
+        return self.codes.setdefault(value, len(self.codes))
+
+    def matching(self, predicate) -> List[int]:
+        return [code for value, code in self.codes.items() if value is not None and predicate(value)]
+
+
+class VectorIndex:
+    """
+    SeoulEvent 임베딩을 메모리에 올려 두고 코사인 유사도 top-k를 계산하는 인덱스.
+    (VECTOR_SEARCH_BACKEND=memory 일 때 SeoulEventRepository의 벡터 검색이 이 인덱스를 사용)
+
+    - 정규화된 float32 행렬 하나(행 = 이벤트)와 id/기간/자치구/분류/유무료 컬럼 배열을 보관한다.
+    - 검색은 (질문 수 x 차원) @ (차원 x 이벤트 수) 행렬곱 한 번 + 필터 마스크 + argpartition으로 처리한다.
+    - refresh()는 updated_at이 마지막 갱신 이후인 행만 읽어 반영하고 (커밋이 늦은 트랜잭션을 위해 겹치는 구간 포함),
+      삭제된 행까지 정리하기 위해 VECTOR_MEMORY_FULL_RELOAD_SECONDS마다 전체를 다시 읽는다.
+
+    메모리 사용량은 대략 이벤트 수 x EMBEDDING_DIMENSION x 4 bytes 이다. (4096차원 1만 건 ≈ 160MB)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self.loaded = False
+        self.loaded_at = 0.0
+        self.refreshed_at = 0.0
+        self._watermark: Optional[datetime] = None
+        self._empty()
+
+    def _empty(self) -> None:
+        dim = settings.EMBEDDING_DIMENSION
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.matrix = np.zeros((0, dim), dtype=np.float32)
+        self.norms = np.zeros(0, dtype=np.float32)
+        self.start_ord = np.zeros(0, dtype=np.int32)
+        self.end_ord = np.zeros(0, dtype=np.int32)
+        self.gu = np.zeros(0, dtype=np.int32)
+        self.codename = np.zeros(0, dtype=np.int32)
+        self.is_free = np.zeros(0, dtype=np.int32)
+        self._gu_codes = _Categorical()
+        self._codename_codes = _Categorical()
+        self._free_codes = _Categorical()
+        self._positions: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # ---------- load / refresh ----------
+
+    def _fetch_rows(self, since: Optional[datetime] = None) -> List[Tuple]:
+        stmt = select(*_COLUMNS, SeoulEvent.updated_at)
+        if since is not None:
+            stmt = stmt.where(SeoulEvent.updated_at > since)
+        else:
+            stmt = stmt.where(SeoulEvent.embedding.is_not(None))
+
+        db = SessionLocal()
+        try:
+            return db.execute(stmt).all()
+        finally:
+            db.close()
+
+    def _columns_for(self, rows: Sequence[Tuple]) -> Dict[str, np.ndarray]:
+        vectors = np.asarray([row.embedding for row in rows], dtype=np.float32).reshape(len(rows), -1)
+        norms = np.linalg.norm(vectors, axis=1)
+        safe = np.where(norms > 0, norms, 1.0).astype(np.float32)
+        return {
+            "ids": np.asarray([row.id for row in rows], dtype=np.int64),
+            "matrix": vectors / safe[:, None],
+            "norms": norms.astype(np.float32),
+            "start_ord": np.asarray([_ordinal(row.start_date, _MIN_ORDINAL) for row in rows], dtype=np.int32),
+            "end_ord": np.asarray([_ordinal(row.end_date, _MAX_ORDINAL) for row in rows], dtype=np.int32),
+            "gu": np.asarray([self._gu_codes.code(row.gu_name) for row in rows], dtype=np.int32),
+            "codename": np.asarray([self._codename_codes.code(row.codename) for row in rows], dtype=np.int32),
+            "is_free": np.asarray([self._free_codes.code(row.is_free) for row in rows], dtype=np.int32),
+        }
+
+    @staticmethod
+    def _max_updated_at(rows: Sequence[Tuple], current: Optional[datetime]) -> Optional[datetime]:
+        stamps = [row.updated_at for row in rows if row.updated_at is not None]
+        if current is not None:
+            stamps.append(current)
+        return max(stamps) if stamps else None
+
+    def load(self) -> int:
+        """
+        임베딩이 있는 모든 이벤트를 읽어 인덱스를 새로 만든다.
+
+        Returns:
+            인덱스에 올라간 이벤트 수
+        """
+        started = time.perf_counter()
+        rows = self._fetch_rows()
+        with self._lock:
+            self._empty()
+            if rows:
+                for name, values in self._columns_for(rows).items():
+                    setattr(self, name, values)
+            self._positions = {int(event_id): i for i, event_id in enumerate(self.ids)}
+            self._watermark = self._max_updated_at(rows, None)
+            self.loaded = True
+            self.loaded_at = self.refreshed_at = time.monotonic()
+
+        logger.info("Loaded in-memory vector index: %d events in %.2fs", len(rows), time.perf_counter() - started)
+        return len(rows)
+
+    def refresh(self) -> int:
+        """
+        마지막 갱신 이후 updated_at이 바뀐 행만 반영한다.
+        새 임베딩은 추가/교체하고, 임베딩이 초기화된(NULL) 행은 인덱스에서 뺀다.
+
+        updated_at은 트랜잭션 시작 시각(now())이라, 먼저 시작했지만 늦게 커밋된 트랜잭션의 행은
+        이미 읽은 watermark보다 이전 시각으로 나타난다. 이런 행을 놓치지 않도록
+        watermark보다 VECTOR_MEMORY_REFRESH_OVERLAP_SECONDS 이전부터 다시 읽는다. (같은 행을 다시 반영해도 결과는 같다)
+
+        Returns:
+            반영한 행 수
+        """
+        if not self.loaded or self._watermark is None:
+            return self.load()
+
+        rows = self._fetch_rows(since=self._watermark - timedelta(seconds=settings.VECTOR_MEMORY_REFRESH_OVERLAP_SECONDS))
+        with self._lock:
+            self.refreshed_at = time.monotonic()
+            if not rows:
+                return 0
+
+            changed = [row for row in rows if row.embedding is not None]
+            removed = {int(row.id) for row in rows}
+            keep = np.asarray([int(event_id) not in removed for event_id in self.ids], dtype=bool)
+
+            columns = self._columns_for(changed) if changed else None
+            for name in ("ids", "matrix", "norms", "start_ord", "end_ord", "gu", "codename", "is_free"):
+                values = getattr(self, name)[keep]
+                if columns is not None:
+                    values = np.concatenate([values, columns[name]])
+                setattr(self, name, values)
+
+            self._positions = {int(event_id): i for i, event_id in enumerate(self.ids)}
+            self._watermark = self._max_updated_at(rows, self._watermark)
+
+        logger.info("Refreshed in-memory vector index: %d changed rows (size=%d)", len(rows), len(self))
+        return len(rows)
+
+    def maybe_refresh(self) -> None:
+        """
+        검색 직전에 호출. 주기가 지났으면 증분 갱신(또는 전체 재적재)을 한다.
+        다른 요청이 이미 갱신 중이면 기다리지 않고 현재 인덱스로 검색한다.
+        """
+        now = time.monotonic()
+        full = now - self.loaded_at >= settings.VECTOR_MEMORY_FULL_RELOAD_SECONDS
+        if not full and now - self.refreshed_at < settings.VECTOR_MEMORY_REFRESH_SECONDS:
+            return
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            self.load() if full else self.refresh()
+        except Exception as e:
+            logger.warning("In-memory vector index refresh failed: %s", e)
+            self.refreshed_at = now
+        finally:
+            self._refresh_lock.release()
+
+    def vectors_for(self, ids: Sequence[int]) -> Dict[int, List[float]]:
+        """
+        id별 (정규화된) 임베딩. 인덱스에 없는 id는 제외한다.
+        """
+        with self._lock:
+            return {
+                int(event_id): self.matrix[self._positions[int(event_id)]].tolist()
+                for event_id in ids
+                if int(event_id) in self._positions
+            }
+
+    # ---------- search ----------
+
+    def _mask(
+        self,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        gu_name: Optional[str],
+        codename: Optional[str],
+        is_free: Optional[str],
+    ) -> Optional[np.ndarray]:
+        mask = None
+
+        def both(current, condition):
+            return condition if current is None else current & condition
+
+        if start_date:
+            mask = both(mask, self.end_ord >= _ordinal(start_date, _MIN_ORDINAL))
+        if end_date:
+            mask = both(mask, self.start_ord <= _ordinal(end_date, _MAX_ORDINAL))
+        if gu_name:
+            mask = both(mask, np.isin(self.gu, self._gu_codes.matching(lambda v: v == gu_name)))
+        if codename:
+            mask = both(mask, np.isin(self.codename, self._codename_codes.matching(lambda v: v.startswith(codename))))
+        if is_free:
+            mask = both(mask, np.isin(self.is_free, self._free_codes.matching(lambda v: v == is_free)))
+        return mask
+
+    def search(
+        self,
+        query_vectors: Sequence[Sequence[float]],
+        top_k: int,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        gu_name: Optional[str] = None,
+        codename: Optional[str] = None,
+        is_free: Optional[str] = None,
+        min_similarity: Optional[float] = None,
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        질문 벡터 여러 개를 한 번에 검색한다. 필터 조건은 모든 질문에 공통으로 적용된다.
+
+        Args:
+            query_vectors: (질문 수 x 차원) 질문 임베딩
+            top_k: 질문당 최대 반환 개수
+            start_date ~ is_free: SeoulEventRepository.search_events_hybrid와 같은 의미의 필터
+            min_similarity: 코사인 유사도가 이보다 낮은 결과는 제외
+
+        Returns:
+            질문별 [(event_id, 코사인 유사도)] (유사도 내림차순)
+        """
+        queries = np.asarray(query_vectors, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[None, :]
+        query_norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = queries / np.where(query_norms > 0, query_norms, 1.0)
+
+        with self._lock:
+            if len(self.ids) == 0 or top_k <= 0:
+                return [[] for _ in range(len(queries))]
+
+            mask = self._mask(start_date, end_date, gu_name, codename, is_free)
+            ids, matrix = self.ids, self.matrix
+            if mask is not None:
+                ids, matrix = ids[mask], matrix[mask]
+            if len(ids) == 0:
+                return [[] for _ in range(len(queries))]
+
+            scores = queries @ matrix.T
+
+        k = min(top_k, len(ids))
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        results: List[List[Tuple[int, float]]] = []
+        for row, candidates in zip(scores, top):
+            ordered = candidates[np.argsort(-row[candidates])]
+            results.append([
+                (int(ids[i]), float(row[i]))
+                for i in ordered
+                if min_similarity is None or row[i] >= min_similarity
+            ])
+        return results
+
+
+_VECTOR_INDEX_INSTANCE: Optional[VectorIndex] = None
+_VECTOR_INDEX_LOCK = threading.Lock()
+
+
+def get_vector_index() -> VectorIndex:
+    """
+    프로세스 전체에서 공유하는 VectorIndex. 처음 호출될 때 전체를 적재한다.
+    """
+    global _VECTOR_INDEX_INSTANCE
+    with _VECTOR_INDEX_LOCK:
+        if _VECTOR_INDEX_INSTANCE is None:
+            index = VectorIndex()
+            index.load()
+            _VECTOR_INDEX_INSTANCE = index
+    return _VECTOR_INDEX_INSTANCE
+
+
+def memory_backend_enabled() -> bool:
+    return settings.VECTOR_SEARCH_BACKEND == "memory"
+
+
+def l2_to_cosine(max_distance: Optional[float]) -> Optional[float]:
+    """
+    단위 벡터 기준 L2 거리 한도를 코사인 유사도 하한으로 변환 (|a-b|^2 = 2 - 2cos)
+    """
+    if not max_distance:
+        return None
+    return 1.0 - (max_distance ** 2) / 2.0
@@ -2,7 +2,7 @@ import time
 import logging
 from datetime import datetime
 
-from app.services.collect_event import sync_seoul_events
+from app.services.ingest_pipeline import run_ingest_pipeline
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -18,8 +18,8 @@ def collect_seoul_events_worker():
     while True:
         try:
             logger.info("Starting sync job at %s", datetime.now().isoformat())
-            saved = sync_seoul_events()
-            logger.info("Sync job finished. newly_saved=%d", saved)
+            stats = run_ingest_pipeline()
+            logger.info("Sync job finished. stats=%s", stats)
         except Exception as e:
             logger.exception("Seoul event sync failed: %s", e)
 
@@ -1,20 +1,22 @@
 import asyncio
-from sqlalchemy.future import select
 from app.db.database import SessionLocal
 from app.entity.seoul_event_entity import SeoulEvent 
-from app.services.embedding_service import EmbeddingService 
-from typing import List
+from app.repository.seoul_event_repo import SeoulEventRepository
+from app.services.embedding_service import EmbeddingService, get_embedding_service
+from typing import Dict, List
 
 BATCH_SIZE = 100                # 한 번에 처리할 이벤트 개수
 INTERVAL_SECONDS = 60 * 60 * 24 # 임베딩할 데이터가 없을 때 긴 대기 시간 (24시간)
 SLEEP_TIME = 5                  # 에러 발생 후 대기 시간 (5초)
+CLAIM_LEASE_SECONDS = 60 * 10   # 선점한 이벤트를 다른 워커가 가져가지 못하는 시간 (10분)
+MAX_ATTEMPTS = 5                # 이 횟수 이상 실패한 이벤트는 더 이상 재시도하지 않음
 
 def process_embeddings():
     """
     DB에서 임베딩이 필요한 이벤트를 찾아 임베딩을 처리하고 저장하는 메인 함수.
     """
     try:
-        embedding_service = EmbeddingService()
+        embedding_service = get_embedding_service()
     except ValueError as e:
         print(f"❌ 워커 초기화 실패: {e}")
         return
@@ -30,12 +32,13 @@ async def _async_process_embeddings(embedding_service: EmbeddingService):
         try:
             print(f"임베딩 워커 실행 중: 임베딩이 필요한 이벤트 검색...")
 
-            # 임베딩이 NULL인 이벤트 검색 (BATCH_SIZE만큼 제한)
-            stmt = select(SeoulEvent).where( 
-                SeoulEvent.embedding.is_(None)
-            ).limit(BATCH_SIZE)
-            
-            events_to_embed: List[SeoulEvent] = db.execute(stmt).scalars().all()
+            # 임베딩이 NULL인 이벤트를 선점 (여러 워커가 동시에 돌아도 서로 다른 배치를 가져감)
+            repo = SeoulEventRepository(db)
+            events_to_embed: List[SeoulEvent] = repo.claim_events_for_embedding(
+                batch_size=BATCH_SIZE,
+                lease_seconds=CLAIM_LEASE_SECONDS,
+                max_attempts=MAX_ATTEMPTS,
+            )
             
             # --- 데이터 없음: 긴 대기 모드 진입 ---
             if not events_to_embed:
@@ -47,25 +50,25 @@ async def _async_process_embeddings(embedding_service: EmbeddingService):
 
             print(f"💡 {len(events_to_embed)}개의 이벤트 임베딩을 비동기 처리합니다.")
 
-            # --- 비동기 병렬 처리 ---
-            tasks = []
-            for event in events_to_embed:
-                text_chunk = event.get_rag_chunk()
-                tasks.append(embedding_service.db_embedding(text_chunk)) 
-
-            results = await asyncio.gather(*tasks, return_exceptions=True) 
+            # --- 배치 임베딩 요청 (요청당 여러 건) ---
+            texts = [event.get_rag_chunk() for event in events_to_embed]
+            results = await embedding_service.db_embeddings(texts)
             
             # --- 결과 처리 및 DB 업데이트 ---
+            embeddings: Dict[int, List[float]] = {}
+            failed_ids: List[int] = []
             for event, vector_data in zip(events_to_embed, results):
                 if isinstance(vector_data, list): # 성공적으로 벡터를 받은 경우
-                    event.embedding = vector_data
+                    embeddings[event.id] = vector_data
                     print(f" - [ID: {event.id}, 제목: {event.title[:15]}...] 임베딩 완료.")
                 else: 
                     # 오류 발생 (Exception이거나 API에서 벡터를 반환하지 않은 경우)
+                    failed_ids.append(event.id)
                     error_msg = str(vector_data) if vector_data else "API 벡터 없음"
                     print(f" - [ID: {event.id}] 임베딩 실패 또는 오류 발생: {error_msg}")
 
-            db.commit()
+            repo.save_embeddings(embeddings)
+            repo.mark_embedding_failed(failed_ids)
             await asyncio.sleep(1) 
             
         except Exception as e:
@@ -0,0 +1,140 @@
+# benchmarks/bench_date_parser.py
+"""
+규칙 기반 날짜 파서(resolve_date_range) 검증 코퍼스 + 속도 측정.
+
+CORPUS의 모든 표현을 기준일(2025-12-03, 수요일)로 해석해 기대값과 비교하고,
+질문 1건당 처리 시간을 출력한다. 기대값이 FALLBACK인 표현은 LLM으로 넘겨야 하는 경우이다.
+
+실행 (backend 디렉토리에서):
+    poetry run python -m benchmarks.bench_date_parser
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Tuple, Union
+import time
+
+from app.services.chat_service.date_parser import resolve_date_range
+
+BASE_DATE = "2025-12-03"  # 수요일
+
+FALLBACK = "fallback"
+NO_DATE = None
+
+Expected = Union[str, None, Tuple[str, str]]
+
+CORPUS: List[Tuple[str, Expected]] = [
+    # 하루 단위 표현
+    ("오늘 뭐 해?", ("2025-12-03", "2025-12-03")),
+    ("내일 갈만한 축제", ("2025-12-04", "2025-12-04")),
+    ("모레 공연 있어?", ("2025-12-05", "2025-12-05")),
+    ("내일모레 전시 추천", ("2025-12-05", "2025-12-05")),
+    ("글피에 하는 행사", ("2025-12-06", "2025-12-06")),
+    ("어제 끝난 축제", ("2025-12-02", "2025-12-02")),
+    ("3일 후 공연", ("2025-12-06", "2025-12-06")),
+    ("이틀 뒤 공연", ("2025-12-05", "2025-12-05")),
+    ("사흘 후 축제", ("2025-12-06", "2025-12-06")),
+    # 주 / 주말 / 요일
+    ("이번 주말 축제 추천", ("2025-12-06", "2025-12-07")),
+    ("이번주말에 뭐하지", ("2025-12-06", "2025-12-07")),
+    ("주말에 갈만한 행사", ("2025-12-06", "2025-12-07")),
+    ("다음 주말 콘서트", ("2025-12-13", "2025-12-14")),
+    ("담주 주말 전시", ("2025-12-13", "2025-12-14")),
+    ("다음 주 주말 공연", ("2025-12-13", "2025-12-14")),
+    ("이번 주 무료 행사", ("2025-12-03", "2025-12-07")),
+    ("다음 주 전시", ("2025-12-08", "2025-12-14")),
+    ("다음주에 뭐해", ("2025-12-08", "2025-12-14")),
+    ("다다음 주 행사", ("2025-12-15", "2025-12-21")),
+    ("지난주 축제", ("2025-11-24", "2025-11-30")),
+    ("이번 주 토요일 공연", ("2025-12-06", "2025-12-06")),
+    ("토요일에 볼만한 공연", ("2025-12-06", "2025-12-06")),
+    ("수요일 공연", ("2025-12-03", "2025-12-03")),
+    ("월요일에 하는 전시", ("2025-12-08", "2025-12-08")),
+    ("다음 주 금요일 뮤지컬", ("2025-12-12", "2025-12-12")),
+    # 달 / 월 / 날짜
+    ("이번 달 축제", ("2025-12-03", "2025-12-31")),
+    ("이달 행사", ("2025-12-03", "2025-12-31")),
+    ("다음 달 행사", ("2026-01-01", "2026-01-31")),
+    ("12월 5일 공연", ("2025-12-05", "2025-12-05")),
+    ("12월5일 공연", ("2025-12-05", "2025-12-05")),
+    ("12월 5일부터 7일까지 축제", ("2025-12-05", "2025-12-07")),
+    ("12월 3~5일 공연", ("2025-12-03", "2025-12-05")),
+    ("12월 5~7일 축제", ("2025-12-05", "2025-12-07")),
+    ("12월 5-7일 전시", ("2025-12-05", "2025-12-07")),
+    ("12월 5일~7일 전시", ("2025-12-05", "2025-12-07")),
+    ("12월 20일 ~ 12월 25일 전시", ("2025-12-20", "2025-12-25")),
+    ("12/20~12/25 전시", ("2025-12-20", "2025-12-25")),
+    ("1월 축제", ("2026-01-01", "2026-01-31")),
+    ("올해 12월 공연", ("2025-12-01", "2025-12-31")),
+    ("내년 3월 벚꽃축제", ("2026-03-01", "2026-03-31")),
+    ("2026년 1월 10일 콘서트", ("2026-01-10", "2026-01-10")),
+    ("2025-12-10 행사", ("2025-12-10", "2025-12-10")),
+    ("2025.12.24 공연", ("2025-12-24", "2025-12-24")),
+    ("내일이나 모레 전시", ("2025-12-04", "2025-12-05")),
+    ("12/20부터 12/25까지 전시", ("2025-12-20", "2025-12-25")),
+    ("다음주 월요일부터 수요일까지 공연", ("2025-12-08", "2025-12-10")),
+    ("금주 토요일 공연", ("2025-12-06", "2025-12-06")),
+    ("이 달 축제", ("2025-12-03", "2025-12-31")),
+    # 날짜 표현 없음 -> LLM 호출 없이 기간 필터 없음
+    ("송파구 무료 축제 추천", NO_DATE),
+    ("뮤지컬 추천해줘", NO_DATE),
+    ("아이랑 가기 좋은 체험 행사", NO_DATE),
+    ("안녕하세요", NO_DATE),
+    # 날짜처럼 보이는 일반 단어 (오탐 방지)
+    ("지금 주차장 있어?", NO_DATE),
+    ("같이 달리기 행사", NO_DATE),
+    ("다음 달리기 대회 언제 해?", NO_DATE),
+    # 규칙으로 판단할 수 없음 -> LLM
+    ("크리스마스 행사", FALLBACK),
+    ("연말에 볼만한 공연", FALLBACK),
+    ("15일에 하는 행사", FALLBACK),
+    ("평일 저녁 공연", FALLBACK),
+    ("2월 30일 축제", FALLBACK),
+    ("봄에 하는 꽃축제", FALLBACK),
+    ("3일간 열리는 축제", FALLBACK),
+    ("이번 주제가 뭐야", FALLBACK),
+    ("1/2 가격 할인 공연", FALLBACK),
+    ("월요일부터 수요일까지 전시", FALLBACK),
+    ("토,일 공연", FALLBACK),
+    ("금/토 축제", FALLBACK),
+    ("토일 공연 있어?", FALLBACK),
+    ("이틀 동안 하는 축제", FALLBACK),
+    ("나흘간 열리는 행사", FALLBACK),
+    ("3~5일 공연", FALLBACK),
+    ("12월 7~5일 공연", FALLBACK),
+    ("이번 주 3~5일 행사", FALLBACK),
+]
+
+
+def check(message: str, expected: Expected) -> Optional[str]:
+    decided, date_range = resolve_date_range(message, BASE_DATE)
+    if expected == FALLBACK:
+        actual: Expected = FALLBACK if not decided else (date_range and (date_range.start_date, date_range.end_date))
+    elif not decided:
+        actual = FALLBACK
+    else:
+        actual = (date_range.start_date, date_range.end_date) if date_range else NO_DATE
+    if actual != expected:
+        return f"{message!r}: expected {expected}, got {actual}"
+    return None
+
+
+def main() -> None:
+    failures = [error for message, expected in CORPUS if (error := check(message, expected))]
+    for failure in failures:
+        print(f"FAIL {failure}")
+    assert not failures, f"{len(failures)}/{len(CORPUS)} 표현이 기대값과 다릅니다."
+
+    repeat = 2000
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for message, _ in CORPUS:
+            resolve_date_range(message, BASE_DATE)
+    per_call = (time.perf_counter() - started) / (repeat * len(CORPUS))
+
+    fast = sum(1 for _, expected in CORPUS if expected != FALLBACK)
+    print(f"corpus={len(CORPUS)} passed  (fast path {fast}/{len(CORPUS)}, LLM fallback {len(CORPUS) - fast})")
+    print(f"resolve_date_range: {per_call * 1e6:.1f} µs / 질문")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# benchmarks/bench_intent.py
+"""
+로컬 의도 분류기(키워드 + centroid)와 LLM 분류의 정확도 / 지연 시간 비교.
+
+LABELED_SAMPLE의 질문을 분류해 다음을 출력한다.
+  - 로컬 분류 커버리지(LLM 없이 처리한 비율)와 그중 정답률
+  - --llm: LLM 분류 정답률, 로컬 결과와 LLM 결과의 일치율, 평균 LLM 지연 시간
+  - 요청당 절약 시간 추정치 = 커버리지 x (평균 LLM 지연 - 평균 로컬 지연)
+
+실행 (backend 디렉토리에서):
+    poetry run python -m benchmarks.bench_intent                 # 키워드 사전만 (네트워크 없음)
+    poetry run python -m benchmarks.bench_intent --embeddings    # + 질문 임베딩 centroid (임베딩 API 필요)
+    poetry run python -m benchmarks.bench_intent --embeddings --llm
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+import argparse
+import asyncio
+import statistics
+import time
+
+from langchain_core.prompts import ChatPromptTemplate
+
+from app.services.chat_service.intent import classify_by_keywords, classify_intent_locally
+from app.services.chat_service.prompts import INTENT_CLASSIFICATION_PROMPT
+
+LABELED_SAMPLE: List[Tuple[str, str]] = [
+    ("이번 주말 축제 추천해줘", "seoul_event"),
+    ("무료 행사 있어?", "seoul_event"),
+    ("송파구에서 하는 공연 알려줘", "seoul_event"),
+    ("아이랑 갈만한 체험 프로그램", "seoul_event"),
+    ("12월에 하는 뮤지컬 뭐 있어", "seoul_event"),
+    ("크리스마스에 데이트할 곳", "seoul_event"),
+    ("한강 불꽃놀이 언제 해?", "seoul_event"),
+    ("부모님 모시고 볼만한 국악", "seoul_event"),
+    ("서울에서 주말에 뭐하고 놀지", "seoul_event"),
+    ("비 오는 날 실내에서 즐길 거리", "seoul_event"),
+    ("그 행사 입장료 얼마야?", "seoul_event"),
+    ("요즘 핫한 전시회", "seoul_event"),
+    ("재즈 페스티벌 하는 데 있어?", "seoul_event"),
+    ("연말 클래식 공연 예매하고 싶어", "seoul_event"),
+    ("종로구 근처 문화행사", "seoul_event"),
+    ("안녕", "general"),
+    ("안녕하세요 반가워요", "general"),
+    ("너는 누구야?", "general"),
+    ("고마워!", "general"),
+    ("오늘 날씨 어때?", "general"),
+    ("점심 뭐 먹을까", "general"),
+    ("파이썬 리스트 정렬 방법", "general"),
+    ("너 뭐 할 수 있어?", "general"),
+    ("심심해", "general"),
+    ("영어로 hello가 뭐야", "general"),
+    ("오늘 기분이 안 좋아", "general"),
+    ("농담 하나 해줘", "general"),
+    ("사용법 알려줘", "general"),
+    ("ㅋㅋㅋ 웃기다", "general"),
+    ("지금 몇 시야?", "general"),
+    ("파이썬 교육 자료 추천해줘", "general"),
+    ("영화 줄거리 요약해줘", "general"),
+    ("연극성 인격장애가 뭐야", "general"),
+    ("기차 티켓 예매하는 법", "general"),
+]
+
+
+async def classify_local(message: str, with_embeddings: bool, embedding_service) -> Optional[str]:
+    if not with_embeddings:
+        return classify_by_keywords(message)
+    intent, _ = await classify_intent_locally(message, embedding_service)
+    return intent
+
+
+async def classify_llm(message: str, chat_llm) -> str:
+    prompt = ChatPromptTemplate.from_messages([
+        ("system", INTENT_CLASSIFICATION_PROMPT),
+        ("user", "질문: {query}"),
+    ])
+    response = await (prompt | chat_llm).ainvoke({"query": message})
+    return "seoul_event" if "seoul_event" in response.content.strip().lower() else "general"
+
+
+async def run(with_embeddings: bool, with_llm: bool) -> None:
+    embedding_service = None
+    chat_llm = None
+    if with_embeddings or with_llm:
+        from app.core.llm_client import get_chat_client
+        client = get_chat_client()
+        embedding_service, chat_llm = client.embedding_service, client.chat_llm
+        if with_embeddings:
+            # centroid 계산은 최초 1회 비용이므로 측정에서 제외
+            await classify_intent_locally("워밍업", embedding_service)
+
+    local_times: List[float] = []
+    llm_times: List[float] = []
+    covered = correct_local = correct_llm = agree = 0
+
+    for message, label in LABELED_SAMPLE:
+        started = time.perf_counter()
+        local = await classify_local(message, with_embeddings, embedding_service)
+        local_times.append(time.perf_counter() - started)
+
+        llm = None
+        if with_llm:
+            started = time.perf_counter()
+            llm = await classify_llm(message, chat_llm)
+            llm_times.append(time.perf_counter() - started)
+            correct_llm += llm == label
+
+        if local is not None:
+            covered += 1
+            correct_local += local == label
+            agree += llm is not None and local == llm
+
+        mark = "-" if local is None else ("O" if local == label else "X")
+        print(f"[{mark}] {label:<11} local={local or '(llm)':<11} llm={llm or '-':<11} {message}")
+
+    n = len(LABELED_SAMPLE)
+    coverage = covered / n
+    print(f"\nsamples={n}  coverage={coverage:.1%}  local accuracy={correct_local / covered if covered else 0:.1%}")
+    print(f"local latency: mean={statistics.mean(local_times) * 1000:.2f} ms")
+    if with_llm:
+        llm_mean = statistics.mean(llm_times)
+        local_mean = statistics.mean(local_times)
+        print(f"llm accuracy={correct_llm / n:.1%}  local/llm agreement={agree / covered if covered else 0:.1%}")
+        print(f"llm latency: mean={llm_mean * 1000:.1f} ms")
+        print(f"estimated saving per request: {coverage * (llm_mean - local_mean) * 1000:.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--embeddings", action="store_true", help="질문 임베딩 centroid 단계까지 사용")
+    parser.add_argument("--llm", action="store_true", help="LLM 분류와 비교 (SOLAR_API_KEY 필요)")
+    args = parser.parse_args()
+    asyncio.run(run(args.embeddings, args.llm))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# benchmarks/bench_parse.py
+"""
+row 단위 파서(parse_date_or_none / parse_float_or_none)와
+페이지 단위 파서(parse_columns)의 속도를 비교하는 마이크로 벤치마크.
+
+실행 (backend 디렉토리에서):
+    poetry run python -m benchmarks.bench_parse
+    poetry run python -m benchmarks.bench_parse --snapshot logs/snapshots/seoul_events_XXXX.ndjson.gz
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List
+import argparse
+import random
+import time
+
+from app.services.collect_event import (
+    DATE_COLUMNS,
+    FLOAT_COLUMNS,
+    parse_columns,
+    parse_date_or_none,
+    parse_float_or_none,
+)
+from app.services.event_snapshot import iter_snapshot_pages
+
+
+def synthetic_rows(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    실제 API 응답과 비슷한 분포의 row 생성 (시작일/등록일은 적은 수의 값이 반복된다)
+    """
+    rng = random.Random(seed)
+    days = [f"2025-{m:02d}-{d:02d}" for m in range(1, 13) for d in (1, 5, 10, 15, 20, 25)]
+    rows = []
+    for _ in range(n):
+        start = rng.choice(days)
+        rows.append({
+            "RGSTDATE": rng.choice(days[:20]),
+            "STRTDATE": f"{start} 00:00:00.0",
+            "END_DATE": f"{rng.choice(days)} 00:00:00.0",
+            "LOT": f"{37.4 + rng.random() * 0.3:.6f}",
+            "LAT": rng.choice([f"{126.8 + rng.random() * 0.3:.6f}", "127.0~127.1", ""]),
+        })
+    return rows
+
+
+def snapshot_rows(path: str) -> List[Dict[str, Any]]:
+    return [row for _, rows in iter_snapshot_pages(path) for row in rows]
+
+
+def per_row(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    columns: Dict[str, List[Any]] = {col: [] for col in (*DATE_COLUMNS, *FLOAT_COLUMNS)}
+    for row in rows:
+        for col, key in DATE_COLUMNS.items():
+            columns[col].append(parse_date_or_none(row.get(key)))
+        for col, key in FLOAT_COLUMNS.items():
+            columns[col].append(parse_float_or_none(row.get(key)))
+    return columns
+
+
+def per_page(rows: List[Dict[str, Any]], page_size: int) -> Dict[str, List[Any]]:
+    columns: Dict[str, List[Any]] = {col: [] for col in (*DATE_COLUMNS, *FLOAT_COLUMNS)}
+    for i in range(0, len(rows), page_size):
+        for col, values in parse_columns(rows[i:i + page_size]).items():
+            columns[col].extend(values)
+    return columns
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--snapshot", default=None, help="합성 데이터 대신 사용할 스냅샷 파일")
+    args = parser.parse_args()
+
+    rows = snapshot_rows(args.snapshot) if args.snapshot else synthetic_rows(args.rows)
+
+    # 두 방식의 결과가 같은지 먼저 확인
+    assert per_row(rows) == per_page(rows, args.page_size), "parse_columns 결과가 row 단위 파서와 다릅니다."
+
+    row_sec = best_of(lambda: per_row(rows), args.repeat)
+    page_sec = best_of(lambda: per_page(rows, args.page_size), args.repeat)
+
+    print(f"rows={len(rows)} page_size={args.page_size} repeat={args.repeat}")
+    print(f"per-row  : {row_sec * 1000:8.1f} ms  ({len(rows) / row_sec:,.0f} rows/s)")
+    print(f"per-page : {page_sec * 1000:8.1f} ms  ({len(rows) / page_sec:,.0f} rows/s)")
+    print(f"speedup  : {row_sec / page_sec:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
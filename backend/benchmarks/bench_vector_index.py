@@ -0,0 +1,175 @@
+# benchmarks/bench_vector_index.py
+"""
+ANN 인덱스(HNSW / IVFFlat)와 정확한 순차 스캔의 recall@k / 지연 시간 비교 벤치마크.
+
+합성 벡터(군집 분포)를 임시 테이블에 적재하고, 인덱스를 app.db.vector_index와 같은 방식으로 만든 뒤
+같은 질의를 (1) 인덱스 없이 정확 검색 (2) 인덱스 검색으로 실행해 결과를 비교한다.
+pgvector 확장이 설치된 PostgreSQL(DATABASE_URL)이 필요하며, 벤치마크 테이블은 끝나면 삭제한다.
+
+실행 (backend 디렉토리에서):
+    poetry run python -m benchmarks.bench_vector_index --sizes 10000 100000 1000000 --dim 256
+    poetry run python -m benchmarks.bench_vector_index --sizes 10000 --dim 4096 --type hnsw --ef-search 40 100 200
+
+1M x 4096차원은 원본만 16GB이므로 큰 규모는 --dim을 줄여서 측정한다. (인덱스 표현은 차원에 따라 vector/halfvec/bit로 바뀜)
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Sequence
+import argparse
+import io
+import statistics
+import time
+
+import numpy as np
+from sqlalchemy import Column, Integer, MetaData, Table, select, text
+from pgvector.sqlalchemy import Vector
+
+from app.core.config import settings
+from app.db.database import engine, SessionLocal
+from app.db.vector_index import create_index_sql, nearest_stmt, storage_for
+
+TABLE = "bench_vectors"
+
+
+def synthetic_vectors(n: int, dim: int, clusters: int = 64, seed: int = 0) -> np.ndarray:
+    """
+    실제 임베딩처럼 몇 개의 주제(군집) 주변에 모여 있는 단위 벡터
+    """
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, clusters, size=n)
+    vectors = centers[labels] + 0.5 * rng.standard_normal((n, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def load_table(vectors: np.ndarray) -> Table:
+    dim = vectors.shape[1]
+    table = Table(
+        TABLE, MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("embedding", Vector(dim)),
+    )
+    table.drop(engine, checkfirst=True)
+    table.create(engine)
+
+    # COPY로 적재 (INSERT보다 훨씬 빠름)
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        chunk = 50000
+        for offset in range(0, len(vectors), chunk):
+            buf = io.StringIO()
+            for i, vector in enumerate(vectors[offset:offset + chunk], start=offset + 1):
+                buf.write(f"{i}\t[{','.join(f'{x:.6f}' for x in vector)}]\n")
+            buf.seek(0)
+            cursor.copy_expert(f"COPY {TABLE} (id, embedding) FROM STDIN", buf)
+        raw.commit()
+    finally:
+        raw.close()
+    return table
+
+
+def run_queries(
+    table: Table, queries: np.ndarray, k: int, settings_sql: Sequence[str] = (), exact: bool = False,
+) -> tuple[List[List[int]], List[float]]:
+    results: List[List[int]] = []
+    latencies: List[float] = []
+    dim = queries.shape[1]
+
+    with SessionLocal() as db:
+        for query in queries:
+            for sql in settings_sql:
+                db.execute(text(sql))
+            if exact:
+                stmt = select(table.c.id).order_by(table.c.embedding.l2_distance(query.tolist())).limit(k)
+            else:
+                stmt = nearest_stmt(table, table.c.embedding, query.tolist(), k, dim=dim, id_column=table.c.id)
+                stmt = stmt.with_only_columns(table.c.id)
+            started = time.perf_counter()
+            ids = db.execute(stmt).scalars().all()
+            latencies.append(time.perf_counter() - started)
+            results.append(list(ids))
+            db.rollback()  # SET LOCAL 초기화
+    return results, latencies
+
+
+def exact_neighbors(vectors: np.ndarray, queries: np.ndarray, k: int) -> List[List[int]]:
+    """
+    NumPy로 계산한 정답 (L2 거리, id는 1부터)
+    """
+    truth = []
+    for query in queries:
+        distances = np.linalg.norm(vectors - query, axis=1)
+        top = np.argpartition(distances, k)[:k]
+        truth.append([int(i) + 1 for i in top[np.argsort(distances[top])]])
+    return truth
+
+
+def recall_at_k(truth: List[List[int]], found: List[List[int]], k: int) -> float:
+    hits = sum(len(set(t[:k]) & set(f[:k])) for t, f in zip(truth, found))
+    return hits / (k * len(truth))
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[int(len(ordered) * 0.95) - 1] * 1000,
+    }
+
+
+def bench_size(n: int, dim: int, index_type: str, k: int, query_count: int, search_values: Sequence[int]) -> None:
+    print(f"\n=== n={n:,} dim={dim} storage={storage_for(dim)} index={index_type} k={k} ===")
+    vectors = synthetic_vectors(n, dim)
+    queries = synthetic_vectors(query_count, dim, seed=1)
+    truth = exact_neighbors(vectors, queries, k)
+
+    started = time.perf_counter()
+    table = load_table(vectors)
+    print(f"load     : {time.perf_counter() - started:8.1f} s")
+
+    try:
+        # 정확 검색 (인덱스 없음 = 순차 스캔)
+        found, latencies = run_queries(table, queries, k, exact=True)
+        stats = summarize(latencies)
+        print(f"exact    : recall@{k}={recall_at_k(truth, found, k):.3f}  p50={stats['p50_ms']:7.2f} ms  p95={stats['p95_ms']:7.2f} ms")
+
+        started = time.perf_counter()
+        with engine.begin() as conn:
+            conn.execute(text(create_index_sql(TABLE, "embedding", dim, index_type, row_count=n)))
+        print(f"build    : {time.perf_counter() - started:8.1f} s")
+
+        param = "hnsw.ef_search" if index_type == "hnsw" else "ivfflat.probes"
+        for value in search_values:
+            found, latencies = run_queries(table, queries, k, (f"SET LOCAL {param} = {int(value)}",))
+            stats = summarize(latencies)
+            print(
+                f"{param}={value:<4}: recall@{k}={recall_at_k(truth, found, k):.3f}"
+                f"  p50={stats['p50_ms']:7.2f} ms  p95={stats['p95_ms']:7.2f} ms"
+            )
+    finally:
+        table.drop(engine, checkfirst=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--dim", type=int, default=settings.EMBEDDING_DIMENSION)
+    parser.add_argument("--type", choices=("hnsw", "ivfflat"), default="hnsw")
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[40, 100, 200], help="HNSW ef_search 값들")
+    parser.add_argument("--probes", type=int, nargs="+", default=[1, 10, 40], help="IVFFlat probes 값들")
+    args = parser.parse_args()
+
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector;"))
+
+    search_values = args.ef_search if args.type == "hnsw" else args.probes
+    for n in args.sizes:
+        bench_size(n, args.dim, args.type, args.k, args.queries, search_values)
+
+
+if __name__ == "__main__":
+    main()